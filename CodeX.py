@@ -1,5 +1,4 @@
 import os
-os.system("pip install -r requirements.txt")
 import asyncio
 import traceback
 from threading import Thread
@@ -16,7 +15,6 @@ from utils.Tools import *
 from utils.config import *
 
 import jishaku
-import cogs
 
 os.environ["JISHAKU_NO_DM_TRACEBACK"] = "False"
 os.environ["JISHAKU_HIDE"] = "True"
@@ -55,9 +53,12 @@ async def on_ready():
     print(f"Connected to: {len(client.guilds)} guilds")
     print(f"Connected to: {len(client.users)} users")
     try:
-        synced = await client.tree.sync()
-        all_commands = list(client.commands)
-        print(f"Synced Total {len(all_commands)} Client Commands and {len(synced)} Slash Commands")
+        await client.load_deferred_cogs()
+        # the command tree is global, so only one cluster pushes it
+        if client.cluster.primary:
+            synced = await client.tree.sync()
+            all_commands = list(client.commands)
+            print(f"Synced Total {len(all_commands)} Client Commands and {len(synced)} Slash Commands")
     except Exception as e:
         print(e)
 
@@ -144,8 +145,6 @@ def keep_alive():
     server = Thread(target=run)
     server.start()
 
-keep_alive()
-
 async def main():
     async with client:
         os.system("clear")
@@ -153,4 +152,5 @@ async def main():
         await client.start(TOKEN)
 
 if __name__ == "__main__":
+    keep_alive()
     asyncio.run(main())
@@ -1,314 +1,158 @@
 from __future__ import annotations
 from core import axon
-from colorama import Fore, Style, init
 
 
 #----------Commands---------#
-from .commands.help import Help
-from .commands.general import General
-from .commands.music import Music
-from .commands.automod import Automod
-from .commands.welcome import Welcomer
-from .commands.fun import Fun
-from .commands.Games import Games
-from .commands.extra import Extra
-from .commands.owner import Owner
-from .commands.voice import Voice
-from .commands.afk import afk
-from .commands.ignore import Ignore
-from .commands.Media import Media
-from .commands.Invc import Invcrole
-from .commands.giveaway import Giveaway
-from .commands.Embed import Embed
-from .commands.steal import Steal
-from .commands.ship import Ship
-from .commands.timer import Timer
-from .commands.blacklist import Blacklist
-from .commands.block import Block
-from .commands.nightmode import Nightmode
-#from .commands.imagine import AiStuffCog
-from .commands.owner import Badges
-from .commands.map import Map
-from .commands.autoresponder import AutoResponder
-from .commands.customrole import Customrole
-from .commands.autorole import AutoRole
-from .commands.ticket import TicketSystem
-from .commands.logging import Logging
-from .commands.translate import TranslateCog
-from .commands.jail import Jail
-
-from .commands.antinuke import Antinuke
-from .commands.extraown import Extraowner
-from .commands.anti_wl import Whitelist
-from .commands.anti_unwl import Unwhitelist
-from .commands.slots import Slots
-from .commands.blackjack import Blackjack
-from .commands.autoreact import AutoReaction
-from .commands.stats import Stats
-from .commands.emergency import Emergency
-from .commands.notify import NotifCommands
-from .commands.status import Status
-from .commands.np import NoPrefix
-from .commands.filters import FilterCog
-from .commands.owner2 import Global
-from .commands.qr import QR
-from .commands.vanityroles import VanityRoles
-from .commands.reactionroles import ReactionRoles 
-#from .commands.InviteTracker import InviteTracker
-from .commands.messages import Messages
-from .commands.fastgreet import FastGreet
-
-#from .commands.activity import Activity
-#____________ Events _____________
-
-from .events.autoblacklist import AutoBlacklist
-from .events.Errors import Errors
-from .events.on_guild import Guild
-from .events.autorole import Autorole2
-from .events.auto import Autorole
-from .events.greet2 import greet
-from .events.mention import Mention
-from .events.react import React
-from .events.autoreact import AutoReactListener
-#from .events.topgg import TopGG
-
-########-------HELP-------########
-from .axon.antinuke import _antinuke
-from .axon.extra import _extra
-from .axon.general import _general
-from .axon.automod import _automod 
-from .axon.moderation import _moderation
-from .axon.music import _music
-from .axon.fun import _fun
-from .axon.games import _games
-from .axon.ignore import _ignore
-from .axon.server import _server
-from .axon.voice import _voice 
-from .axon.welcome import _welcome 
-from .axon.giveaway import _giveaway
-from .axon.ticket import _ticket
-#from .axon.vanityroles import Vanityroles69999
-from .axon.logging import Loggingdrop
-from .axon.vanity import _vanity
-from .axon.inviteTracker import _inviteTracker
-
-
-#########ANTINUKE#########
-
-from .antinuke.anti_member_update import AntiMemberUpdate
-from .antinuke.antiban import AntiBan
-from .antinuke.antibotadd import AntiBotAdd
-from .antinuke.antichcr import AntiChannelCreate
-from .antinuke.antichdl import AntiChannelDelete
-from .antinuke.antichup import AntiChannelUpdate
-from .antinuke.antieveryone import AntiEveryone
-from .antinuke.antiguild import AntiGuildUpdate
-from .antinuke.antiIntegration import AntiIntegration
-from .antinuke.antikick import AntiKick
-from .antinuke.antiprune import AntiPrune
-from .antinuke.antirlcr import AntiRoleCreate
-from .antinuke.antirldl import AntiRoleDelete
-from .antinuke.antirlup import AntiRoleUpdate
-from .antinuke.antiwebhook import AntiWebhookUpdate
-from .antinuke.antiwebhookcr import AntiWebhookCreate
-from .antinuke.antiwebhookdl import AntiWebhookDelete
-
-#Extra Optional Events 
-
-#from .antinuke.antiemocr import AntiEmojiCreate
-#from .antinuke.antiemodl import AntiEmojiDelete
-#from .antinuke.antiemoup import AntiEmojiUpdate
-#from .antinuke.antisticker import AntiSticker
-#from .antinuke.antiunban import AntiUnban
-
-############ AUTOMOD ############
-from .automod.antispam import AntiSpam
-from .automod.anticaps import AntiCaps
-from .automod.antilink import AntiLink
-from .automod.anti_invites import AntiInvite
-from .automod.anti_mass_mention import AntiMassMention
-from .automod.anti_emoji_spam import AntiEmojiSpam
-
-
-from .moderation.ban import Ban
-from .moderation.unban import Unban
-from .moderation.timeout import Mute
-from .moderation.unmute import Unmute
-from .moderation.lock import Lock
-from .moderation.unlock import Unlock
-from .moderation.hide import Hide
-from .moderation.unhide import Unhide
-from .moderation.kick import Kick
-from .moderation.warn import Warn
-from .moderation.role import Role
-from .moderation.message import Message
-from .moderation.moderation import Moderation
-from .moderation.topcheck import TopCheck
-from .moderation.snipe import Snipe
+# (module, cog class) in load order. Modules are only imported from setup(),
+# so importing this package is cheap and a broken cog only takes itself down.
+EAGER_COGS = [
+  ("commands.help", "Help"),
+  ("commands.general", "General"),
+  ("commands.automod", "Automod"),
+  ("commands.welcome", "Welcomer"),
+  ("commands.fun", "Fun"),
+  ("commands.extra", "Extra"),
+  ("commands.voice", "Voice"),
+  ("commands.owner", "Owner"),
+  ("commands.customrole", "Customrole"),
+  ("commands.afk", "afk"),
+  ("commands.Embed", "Embed"),
+  ("commands.Media", "Media"),
+  ("commands.ignore", "Ignore"),
+  ("commands.Invc", "Invcrole"),
+  ("commands.giveaway", "Giveaway"),
+  ("commands.steal", "Steal"),
+  ("commands.ship", "Ship"),
+  ("commands.timer", "Timer"),
+  ("commands.blacklist", "Blacklist"),
+  ("commands.block", "Block"),
+  ("commands.nightmode", "Nightmode"),
+  #("commands.imagine", "AiStuffCog"),
+  ("commands.owner", "Badges"),
+  ("commands.antinuke", "Antinuke"),
+  ("commands.anti_wl", "Whitelist"),
+  ("commands.anti_unwl", "Unwhitelist"),
+  ("commands.extraown", "Extraowner"),
+  ("commands.stats", "Stats"),
+  ("commands.emergency", "Emergency"),
+  ("commands.status", "Status"),
+  ("commands.np", "NoPrefix"),
+  ("commands.owner2", "Global"),
+  ("commands.map", "Map"),
+  ("commands.ticket", "TicketSystem"),
+  ("commands.logging", "Logging"),
+  ("commands.qr", "QR"),
+  ("commands.vanityroles", "VanityRoles"),
+  #("commands.InviteTracker", "InviteTracker"),
+  ("commands.reactionroles", "ReactionRoles"),
+  ("commands.messages", "Messages"),
+  ("commands.translate", "TranslateCog"),
+  ("commands.fastgreet", "FastGreet"),
+  ("commands.jail", "Jail"),
+  ("commands.watchdog", "Watchdog"),
+  #("commands.activity", "Activity"),
+
+  ########-------HELP-------########
+  ("axon.antinuke", "_antinuke"),
+  ("axon.extra", "_extra"),
+  ("axon.general", "_general"),
+  ("axon.automod", "_automod"),
+  ("axon.moderation", "_moderation"),
+  ("axon.music", "_music"),
+  ("axon.fun", "_fun"),
+  ("axon.games", "_games"),
+  ("axon.ignore", "_ignore"),
+  ("axon.server", "_server"),
+  ("axon.voice", "_voice"),
+  ("axon.welcome", "_welcome"),
+  ("axon.giveaway", "_giveaway"),
+  ("axon.ticket", "_ticket"),
+  #("axon.vanityroles", "Vanityroles69999"),
+  ("axon.logging", "Loggingdrop"),
+  ("axon.vanity", "_vanity"),
+  ("axon.inviteTracker", "_inviteTracker"),
+
+  #____________ Events _____________
+  ("events.autoblacklist", "AutoBlacklist"),
+  ("events.on_guild", "Guild"),
+  ("events.Errors", "Errors"),
+  ("events.autorole", "Autorole2"),
+  ("events.auto", "Autorole"),
+  ("events.greet2", "greet"),
+  ("commands.autoresponder", "AutoResponder"),
+  ("events.mention", "Mention"),
+  ("commands.autorole", "AutoRole"),
+  ("events.react", "React"),
+  ("commands.autoreact", "AutoReaction"),
+  ("events.autoreact", "AutoReactListener"),
+  ("events.message_tracker", "MessageTracker"),
+  ("commands.notify", "NotifCommands"),
+
+  #########ANTINUKE#########
+  ("antinuke.anti_member_update", "AntiMemberUpdate"),
+  ("antinuke.antiban", "AntiBan"),
+  ("antinuke.antibotadd", "AntiBotAdd"),
+  ("antinuke.antichcr", "AntiChannelCreate"),
+  ("antinuke.antichdl", "AntiChannelDelete"),
+  ("antinuke.antichup", "AntiChannelUpdate"),
+  ("antinuke.antieveryone", "AntiEveryone"),
+  ("antinuke.antiguild", "AntiGuildUpdate"),
+  ("antinuke.antiIntegration", "AntiIntegration"),
+  ("antinuke.antikick", "AntiKick"),
+  ("antinuke.antiprune", "AntiPrune"),
+  ("antinuke.antirlcr", "AntiRoleCreate"),
+  ("antinuke.antirldl", "AntiRoleDelete"),
+  ("antinuke.antirlup", "AntiRoleUpdate"),
+  ("antinuke.antiwebhook", "AntiWebhookUpdate"),
+  ("antinuke.antiwebhookcr", "AntiWebhookCreate"),
+  ("antinuke.antiwebhookdl", "AntiWebhookDelete"),
+
+  #Extra Optional Events
+  #("antinuke.antiemocr", "AntiEmojiCreate"),
+  #("antinuke.antiemodl", "AntiEmojiDelete"),
+  #("antinuke.antiemoup", "AntiEmojiUpdate"),
+  #("antinuke.antisticker", "AntiSticker"),
+  #("antinuke.antiunban", "AntiUnban"),
+
+  ############ AUTOMOD ############
+  ("automod.antispam", "AntiSpam"),
+  ("automod.anticaps", "AntiCaps"),
+  ("automod.anti_invites", "AntiInvite"),
+  ("automod.antilink", "AntiLink"),
+  ("automod.anti_mass_mention", "AntiMassMention"),
+  ("automod.anti_emoji_spam", "AntiEmojiSpam"),
+
+  ############ MODERATION ############
+  ("moderation.ban", "Ban"),
+  ("moderation.unban", "Unban"),
+  ("moderation.timeout", "Mute"),
+  ("moderation.unmute", "Unmute"),
+  ("moderation.lock", "Lock"),
+  ("moderation.unlock", "Unlock"),
+  ("moderation.hide", "Hide"),
+  ("moderation.unhide", "Unhide"),
+  ("moderation.kick", "Kick"),
+  ("moderation.warn", "Warn"),
+  ("moderation.role", "Role"),
+  ("moderation.message", "Message"),
+  ("moderation.moderation", "Moderation"),
+  ("moderation.topcheck", "TopCheck"),
+  ("moderation.snipe", "Snipe"),
+]
+
+# Heavy, rarely used cogs (Pillow/chess game engines, wavelink). They are
+# imported on the first command that no loaded cog answers, or once the bot
+# is ready and about to sync the app command tree, whichever comes first.
+LAZY_COGS = [
+  ("commands.Games", "Games"),
+  ("commands.slots", "Slots"),
+  ("commands.blackjack", "Blackjack"),
+  ("commands.music", "Music"),
+  ("commands.filters", "FilterCog"),
+]
 
 
 async def setup(bot: axon):
-  cogs_to_load = [
-        Help, General, Moderation, Automod, Welcomer, Fun, Games, Extra,
-        Voice, Owner, Customrole, afk, Embed, Media, Ignore, TicketSystem, Logging,
-        Invcrole, Steal, Ship, Timer,
-        Blacklist, Block, Nightmode, Badges, Antinuke, Whitelist, 
-        Unwhitelist, Extraowner, Map, Blackjack, Slots,
-        AutoBlacklist, Guild, Errors, Autorole2, Autorole, greet, AutoResponder,
-        Mention, AutoRole, React, AntiMemberUpdate, AntiBan, AntiBotAdd,
-        AntiChannelCreate, AntiChannelDelete, AntiChannelUpdate, AntiEveryone, AntiGuildUpdate,
-        AntiIntegration, AntiKick, AntiPrune, AntiRoleCreate, AntiRoleDelete,
-        AntiRoleUpdate, AntiWebhookUpdate, AntiWebhookCreate, 
-        AntiWebhookDelete, AntiSpam, AntiCaps, AntiLink, AntiInvite, AntiMassMention, Music, Stats, Emergency, Status, NoPrefix, FilterCog, AutoReaction, AutoReactListener, Ban, Unban, Mute, Unmute, Lock, Unlock, Hide, Unhide, Kick, Warn, Role, Message, Moderation, TopCheck, Snipe, Global, QR, VanityRoles, ReactionRoles, Messages, TranslateCog, FastGreet, Jail, #InviteTracker,
-    ]
-
-
-  await bot.add_cog(Help(bot))
-  await bot.add_cog(General(bot))
-  await bot.add_cog(Music(bot))
-  await bot.add_cog(Automod(bot))
-  await bot.add_cog(Welcomer(bot))
-  await bot.add_cog(Fun(bot))
-  await bot.add_cog(Games(bot))
-  await bot.add_cog(Extra(bot))
-  await bot.add_cog(Voice(bot))
-  await bot.add_cog(Owner(bot))
-  await bot.add_cog(Customrole(bot))
-  await bot.add_cog(afk(bot))
-  await bot.add_cog(Embed(bot))
-  await bot.add_cog(Media(bot))
-  await bot.add_cog(Ignore(bot))
-  await bot.add_cog(Invcrole(bot))
-  await bot.add_cog(Giveaway(bot))
-  await bot.add_cog(Steal(bot))
-  await bot.add_cog(Ship(bot))
-  await bot.add_cog(Timer(bot))
-  await bot.add_cog(Blacklist(bot))
-  await bot.add_cog(Block(bot))
-  await bot.add_cog(Nightmode(bot))
-  #await bot.add_cog(AiStuffCog(bot))
-  await bot.add_cog(Badges(bot))
-  await bot.add_cog(Antinuke(bot))
-  await bot.add_cog(Whitelist(bot))
-  await bot.add_cog(Unwhitelist(bot))
-  await bot.add_cog(Extraowner(bot))
-  await bot.add_cog(Slots(bot))
-  await bot.add_cog(Blackjack(bot))
-  await bot.add_cog(Stats(bot))
-  await bot.add_cog(Emergency(bot))
-  await bot.add_cog(Status(bot))
-  await bot.add_cog(NoPrefix(bot))
-  await bot.add_cog(FilterCog(bot))
-  await bot.add_cog(Global(bot))
-  await bot.add_cog(Map(bot))
-  #await bot.add_cog(Activity(bot))
-  await bot.add_cog(TicketSystem(bot))
-  await bot.add_cog(Logging(bot))
-  await bot.add_cog(QR(bot))
-  await bot.add_cog(VanityRoles(bot))
-  #await bot.add_cog(InviteTracker(bot))
-  await bot.add_cog(ReactionRoles(bot))
-  await bot.add_cog(Messages(bot))
-  await bot.add_cog(TranslateCog(bot))
-  await bot.add_cog(FastGreet(bot))
-  await bot.add_cog(Jail(bot))
-
-
-  await bot.add_cog(_antinuke(bot))
-  await bot.add_cog(_extra(bot))
-  await bot.add_cog(_general(bot))
-  await bot.add_cog(_automod(bot))  
-  await bot.add_cog(_moderation(bot))
-  await bot.add_cog(_music(bot))
-  await bot.add_cog(_fun(bot))
-  await bot.add_cog(_games(bot))
-  await bot.add_cog(_ignore(bot))
-  await bot.add_cog(_server(bot))
-  await bot.add_cog(_voice(bot))   
-  await bot.add_cog(_welcome(bot))
-  await bot.add_cog(_giveaway(bot))
-  await bot.add_cog(_ticket(bot))
-  await bot.add_cog(Loggingdrop(bot))
-  await bot.add_cog(_vanity(bot))
-  await bot.add_cog(_inviteTracker(bot))
-  
-
-
-
-
-  
-  await bot.add_cog(AutoBlacklist(bot))
-  await bot.add_cog(Guild(bot))
-  await bot.add_cog(Errors(bot))
-  await bot.add_cog(Autorole2(bot))
-  await bot.add_cog(Autorole(bot))
-  await bot.add_cog(greet(bot))
-  await bot.add_cog(AutoResponder(bot))
-  await bot.add_cog(Mention(bot))
-  await bot.add_cog(AutoRole(bot))
-  await bot.add_cog(React(bot))
-  await bot.add_cog(AutoReaction(bot))
-  await bot.add_cog(AutoReactListener(bot))
-  await bot.add_cog(NotifCommands(bot))
-
-
-  await bot.add_cog(AntiMemberUpdate(bot))
-  await bot.add_cog(AntiBan(bot))
-  await bot.add_cog(AntiBotAdd(bot))
-  await bot.add_cog(AntiChannelCreate(bot))
-  await bot.add_cog(AntiChannelDelete(bot))
-  await bot.add_cog(AntiChannelUpdate(bot))
-  await bot.add_cog(AntiEveryone(bot))
-  await bot.add_cog(AntiGuildUpdate(bot))
-  await bot.add_cog(AntiIntegration(bot))
-  await bot.add_cog(AntiKick(bot))
-  await bot.add_cog(AntiPrune(bot))
-  await bot.add_cog(AntiRoleCreate(bot))
-  await bot.add_cog(AntiRoleDelete(bot))
-  await bot.add_cog(AntiRoleUpdate(bot))
-  await bot.add_cog(AntiWebhookUpdate(bot))
-  await bot.add_cog(AntiWebhookCreate(bot))
-  await bot.add_cog(AntiWebhookDelete(bot))
-
-
-#Extra Optional Events 
-
-  #await bot.add_cog(AntiEmojiCreate(bot))
-  #await bot.add_cog(AntiEmojiDelete(bot))
-  #await bot.add_cog(AntiEmojiUpdate(bot))
-  #await bot.add_cog(AntiSticker(bot))
-  #await bot.add_cog(AntiUnban(bot))
-
-
-  await bot.add_cog(AntiSpam(bot))
-  await bot.add_cog(AntiCaps(bot))
-  await bot.add_cog(AntiInvite(bot))
-  await bot.add_cog(AntiLink(bot))
-  await bot.add_cog(AntiMassMention(bot))
-  await bot.add_cog(AntiEmojiSpam(bot))
-
-
-
-
-
-
-  await bot.add_cog(Ban(bot))
-  await bot.add_cog(Unban(bot))
-  await bot.add_cog(Mute(bot))
-  await bot.add_cog(Unmute(bot))
-  await bot.add_cog(Lock(bot))
-  await bot.add_cog(Unlock(bot))
-  await bot.add_cog(Hide(bot))
-  await bot.add_cog(Unhide(bot))
-  await bot.add_cog(Kick(bot))
-  await bot.add_cog(Warn(bot))
-  await bot.add_cog(Role(bot))
-  await bot.add_cog(Message(bot))
-  await bot.add_cog(Moderation(bot))
-  await bot.add_cog(TopCheck(bot))
-  await bot.add_cog(Snipe(bot))
-  
-
-  for cog in cogs_to_load:
-    print(Fore.BLUE + Style.BRIGHT + f"Loaded cog: {cog.__name__}")
-  print(Fore.BLUE + Style.BRIGHT + "All Axon Cogs loaded successfully.")
+  timings = await bot.load_cog_specs([(f"{__name__}.{module}", name) for module, name in EAGER_COGS])
+  bot.report_cog_timings(timings, "Axon cogs")
+  bot.defer_cogs([(f"{__name__}.{module}", name) for module, name in LAZY_COGS])
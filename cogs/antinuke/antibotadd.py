@@ -1,6 +1,6 @@
 import discord
 from discord.ext import commands
-import aiosqlite
+from core import storage
 import asyncio
 import datetime
 import pytz
@@ -49,7 +49,7 @@ class AntiBotAdd(commands.Cog):
             return
 
         guild = member.guild
-        async with aiosqlite.connect('db/anti.db') as db:
+        async with storage.connect('db/anti.db') as db:
             async with db.execute("SELECT status FROM antinuke WHERE guild_id = ?", (guild.id,)) as cursor:
                 antinuke_status = await cursor.fetchone()
 
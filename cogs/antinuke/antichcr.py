@@ -1,6 +1,6 @@
 import discord
 from discord.ext import commands
-import aiosqlite
+from core import storage
 import asyncio
 import datetime
 import pytz
@@ -75,7 +75,7 @@ class AntiChannelCreate(commands.Cog):
     async def on_guild_channel_create(self, channel):
         guild = channel.guild
 
-        async with aiosqlite.connect('db/anti.db') as db:
+        async with storage.connect('db/anti.db') as db:
             async with db.execute("SELECT status FROM antinuke WHERE guild_id = ?", (guild.id,)) as cursor:
                 antinuke_status = await cursor.fetchone()
             if not antinuke_status or not antinuke_status[0]:
@@ -1,6 +1,6 @@
 import discord
 from discord.ext import commands
-import aiosqlite
+from core import storage
 import asyncio
 import datetime
 import pytz
@@ -47,8 +47,8 @@ class AntiGuildUpdate(commands.Cog):
         return True
 
     async def is_blacklisted_guild(self, guild_id):
-        async with aiosqlite.connect('db/block.db') as block_db:
-            cursor = await block_db.execute("SELECT 1 FROM guild_blacklist WHERE guild_id = ?", (str(guild_id),))
+        async with storage.connect('db/block.db') as block_db:
+            cursor = await block_db.execute("SELECT 1 FROM guild_blacklist WHERE guild_id = ?", (guild_id,))
             return await cursor.fetchone() is not None
 
     @commands.Cog.listener()
@@ -57,7 +57,7 @@ class AntiGuildUpdate(commands.Cog):
         if await self.is_blacklisted_guild(guild.id):
             return
 
-        async with aiosqlite.connect('db/anti.db') as db:
+        async with storage.connect('db/anti.db') as db:
             async with db.execute("SELECT status FROM antinuke WHERE guild_id = ?", (guild.id,)) as cursor:
                 antinuke_status = await cursor.fetchone()
 
@@ -79,7 +79,7 @@ class AntiGuildUpdate(commands.Cog):
         if executor.id in {guild.owner_id, self.bot.user.id}:
             return
 
-        async with aiosqlite.connect('db/anti.db') as db:
+        async with storage.connect('db/anti.db') as db:
             async with db.execute("SELECT serverup FROM whitelisted_users WHERE guild_id = ? AND user_id = ?", 
                                   (guild.id, executor.id)) as cursor:
                 whitelist_status = await cursor.fetchone()
@@ -1,6 +1,6 @@
 import discord
 from discord.ext import commands
-import aiosqlite
+from core import storage
 import asyncio
 import datetime
 import pytz
@@ -12,8 +12,8 @@ class AntiKick(commands.Cog):
         self.cooldowns = {}
 
     async def is_blacklisted_guild(self, guild_id):
-        async with aiosqlite.connect('db/block.db') as block_db:
-            cursor = await block_db.execute("SELECT 1 FROM guild_blacklist WHERE guild_id = ?", (str(guild_id),))
+        async with storage.connect('db/block.db') as block_db:
+            cursor = await block_db.execute("SELECT 1 FROM guild_blacklist WHERE guild_id = ?", (guild_id,))
             return await cursor.fetchone() is not None
 
     async def fetch_audit_logs(self, guild, action, target_id):
@@ -56,7 +56,7 @@ class AntiKick(commands.Cog):
         if await self.is_blacklisted_guild(member.guild.id):
             return
 
-        async with aiosqlite.connect('db/anti.db') as db:
+        async with storage.connect('db/anti.db') as db:
             async with db.execute("SELECT status FROM antinuke WHERE guild_id = ?", (member.guild.id,)) as cursor:
                 antinuke_status = await cursor.fetchone()
             if not antinuke_status or not antinuke_status[0]:
@@ -73,7 +73,7 @@ class AntiKick(commands.Cog):
         if executor.id in {member.guild.owner_id, self.bot.user.id}:
             return
 
-        async with aiosqlite.connect('db/anti.db') as db:
+        async with storage.connect('db/anti.db') as db:
             async with db.execute("SELECT owner_id FROM extraowners WHERE guild_id = ? AND owner_id = ?", 
                                   (member.guild.id, executor.id)) as cursor:
                 extraowner_status = await cursor.fetchone()
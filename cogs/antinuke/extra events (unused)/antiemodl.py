@@ -1,6 +1,6 @@
 import discord
 from discord.ext import commands
-import aiosqlite
+from core import storage
 import asyncio
 import random
 import datetime
@@ -29,7 +29,7 @@ class AntiEmojiDelete(commands.Cog):
     @commands.Cog.listener()
     async def on_guild_emojis_update(self, guild, before, after):
         if len(after) < len(before):
-            async with aiosqlite.connect('db/anti.db') as db:
+            async with storage.connect('db/anti.db') as db:
                 async with db.execute("SELECT status FROM antinuke WHERE guild_id = ?", (guild.id,)) as cursor:
                     antinuke_status = await cursor.fetchone()
 
@@ -1,7 +1,7 @@
 import discord
 from discord.ext import commands
 from datetime import timedelta, datetime
-import aiosqlite
+from core import storage
 import asyncio
 
 class AntiSticker(commands.Cog):
@@ -34,7 +34,7 @@ class AntiSticker(commands.Cog):
         else:
             action = discord.AuditLogAction.sticker_update
 
-        async with aiosqlite.connect('db/anti.db') as db:
+        async with storage.connect('db/anti.db') as db:
             async with db.execute("SELECT status FROM antinuke WHERE guild_id = ?", (guild.id,)) as cursor:
                 antinuke_status = await cursor.fetchone()
 
@@ -1,6 +1,6 @@
 import discord
 from discord.ext import commands
-import aiosqlite
+from core import storage
 import re
 from datetime import timedelta
 import asyncio
@@ -11,35 +11,35 @@ class AntiEmojiSpam(commands.Cog):
         self.emoji_threshold = 5  
 
     async def is_automod_enabled(self, guild_id):
-        async with aiosqlite.connect("db/automod.db") as db:
+        async with storage.connect("db/automod.db") as db:
             cursor = await db.execute("SELECT enabled FROM automod WHERE guild_id = ?", (guild_id,))
             result = await cursor.fetchone()
             return result is not None and result[0] == 1
 
     async def is_anti_emoji_spam_enabled(self, guild_id):
-        async with aiosqlite.connect("db/automod.db") as db:
+        async with storage.connect("db/automod.db") as db:
             cursor = await db.execute("SELECT punishment FROM automod_punishments WHERE guild_id = ? AND event = 'Anti emoji spam'", (guild_id,))
             result = await cursor.fetchone()
             return result is not None
 
     async def get_ignored_channels(self, guild_id):
-        async with aiosqlite.connect("db/automod.db") as db:
+        async with storage.connect("db/automod.db") as db:
             cursor = await db.execute("SELECT id FROM automod_ignored WHERE guild_id = ? AND type = 'channel'", (guild_id,))
             return [row[0] for row in await cursor.fetchall()]
 
     async def get_ignored_roles(self, guild_id):
-        async with aiosqlite.connect("db/automod.db") as db:
+        async with storage.connect("db/automod.db") as db:
             cursor = await db.execute("SELECT id FROM automod_ignored WHERE guild_id = ? AND type = 'role'", (guild_id,))
             return [row[0] for row in await cursor.fetchall()]
 
     async def get_punishment(self, guild_id):
-        async with aiosqlite.connect("db/automod.db") as db:
+        async with storage.connect("db/automod.db") as db:
             cursor = await db.execute("SELECT punishment FROM automod_punishments WHERE guild_id = ? AND event = 'Anti emoji spam'", (guild_id,))
             result = await cursor.fetchone()
             return result[0] if result else None
 
     async def log_action(self, guild, user, channel, action, reason):
-        async with aiosqlite.connect("db/automod.db") as db:
+        async with storage.connect("db/automod.db") as db:
             cursor = await db.execute("SELECT log_channel FROM automod_logging WHERE guild_id = ?", (guild.id,))
             log_channel_id = await cursor.fetchone()
 
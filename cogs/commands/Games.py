@@ -15,6 +15,21 @@ class Games(Cog):
 
     def __init__(self, client: axon):
         self.client = client
+        self.sessions = games.GameSessionManager(per_guild=50, per_user=3)
+
+    @commands.Cog.listener()
+    async def on_interaction(self, interaction: discord.Interaction):
+        if interaction.message is not None:
+            self.sessions.touch(interaction.user.id, interaction.message.id)
+
+    @commands.Cog.listener()
+    async def on_reaction_add(self, reaction: discord.Reaction, user: discord.User):
+        self.sessions.touch(user.id, reaction.message.id)
+
+    @commands.Cog.listener()
+    async def on_message(self, message: discord.Message):
+        if not message.author.bot:
+            self.sessions.touch_channel(message.author.id, message.channel.id)
 
 
     @commands.hybrid_command(name="chess",
@@ -23,7 +38,6 @@ class Games(Cog):
     @blacklist_check()
     @ignore_check()
     @commands.cooldown(1, 3, commands.BucketType.user)
-    @commands.max_concurrency(5, per=commands.BucketType.default, wait=False)
     @commands.guild_only()
     async def _chess(self, ctx: Context, player: discord.Member):
         if player == ctx.author:
@@ -33,7 +47,8 @@ class Games(Cog):
             await ctx.send("You cannot play with bots!")
         else:
             game = btn.BetaChess(white=ctx.author, black=player)
-            await game.start(ctx)
+            async with self.sessions.open(ctx, "chess", game, players=(player,), timeout=600):
+                await game.start(ctx)
 
 
     @commands.hybrid_command(name="rps",
@@ -43,11 +58,11 @@ class Games(Cog):
     @blacklist_check()
     @ignore_check()
     @commands.cooldown(1, 3, commands.BucketType.user)
-    @commands.max_concurrency(5, per=commands.BucketType.default, wait=False)
     @commands.guild_only()
     async def _rps(self, ctx: Context, player: discord.Member = None):
         game = btn.BetaRockPaperScissors(player)
-        await game.start(ctx, timeout=120)
+        async with self.sessions.open(ctx, "rps", game, players=(player,), timeout=120):
+            await game.start(ctx)
 
     @commands.hybrid_command(name="tic-tac-toe",
                              help="play tic-tac-toe game with a user.",
@@ -56,7 +71,6 @@ class Games(Cog):
     @blacklist_check()
     @ignore_check()
     @commands.cooldown(1, 3, commands.BucketType.user)
-    @commands.max_concurrency(5, per=commands.BucketType.user, wait=False)
     @commands.guild_only()
     async def _ttt(self, ctx: Context, player: discord.Member):
         if player == ctx.author:
@@ -66,7 +80,8 @@ class Games(Cog):
             await ctx.send("You cannot play with bots!")
         else:
             game = btn.BetaTictactoe(cross=ctx.author, circle=player)
-            await game.start(ctx, timeout=30)
+            async with self.sessions.open(ctx, "tictactoe", game, players=(player,), timeout=30):
+                await game.start(ctx)
 
     @commands.hybrid_command(name="wordle",
                              help="Wordle Game | Play with bot.",
@@ -74,11 +89,11 @@ class Games(Cog):
     @blacklist_check()
     @ignore_check()
     @commands.cooldown(1, 3, commands.BucketType.user)
-    @commands.max_concurrency(3, per=commands.BucketType.default, wait=False)
     @commands.guild_only()
     async def _wordle(self, ctx: Context):
         game = games.Wordle()
-        await game.start(ctx, timeout=120)
+        async with self.sessions.open(ctx, "wordle", game, timeout=120):
+            await game.start(ctx)
 
     @commands.hybrid_command(name="2048",
                              help="Play 2048 game with bot.",
@@ -87,11 +102,11 @@ class Games(Cog):
     @blacklist_check()
     @ignore_check()
     @commands.cooldown(1, 3, commands.BucketType.user)
-    @commands.max_concurrency(3, per=commands.BucketType.default, wait=False)
     @commands.guild_only()
     async def _2048(self, ctx: Context):
         game = btn.BetaTwenty48()
-        await game.start(ctx, win_at=2048)
+        async with self.sessions.open(ctx, "2048", game):
+            await game.start(ctx, win_at=2048, hint_button=True)
 
     @commands.hybrid_command(name="memory-game",
                              help="How strong is your memory?",
@@ -100,11 +115,11 @@ class Games(Cog):
     @blacklist_check()
     @ignore_check()
     @commands.cooldown(1, 3, commands.BucketType.user)
-    @commands.max_concurrency(3, per=commands.BucketType.default, wait=False)
     @commands.guild_only()
     async def _memory(self, ctx: Context):
         game = btn.MemoryGame()
-        await game.start(ctx)
+        async with self.sessions.open(ctx, "memory", game):
+            await game.start(ctx)
 
     @commands.hybrid_command(name="number-slider",
                              help="slide numbers with bot",
@@ -113,11 +128,11 @@ class Games(Cog):
     @blacklist_check()
     @ignore_check()
     @commands.cooldown(1, 3, commands.BucketType.user)
-    @commands.max_concurrency(3, per=commands.BucketType.default, wait=False)
     @commands.guild_only()
     async def _number_slider(self, ctx: Context):
         game = btn.NumberSlider()
-        await game.start(ctx)
+        async with self.sessions.open(ctx, "slider", game):
+            await game.start(ctx)
 
     @commands.hybrid_command(name="battleship",
                              help="Play battleship game with your friend.",
@@ -126,11 +141,11 @@ class Games(Cog):
     @blacklist_check()
     @ignore_check()
     @commands.cooldown(1, 3, commands.BucketType.user)
-    @commands.max_concurrency(3, per=commands.BucketType.default, wait=False)
     @commands.guild_only()
     async def _battle(self, ctx: Context, player: discord.Member):
         game = btn.BetaBattleShip(player1=ctx.author, player2=player)
-        await game.start(ctx)
+        async with self.sessions.open(ctx, "battleship", game, players=(player,), timeout=600):
+            await game.start(ctx)
 
     @commands.group(name="country-guesser",
                     help="Guess name of the country by flag.",
@@ -145,7 +160,9 @@ class Games(Cog):
                               help="Starts the country guesser game. It's a 100 Seconds Game so suggested to play in a SPECIFIC CHANNEL.")
     async def _start_country_guesser(self, ctx: Context):
         game = games.CountryGuesser(is_flags=True, hints=2)
-        await game.start(ctx)
+        # a round lasts a fixed 100 seconds whatever the players do, so the game keeps its own clock
+        async with self.sessions.open(ctx, "country-guesser", game, timeout=None):
+            await game.start(ctx)
 
     """@_country_guesser.command(name="end",
                               help="Ends the country guesser game.")
@@ -159,7 +176,6 @@ class Games(Cog):
     @blacklist_check()
     @ignore_check()
     @commands.cooldown(1, 3, commands.BucketType.user)
-    @commands.max_concurrency(1, per=commands.BucketType.user, wait=False)
     @commands.guild_only()
     async def _connectfour(self, ctx: Context, player: discord.Member):
         if player == ctx.author:
@@ -167,8 +183,9 @@ class Games(Cog):
         elif player.bot:
             await ctx.send("You cannot play with bots!")
         else:
-            game = games.ConnectFour(red=ctx.author, blue=player)  
-            await game.start(ctx, timeout=300)
+            game = games.ConnectFour(red=ctx.author, blue=player)
+            async with self.sessions.open(ctx, "connectfour", game, players=(player,), timeout=300, per_user=1):
+                await game.start(ctx)
 
 
 
@@ -179,8 +196,8 @@ class Games(Cog):
     @blacklist_check()
     @ignore_check()
     @commands.cooldown(1, 3, commands.BucketType.user)
-    @commands.max_concurrency(3, per=commands.BucketType.default, wait=False)
     @commands.guild_only()
     async def _lights_show(self, ctx: Context):
         game = btn.LightsOut()
-        await game.start(ctx)
+        async with self.sessions.open(ctx, "lights-out", game):
+            await game.start(ctx)
@@ -1,17 +1,29 @@
 import discord
 from discord.ext import commands
-import aiosqlite
+from core import storage
 import asyncio
 from utils.Tools import *
 
 class Invcrole(commands.Cog):
+    # how long a member's voice changes are left to settle before their role is touched;
+    # a leave and rejoin inside this window costs no request at all
+    SETTLE = 1.0
+
     def __init__(self, bot):
         self.bot = bot
         self.db_path = 'db/invc.db'
+        self.roles = {}
+        self.loaded = asyncio.Event()
+        self.pending = {}
+        self.tasks = {}
         self.bot.loop.create_task(self.create_table())
 
+    def cog_unload(self):
+        for task in self.tasks.values():
+            task.cancel()
+
     async def create_table(self):
-        async with aiosqlite.connect(self.db_path) as db:
+        async with storage.connect(self.db_path) as db:
             await db.execute('''
                 CREATE TABLE IF NOT EXISTS vcroles (
                     guild_id INTEGER PRIMARY KEY,
@@ -19,6 +31,9 @@ class Invcrole(commands.Cog):
                 )
             ''')
             await db.commit()
+            async with db.execute('SELECT guild_id, role_id FROM vcroles') as cursor:
+                self.roles = {guild_id: role_id for guild_id, role_id in await cursor.fetchall()}
+        self.loaded.set()
 
     @commands.group(name='vcrole', help="Vcrole Setup commands", invoke_without_command=True)
     @blacklist_check()
@@ -34,7 +49,7 @@ class Invcrole(commands.Cog):
     @ignore_check()
     @commands.has_permissions(administrator=True)
     async def add(self, ctx, role: discord.Role):
-        async with aiosqlite.connect(self.db_path) as db:
+        async with storage.connect(self.db_path) as db:
             async with db.execute('SELECT role_id FROM vcroles WHERE guild_id = ?', (ctx.guild.id,)) as cursor:
                 row = await cursor.fetchone()
                 if row:
@@ -44,6 +59,7 @@ class Invcrole(commands.Cog):
                     return
             await db.execute('INSERT INTO vcroles (guild_id, role_id) VALUES (?, ?)', (ctx.guild.id, role.id))
             await db.commit()
+            self.roles[ctx.guild.id] = role.id
             embed = discord.Embed(title="<:tick:1327829594954530896> Success",
                                   description=f"VC role {role.mention} added for this guild.", color=0x000000)
             await ctx.reply(embed=embed)
@@ -53,7 +69,7 @@ class Invcrole(commands.Cog):
     @ignore_check()
     @commands.has_permissions(administrator=True)
     async def remove(self, ctx, role: discord.Role):
-        async with aiosqlite.connect(self.db_path) as db:
+        async with storage.connect(self.db_path) as db:
             async with db.execute('SELECT role_id FROM vcroles WHERE guild_id = ? AND role_id = ?', (ctx.guild.id, role.id)) as cursor:
                 row = await cursor.fetchone()
                 if not row:
@@ -63,6 +79,7 @@ class Invcrole(commands.Cog):
                     return
             await db.execute('DELETE FROM vcroles WHERE guild_id = ? AND role_id = ?', (ctx.guild.id, role.id))
             await db.commit()
+            self.roles.pop(ctx.guild.id, None)
             embed = discord.Embed(title="<:tick:1327829594954530896> Success",
                                   description=f"VC role {role.mention} removed for this guild.", color=0x000000)
             await ctx.send(embed=embed)
@@ -72,7 +89,7 @@ class Invcrole(commands.Cog):
     @ignore_check()
     @commands.has_permissions(administrator=True)
     async def config(self, ctx):
-        async with aiosqlite.connect(self.db_path) as db:
+        async with storage.connect(self.db_path) as db:
             async with db.execute('SELECT role_id FROM vcroles WHERE guild_id = ?', (ctx.guild.id,)) as cursor:
                 row = await cursor.fetchone()
                 if not row:
@@ -88,50 +105,40 @@ class Invcrole(commands.Cog):
 
     @commands.Cog.listener()
     async def on_voice_state_update(self, member, before, after):
-        try:
-            async with aiosqlite.connect(self.db_path) as db:
-                async with db.execute('SELECT role_id FROM vcroles WHERE guild_id = ?', (member.guild.id,)) as cursor:
-                    row = await cursor.fetchone()
-                    if not row:
-                        return
-                    role = member.guild.get_role(row[0])
+        # self-mute, deafen, streaming and video toggles don't change the channel
+        if before.channel == after.channel:
+            return
+        await self.loaded.wait()
+        if member.guild.id not in self.roles:
+            return
+        self.schedule(member, after.channel is not None)
 
-                    if after.channel and role not in member.roles:
-                        await self.add_role_with_retry(member, role, reason="Member Joined VC | Olympus Invcrole")
-                    elif not after.channel and role in member.roles:
-                        await self.remove_role_with_retry(member, role, reason="Member Left VC | Olympus Invcrole")
-        except discord.Forbidden:
-            print(f"Bot lacks permissions to maange role in a guild during Invc Event .")
-        except Exception as e:
-            print(f"Error in on_voice_state_update: {e}")
+    def schedule(self, member, connected):
+        key = (member.guild.id, member.id)
+        self.pending[key] = (member, connected)
+        if key not in self.tasks:
+            self.tasks[key] = self.bot.loop.create_task(self.apply(key))
 
-    async def add_role_with_retry(self, member, role, reason, retries=5):
-        attempt = 0
-        while attempt < retries:
-            try:
-                await member.add_roles(role, reason=reason)
-                break
-            except discord.errors.RateLimited as e:
-                retry_after = e.retry_after if hasattr(e, 'retry_after') else 1
-                await asyncio.sleep(retry_after)
-            except discord.HTTPException as e:
-                print(f"Error adding role: {e}")
-                break
-            attempt += 1
-
-    async def remove_role_with_retry(self, member, role, reason, retries=5):
-        attempt = 0
-        while attempt < retries:
-            try:
-                await member.remove_roles(role, reason=reason)
-                break
-            except discord.errors.RateLimited as e:
-                retry_after = e.retry_after if hasattr(e, 'retry_after') else 1
-                await asyncio.sleep(retry_after)
-            except discord.HTTPException as e:
-                print(f"Error removing role: {e}")
-                break
-            attempt += 1
+    async def apply(self, key):
+        try:
+            # only the state a member settles in is applied, however often it changed meanwhile
+            while key in self.pending:
+                await asyncio.sleep(self.SETTLE)
+                member, connected = self.pending.pop(key)
+                role = member.guild.get_role(self.roles.get(member.guild.id, 0))
+                if role is None:
+                    continue
+                try:
+                    if connected and role not in member.roles:
+                        await member.add_roles(role, reason="Member Joined VC | Olympus Invcrole")
+                    elif not connected and role in member.roles:
+                        await member.remove_roles(role, reason="Member Left VC | Olympus Invcrole")
+                except discord.Forbidden:
+                    print(f"Bot lacks permissions to maange role in a guild during Invc Event .")
+                except discord.HTTPException as e:
+                    print(f"Error updating vc role: {e}")
+        finally:
+            self.tasks.pop(key, None)
 
 
 """
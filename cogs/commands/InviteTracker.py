@@ -1,19 +1,30 @@
 import discord
-from discord.ext import commands
-import sqlite3
+from discord.ext import commands, tasks
+from core import storage
 from datetime import datetime, timezone
+from utils.invite_tracker import InviteEngine
 
 DB_FILE = "db/invite_tracker.db"
 
 class InviteTracker(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
+        self.engine = InviteEngine(bot, DB_FILE)
+        self.enabled = set()
         self.bot.loop.create_task(self.init_db())
-        self.guild_invites = {}
+        self.flush_stats.start()
+
+    async def cog_unload(self):
+        self.flush_stats.cancel()
+        await self.engine.flush()
+
+    @tasks.loop(seconds=10)
+    async def flush_stats(self):
+        await self.engine.flush()
 
     async def init_db(self):
         await self.bot.wait_until_ready()
-        with sqlite3.connect(DB_FILE) as conn:
+        with storage.connect_sync(DB_FILE) as conn:
             conn.executescript("""
             CREATE TABLE IF NOT EXISTS invites (
                 guild_id TEXT,
@@ -38,26 +49,31 @@ class InviteTracker(commands.Cog):
             );
             """)
             conn.commit()
+            for (guild_id,) in conn.execute("SELECT guild_id FROM invite_settings WHERE enabled = 1"):
+                self.enabled.add(int(guild_id))
 
         for guild in self.bot.guilds:
-            try:
-                self.guild_invites[guild.id] = await guild.invites()
-            except discord.Forbidden:
-                self.guild_invites[guild.id] = []
+            if guild.id in self.enabled:
+                await self.engine.snapshot(guild)
 
     async def is_enabled(self, guild_id):
-        with sqlite3.connect(DB_FILE) as conn:
-            cursor = conn.execute("SELECT enabled FROM invite_settings WHERE guild_id = ?", (str(guild_id),))
-            row = cursor.fetchone()
-            return bool(row[0]) if row else False
+        return guild_id in self.enabled
 
     async def set_enabled(self, guild_id, enabled: bool):
-        with sqlite3.connect(DB_FILE) as conn:
+        with storage.connect_sync(DB_FILE) as conn:
             conn.execute("""
                 INSERT INTO invite_settings (guild_id, enabled) VALUES (?, ?)
                 ON CONFLICT(guild_id) DO UPDATE SET enabled=excluded.enabled
             """, (str(guild_id), int(enabled)))
             conn.commit()
+        if enabled:
+            self.enabled.add(guild_id)
+            guild = self.bot.get_guild(guild_id)
+            if guild:
+                await self.engine.snapshot(guild)
+        else:
+            self.enabled.discard(guild_id)
+            self.engine.forget_guild(guild_id)
 
     @commands.command(name="Invite enable")
     @commands.has_permissions(administrator=True)
@@ -73,85 +89,47 @@ class InviteTracker(commands.Cog):
 
     @commands.Cog.listener()
     async def on_guild_join(self, guild):
-        try:
-            self.guild_invites[guild.id] = await guild.invites()
-        except discord.Forbidden:
-            self.guild_invites[guild.id] = []
+        if guild.id in self.enabled:
+            await self.engine.snapshot(guild)
+
+    @commands.Cog.listener()
+    async def on_guild_remove(self, guild):
+        self.engine.forget_guild(guild.id)
 
     @commands.Cog.listener()
     async def on_invite_create(self, invite):
-        invites = self.guild_invites.get(invite.guild.id, [])
-        invites.append(invite)
-        self.guild_invites[invite.guild.id] = invites
+        if invite.guild and invite.guild.id in self.enabled:
+            self.engine.invite_created(invite)
 
     @commands.Cog.listener()
     async def on_invite_delete(self, invite):
-        invites = self.guild_invites.get(invite.guild.id, [])
-        self.guild_invites[invite.guild.id] = [i for i in invites if i.code != invite.code]
+        if invite.guild and invite.guild.id in self.enabled:
+            self.engine.invite_deleted(invite)
 
     @commands.Cog.listener()
     async def on_member_join(self, member):
         if not await self.is_enabled(member.guild.id):
             return
 
-        guild = member.guild
-        before_invites = self.guild_invites.get(guild.id, [])
-        try:
-            after_invites = await guild.invites()
-        except discord.Forbidden:
-            return
-
-        self.guild_invites[guild.id] = after_invites
-        used_invite = None
-
-        for before in before_invites:
-            after = discord.utils.get(after_invites, code=before.code)
-            if after and after.uses > before.uses:
-                used_invite = after
-                break
-
-        if not used_invite:
+        code, inviter_id = await self.engine.attribute(member)
+        if inviter_id is None:
             return
 
-        inviter = used_invite.inviter
         now = datetime.now(timezone.utc)
         acc_age = now - member.created_at
-
-        with sqlite3.connect(DB_FILE) as conn:
-            conn.execute("""
-                INSERT OR IGNORE INTO invites (guild_id, inviter_id, invite_code, uses)
-                VALUES (?, ?, ?, 0)
-            """, (str(guild.id), str(inviter.id), used_invite.code))
-            conn.execute("""
-                UPDATE invites SET uses = uses + 1 WHERE guild_id = ? AND invite_code = ?
-            """, (str(guild.id), used_invite.code))
-            conn.execute("""
-                INSERT OR IGNORE INTO invite_stats (guild_id, user_id)
-                VALUES (?, ?)
-            """, (str(guild.id), str(inviter.id)))
-
-            if acc_age.total_seconds() < 86400:
-                conn.execute("""
-                    UPDATE invite_stats SET fake = fake + 1 WHERE guild_id = ? AND user_id = ?
-                """, (str(guild.id), str(inviter.id)))
-            else:
-                conn.execute("""
-                    UPDATE invite_stats SET invites = invites + 1 WHERE guild_id = ? AND user_id = ?
-                """, (str(guild.id), str(inviter.id)))
-            conn.commit()
+        self.engine.record_join(member.guild.id, code, inviter_id,
+                                fake=acc_age.total_seconds() < 86400,
+                                rejoin=member.flags.did_rejoin)
 
     @commands.Cog.listener()
     async def on_member_remove(self, member):
         if not await self.is_enabled(member.guild.id):
             return
-        with sqlite3.connect(DB_FILE) as conn:
-            conn.execute("""
-                UPDATE invite_stats SET leaves = leaves + 1 WHERE guild_id = ? AND user_id = ?
-            """, (str(member.guild.id), str(member.id)))
-            conn.commit()
+        self.engine.record_leave(member.guild.id, member.id)
 
     async def get_stats(self, guild_id, user_id):
-        with sqlite3.connect(DB_FILE) as conn:
+        await self.engine.flush()
+        with storage.connect_sync(DB_FILE) as conn:
             cursor = conn.execute("""
                 SELECT invites, fake, leaves, rejoins FROM invite_stats WHERE guild_id = ? AND user_id = ?
             """, (str(guild_id), str(user_id)))
@@ -173,7 +151,8 @@ class InviteTracker(commands.Cog):
 
     @commands.command(name="inviteleaderboard")
     async def inviteleaderboard(self, ctx):
-        with sqlite3.connect(DB_FILE) as conn:
+        await self.engine.flush()
+        with storage.connect_sync(DB_FILE) as conn:
             cursor = conn.execute("""
                 SELECT user_id, invites FROM invite_stats WHERE guild_id = ? ORDER BY invites DESC LIMIT 10
             """, (str(ctx.guild.id),))
@@ -190,7 +169,8 @@ class InviteTracker(commands.Cog):
     @commands.command(name="resetinvites")
     @commands.has_permissions(administrator=True)
     async def resetinvites(self, ctx, member: discord.Member):
-        with sqlite3.connect(DB_FILE) as conn:
+        await self.engine.flush()
+        with storage.connect_sync(DB_FILE) as conn:
             conn.execute("DELETE FROM invite_stats WHERE guild_id = ? AND user_id = ?", (str(ctx.guild.id), str(member.id)))
             conn.commit()
         await ctx.reply(f"✅ Reset invites for {member.mention}")
@@ -198,7 +178,8 @@ class InviteTracker(commands.Cog):
     @commands.command(name="addinvites")
     @commands.has_permissions(administrator=True)
     async def addinvites(self, ctx, member: discord.Member, amount: int):
-        with sqlite3.connect(DB_FILE) as conn:
+        await self.engine.flush()
+        with storage.connect_sync(DB_FILE) as conn:
             conn.execute("""
                 INSERT OR IGNORE INTO invite_stats (guild_id, user_id, invites)
                 VALUES (?, ?, 0)
@@ -212,7 +193,8 @@ class InviteTracker(commands.Cog):
     @commands.command(name="removeinvites")
     @commands.has_permissions(administrator=True)
     async def removeinvites(self, ctx, member: discord.Member, amount: int):
-        with sqlite3.connect(DB_FILE) as conn:
+        await self.engine.flush()
+        with storage.connect_sync(DB_FILE) as conn:
             conn.execute("""
                 INSERT OR IGNORE INTO invite_stats (guild_id, user_id, invites)
                 VALUES (?, ?, 0)
@@ -226,7 +208,8 @@ class InviteTracker(commands.Cog):
     @commands.command(name="resetserverinvites")
     @commands.has_permissions(administrator=True)
     async def resetserverinvites(self, ctx):
-        with sqlite3.connect(DB_FILE) as conn:
+        await self.engine.flush()
+        with storage.connect_sync(DB_FILE) as conn:
             conn.execute("DELETE FROM invite_stats WHERE guild_id = ?", (str(ctx.guild.id),))
             conn.execute("DELETE FROM invites WHERE guild_id = ?", (str(ctx.guild.id),))
             conn.commit()
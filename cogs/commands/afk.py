@@ -1,6 +1,6 @@
 import discord
 from discord.ext import commands
-import aiosqlite
+from core import storage
 import os
 import time
 from typing import Optional
@@ -48,7 +48,7 @@ class afk(commands.Cog):
 
     async def initialize_db(self):
         os.makedirs(os.path.dirname(DB_PATH), exist_ok=True)
-        async with aiosqlite.connect(DB_PATH) as db:
+        async with storage.connect(DB_PATH) as db:
             await db.execute("""
                 CREATE TABLE IF NOT EXISTS afk (
                     user_id INTEGER PRIMARY KEY,
@@ -72,7 +72,7 @@ class afk(commands.Cog):
         ctx.command.reset_cooldown(ctx)
 
     async def update_data(self, user, guild_id):
-        async with aiosqlite.connect(DB_PATH) as db:
+        async with storage.connect(DB_PATH) as db:
             await db.execute("INSERT OR IGNORE INTO afk (user_id, AFK, reason, time, mentions, dm) VALUES (?, 'False', 'None', 0, 0, 'False')", (user.id,))
             await db.execute("INSERT OR IGNORE INTO afk_guild (user_id, guild_id) VALUES (?, ?)", (user.id, guild_id))
             await db.commit()
@@ -93,7 +93,7 @@ class afk(commands.Cog):
             if message.author.bot:
                 return
 
-            async with aiosqlite.connect(DB_PATH) as db:
+            async with storage.connect(DB_PATH) as db:
                 cursor = await db.execute("SELECT AFK, time, mentions, reason FROM afk WHERE user_id = ?", (message.author.id,))
                 afk_data = await cursor.fetchone()
                 await cursor.close()
@@ -118,7 +118,7 @@ class afk(commands.Cog):
                             print(f"(AFK module) Missing permissions to send messages in channel: {message.channel.id}")
 
             if message.mentions:
-                async with aiosqlite.connect(DB_PATH) as db:
+                async with storage.connect(DB_PATH) as db:
                     for user_mention in message.mentions:
                         cursor = await db.execute("SELECT AFK, reason, time, mentions, dm FROM afk WHERE user_id = ?", (user_mention.id,))
                         afk_data = await cursor.fetchone()
@@ -180,7 +180,7 @@ class afk(commands.Cog):
         test = await ctx.reply(embed=em, view=view)
         await view.wait()
 
-        async with aiosqlite.connect(DB_PATH) as db:
+        async with storage.connect(DB_PATH) as db:
             if not view.value:
                 return await test.edit(content="Timed Out, please try again.", view=None)
             dm_status = 'True' if view.value == 'Yes' else 'False'
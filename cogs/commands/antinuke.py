@@ -1,6 +1,6 @@
 import discord
 from discord.ext import commands
-import aiosqlite
+from core import storage
 import asyncio
 from utils.Tools import *
 
@@ -11,7 +11,7 @@ class Antinuke(commands.Cog):
     self.bot.loop.create_task(self.initialize_db())
 
   async def initialize_db(self):
-    self.db = await aiosqlite.connect('db/anti.db')
+    self.db = await storage.connect('db/anti.db')
     await self.db.execute('''
         CREATE TABLE IF NOT EXISTS antinuke (
             guild_id INTEGER PRIMARY KEY,
@@ -1,6 +1,6 @@
 import discord
 from discord.ext import commands
-import aiosqlite
+from core import storage
 import re
 from utils.Tools import *
 
@@ -11,7 +11,7 @@ class AutoReaction(commands.Cog):
         self.bot.loop.create_task(self.setup_database())
 
     async def setup_database(self):
-        async with aiosqlite.connect(self.db_path) as db:
+        async with storage.connect(self.db_path) as db:
             await db.execute("""
                 CREATE TABLE IF NOT EXISTS autoreact (
                     guild_id INTEGER,
@@ -22,12 +22,12 @@ class AutoReaction(commands.Cog):
             await db.commit()
 
     async def get_triggers(self, guild_id):
-        async with aiosqlite.connect(self.db_path) as db:
+        async with storage.connect(self.db_path) as db:
             cursor = await db.execute("SELECT trigger, emojis FROM autoreact WHERE guild_id = ?", (guild_id,))
             return await cursor.fetchall()
 
     async def trigger_exists(self, guild_id, trigger):
-        async with aiosqlite.connect(self.db_path) as db:
+        async with storage.connect(self.db_path) as db:
             cursor = await db.execute("SELECT 1 FROM autoreact WHERE guild_id = ? AND trigger = ?", (guild_id, trigger))
             return await cursor.fetchone()
 
@@ -94,7 +94,7 @@ class AutoReaction(commands.Cog):
                    icon_url=ctx.author.avatar.url if ctx.author.avatar else ctx.author.default_avatar.url)
             return await ctx.reply(embed=embed)
 
-        async with aiosqlite.connect(self.db_path) as db:
+        async with storage.connect(self.db_path) as db:
             await db.execute("INSERT INTO autoreact (guild_id, trigger, emojis) VALUES (?, ?, ?)", 
                              (ctx.guild.id, trigger, " ".join(emoji_list)))
             await db.commit()
@@ -126,7 +126,7 @@ class AutoReaction(commands.Cog):
                    icon_url=ctx.author.avatar.url if ctx.author.avatar else ctx.author.default_avatar.url)
             return await ctx.reply(embed=embed)
 
-        async with aiosqlite.connect(self.db_path) as db:
+        async with storage.connect(self.db_path) as db:
             await db.execute("DELETE FROM autoreact WHERE guild_id = ? AND trigger = ?", (ctx.guild.id, trigger))
             await db.commit()
 
@@ -185,7 +185,7 @@ class AutoReaction(commands.Cog):
                    icon_url=ctx.author.avatar.url if ctx.author.avatar else ctx.author.default_avatar.url)
             return await ctx.reply(embed=embed)
 
-        async with aiosqlite.connect(self.db_path) as db:
+        async with storage.connect(self.db_path) as db:
             await db.execute("DELETE FROM autoreact WHERE guild_id = ?", (ctx.guild.id,))
             await db.commit()
 
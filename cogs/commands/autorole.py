@@ -1,6 +1,6 @@
 from __future__ import annotations
 import discord
-import aiosqlite
+from core import storage
 import logging
 from discord.ext import commands
 from typing import List, Dict
@@ -33,7 +33,7 @@ class AutoRole(commands.Cog):
         self.color = 0x000000
 
     async def create_table(self):
-        async with aiosqlite.connect(DATABASE_PATH) as db:
+        async with storage.connect(DATABASE_PATH) as db:
             await db.execute("""
             CREATE TABLE IF NOT EXISTS autorole (
                 guild_id INTEGER PRIMARY KEY,
@@ -44,7 +44,7 @@ class AutoRole(commands.Cog):
             await db.commit()
 
     async def get_autorole(self, guild_id: int) -> Dict[str, List[int]]:
-        async with aiosqlite.connect(DATABASE_PATH) as db:
+        async with storage.connect(DATABASE_PATH) as db:
             async with db.execute("SELECT bots, humans FROM autorole WHERE guild_id = ?", (guild_id,)) as cursor:
                 row = await cursor.fetchone()
                 if row:
@@ -60,7 +60,7 @@ class AutoRole(commands.Cog):
     
 
     async def update_autorole(self, guild_id: int, data: Dict[str, List[int]]):
-        async with aiosqlite.connect(DATABASE_PATH) as db:
+        async with storage.connect(DATABASE_PATH) as db:
             bots = ','.join(map(str, data['bots']))
             humans = ','.join(map(str, data['humans']))
             
@@ -129,12 +129,12 @@ class AutoRole(commands.Cog):
     @ignore_check()
     @commands.has_permissions(administrator=True)
     async def _autorole_humans_reset(self, ctx):
-        async with aiosqlite.connect(DATABASE_PATH) as db:
+        async with storage.connect(DATABASE_PATH) as db:
             async with db.execute("SELECT humans FROM autorole WHERE guild_id = ?", (ctx.guild.id,)) as cursor:
                 data = await cursor.fetchone()
 
         if data and data[0]:
-            async with aiosqlite.connect(DATABASE_PATH) as db:
+            async with storage.connect(DATABASE_PATH) as db:
                 await db.execute("UPDATE autorole SET humans = ? WHERE guild_id = ?", ('[]', ctx.guild.id))
                 await db.commit()
             embed = discord.Embed(title="<:tick:1327829594954530896> Success",
@@ -155,12 +155,12 @@ class AutoRole(commands.Cog):
     @ignore_check()
     @commands.has_permissions(administrator=True)
     async def _autorole_bots_reset(self, ctx):
-        async with aiosqlite.connect(DATABASE_PATH) as db:
+        async with storage.connect(DATABASE_PATH) as db:
             async with db.execute("SELECT bots FROM autorole WHERE guild_id = ?", (ctx.guild.id,)) as cursor:
                 data = await cursor.fetchone()
 
         if data and data[0]:
-            async with aiosqlite.connect(DATABASE_PATH) as db:
+            async with storage.connect(DATABASE_PATH) as db:
                 await db.execute("UPDATE autorole SET bots = ? WHERE guild_id = ?", ('[]', ctx.guild.id))
                 await db.commit()
             embed = discord.Embed(title="<:tick:1327829594954530896> Success",
@@ -181,12 +181,12 @@ class AutoRole(commands.Cog):
     @commands.guild_only()
     @commands.has_permissions(administrator=True)
     async def _autorole_reset_all(self, ctx):
-        async with aiosqlite.connect(DATABASE_PATH) as db:
+        async with storage.connect(DATABASE_PATH) as db:
             async with db.execute("SELECT humans, bots FROM autorole WHERE guild_id = ?", (ctx.guild.id,)) as cursor:
                 data = await cursor.fetchone()
 
         if data and (data[0] or data[1]):
-            async with aiosqlite.connect(DATABASE_PATH) as db:
+            async with storage.connect(DATABASE_PATH) as db:
                 await db.execute("UPDATE autorole SET humans = ?, bots = ? WHERE guild_id = ?", ('[]', '[]', ctx.guild.id))
                 await db.commit()
             embed = discord.Embed(title="<:tick:1327829594954530896> Success",
@@ -218,7 +218,7 @@ class AutoRole(commands.Cog):
     @commands.guild_only()
     @commands.has_permissions(administrator=True)
     async def _autorole_humans_add(self, ctx, *, role: discord.Role):
-        async with aiosqlite.connect(DATABASE_PATH) as db:
+        async with storage.connect(DATABASE_PATH) as db:
             async with db.execute("SELECT humans FROM autorole WHERE guild_id = ?", (ctx.guild.id,)) as cursor:
                 data = await cursor.fetchone()
         
@@ -234,7 +234,7 @@ class AutoRole(commands.Cog):
                                     color=self.color)
             else:
                 humans.append(role.id)
-                async with aiosqlite.connect(DATABASE_PATH) as db:
+                async with storage.connect(DATABASE_PATH) as db:
                     await db.execute("UPDATE autorole SET humans = ? WHERE guild_id = ?", (str(humans), ctx.guild.id))
                     await db.commit()
                 embed = discord.Embed(title="<:tick:1327829594954530896> Success",
@@ -242,7 +242,7 @@ class AutoRole(commands.Cog):
                                     color=self.color)
         else:
             humans = [role.id]
-            async with aiosqlite.connect(DATABASE_PATH) as db:
+            async with storage.connect(DATABASE_PATH) as db:
                 await db.execute("INSERT INTO autorole (guild_id, humans, bots) VALUES (?, ?, ?)", (ctx.guild.id, str(humans), '[]'))
                 await db.commit()
             embed = discord.Embed(title="<:tick:1327829594954530896> Success",
@@ -259,7 +259,7 @@ class AutoRole(commands.Cog):
     @commands.guild_only()
     @commands.has_permissions(administrator=True)
     async def _autorole_humans_remove(self, ctx, *, role: discord.Role):
-        async with aiosqlite.connect(DATABASE_PATH) as db:
+        async with storage.connect(DATABASE_PATH) as db:
             async with db.execute("SELECT humans FROM autorole WHERE guild_id = ?", (ctx.guild.id,)) as cursor:
                 data = await cursor.fetchone()
 
@@ -271,7 +271,7 @@ class AutoRole(commands.Cog):
                                     color=self.color)
             else:
                 humans.remove(role.id)
-                async with aiosqlite.connect(DATABASE_PATH) as db:
+                async with storage.connect(DATABASE_PATH) as db:
                     await db.execute("UPDATE autorole SET humans = ? WHERE guild_id = ?", (str(humans), ctx.guild.id))
                     await db.commit()
                 embed = discord.Embed(title="<:tick:1327829594954530896> Success",
@@ -303,7 +303,7 @@ class AutoRole(commands.Cog):
     @commands.guild_only()
     @commands.has_permissions(administrator=True)
     async def _autorole_bots_add(self, ctx, *, role: discord.Role):
-        async with aiosqlite.connect(DATABASE_PATH) as db:
+        async with storage.connect(DATABASE_PATH) as db:
             async with db.execute("SELECT bots FROM autorole WHERE guild_id = ?", (ctx.guild.id,)) as cursor:
                 data = await cursor.fetchone()
         
@@ -319,7 +319,7 @@ class AutoRole(commands.Cog):
                                     color=self.color)
             else:
                 bots.append(role.id)
-                async with aiosqlite.connect(DATABASE_PATH) as db:
+                async with storage.connect(DATABASE_PATH) as db:
                     await db.execute("UPDATE autorole SET bots = ? WHERE guild_id = ?", (str(bots), ctx.guild.id))
                     await db.commit()
                 embed = discord.Embed(title="<:tick:1327829594954530896> Success",
@@ -327,7 +327,7 @@ class AutoRole(commands.Cog):
                                     color=self.color)
         else:
             bots = [role.id]
-            async with aiosqlite.connect(DATABASE_PATH) as db:
+            async with storage.connect(DATABASE_PATH) as db:
                 await db.execute("INSERT INTO autorole (guild_id, humans, bots) VALUES (?, ?, ?)", (ctx.guild.id, '[]', str(bots)))
                 await db.commit()
             embed = discord.Embed(title="<:tick:1327829594954530896> Success",
@@ -344,7 +344,7 @@ class AutoRole(commands.Cog):
     @commands.guild_only()
     @commands.has_permissions(administrator=True)
     async def _autorole_bots_remove(self, ctx, *, role: discord.Role):
-        async with aiosqlite.connect(DATABASE_PATH) as db:
+        async with storage.connect(DATABASE_PATH) as db:
             async with db.execute("SELECT bots FROM autorole WHERE guild_id = ?", (ctx.guild.id,)) as cursor:
                 data = await cursor.fetchone()
 
@@ -356,7 +356,7 @@ class AutoRole(commands.Cog):
                                       color=self.color)
             else:
                 bots.remove(role.id)
-                async with aiosqlite.connect(DATABASE_PATH) as db:
+                async with storage.connect(DATABASE_PATH) as db:
                     await db.execute("UPDATE autorole SET bots = ? WHERE guild_id = ?", (str(bots), ctx.guild.id))
                     await db.commit()
                 embed = discord.Embed(title="<:tick:1327829594954530896> Success",
@@ -1,6 +1,6 @@
 import discord
 from discord.ext import commands
-import aiosqlite
+from core import storage
 from utils.Tools import *
 
 class EmergencyRestoreView(discord.ui.View):
@@ -35,7 +35,7 @@ class Emergency(commands.Cog):
         self.bot.loop.create_task(self.initialize_database())
 
     async def initialize_database(self):
-        async with aiosqlite.connect(self.db_path) as db:
+        async with storage.connect(self.db_path) as db:
             await db.execute("""
                 CREATE TABLE IF NOT EXISTS authorised_users (
                     guild_id INTEGER,
@@ -71,7 +71,7 @@ class Emergency(commands.Cog):
     async def is_guild_owner_or_authorised(self, ctx):
         if await self.is_guild_owner(ctx):
             return True
-        async with aiosqlite.connect(self.db_path) as db:
+        async with storage.connect(self.db_path) as db:
             async with db.execute("SELECT 1 FROM authorised_users WHERE guild_id = ? AND user_id = ?", (ctx.guild.id, ctx.author.id)) as cursor:
                 return await cursor.fetchone() is not None
 
@@ -111,7 +111,7 @@ class Emergency(commands.Cog):
         dangerous_permissions = ["administrator", "ban_members", "kick_members", "manage_channels", "manage_roles", "manage_guild"]
         roles_added = []
 
-        async with aiosqlite.connect(self.db_path) as db:
+        async with storage.connect(self.db_path) as db:
             for role in ctx.guild.roles:
                 
                 if role.managed or role.is_bot_managed():
@@ -152,7 +152,7 @@ class Emergency(commands.Cog):
             embed = discord.Embed(title="<:CrossIcon:1327829124894429235> Error", description="Only the server owner can disable emergency mode.", color=0x000000)
             return await ctx.reply(embed=embed)
 
-        async with aiosqlite.connect(self.db_path) as db:
+        async with storage.connect(self.db_path) as db:
             await db.execute("DELETE FROM emergency_roles WHERE guild_id = ?", (ctx.guild.id,))
             await db.commit()
 
@@ -184,7 +184,7 @@ class Emergency(commands.Cog):
             embed = discord.Embed(title="<:CrossIcon:1327829124894429235> Error", description="Only the server owner can add authorised users for executing emergency situation.", color=0x000000)
             return await ctx.reply(embed=embed)
 
-        async with aiosqlite.connect(self.db_path) as db:
+        async with storage.connect(self.db_path) as db:
             async with db.execute("SELECT COUNT(*) FROM authorised_users WHERE guild_id = ?", (ctx.guild.id,)) as cursor:
                 count = (await cursor.fetchone())[0]
             if count >= 5:
@@ -213,7 +213,7 @@ class Emergency(commands.Cog):
             embed = discord.Embed(title="<:icons_warning:1327829522573430864> Access Denied", description="Only the server owner can remove authorised users for emergency situation.", color=0x000000)
             return await ctx.reply(embed=embed)
 
-        async with aiosqlite.connect(self.db_path) as db:
+        async with storage.connect(self.db_path) as db:
             async with db.execute("SELECT 1 FROM authorised_users WHERE guild_id = ? AND user_id = ?", (ctx.guild.id, member.id)) as cursor:
                 if not await cursor.fetchone():
                     embed = discord.Embed(title="<:CrossIcon:1327829124894429235> Error", description="This user is not authorised.", color=0x000000)
@@ -237,7 +237,7 @@ class Emergency(commands.Cog):
             return await ctx.reply(embed=embed)
 
         
-        async with aiosqlite.connect('db/emergency.db') as db:
+        async with storage.connect('db/emergency.db') as db:
             cursor = await db.execute("SELECT user_id FROM authorised_users WHERE guild_id = ?", (ctx.guild.id,))
             authorized_users = await cursor.fetchall()
             
@@ -277,7 +277,7 @@ class Emergency(commands.Cog):
             return await ctx.reply(embed=embed)
 
 
-        async with aiosqlite.connect(self.db_path) as db:
+        async with storage.connect(self.db_path) as db:
             async with db.execute("SELECT COUNT(*) FROM emergency_roles WHERE guild_id = ?", (ctx.guild.id,)) as cursor:
                 count = (await cursor.fetchone())[0]
             if count >= 25:
@@ -306,7 +306,7 @@ class Emergency(commands.Cog):
             embed = discord.Embed(title="<:icons_warning:1327829522573430864> Access Denied", description="Only the server owner can remove roles from emergency list.", color=0x000000)
             return await ctx.reply(embed=embed)
 
-        async with aiosqlite.connect(self.db_path) as db:
+        async with storage.connect(self.db_path) as db:
             async with db.execute("SELECT 1 FROM emergency_roles WHERE guild_id = ? AND role_id = ?", (ctx.guild.id, role.id)) as cursor:
                 if not await cursor.fetchone():
                     embed = discord.Embed(title="<:CrossIcon:1327829124894429235> Error", description="This role is not in the emergency list.", color=0x000000)
@@ -330,7 +330,7 @@ class Emergency(commands.Cog):
             return await ctx.reply(embed=embed)
 
         
-        async with aiosqlite.connect('db/emergency.db') as db:
+        async with storage.connect('db/emergency.db') as db:
             cursor = await db.execute("SELECT role_id FROM emergency_roles WHERE guild_id = ?", (ctx.guild.id,))
             roles = await cursor.fetchall()
 
@@ -370,7 +370,7 @@ class Emergency(commands.Cog):
         processing_message = await ctx.send(embed=discord.Embed(title=" Processing Emergency Situation, wait for a while...", color=0x000000))
 
         antinuke_enabled = False
-        async with aiosqlite.connect('db/anti.db') as anti:
+        async with storage.connect('db/anti.db') as anti:
             async with anti.execute("SELECT status FROM antinuke WHERE guild_id = ?", (guild_id,)) as cursor:
                 antinuke_status = await cursor.fetchone()
             if antinuke_status:
@@ -381,11 +381,11 @@ class Emergency(commands.Cog):
                 
                 
 
-        async with aiosqlite.connect(self.db_path) as db:
+        async with storage.connect(self.db_path) as db:
             await db.execute("DELETE FROM restore_roles WHERE guild_id = ?", (ctx.guild.id,))
             await db.commit()
 
-        async with aiosqlite.connect(self.db_path) as db:
+        async with storage.connect(self.db_path) as db:
             cursor = await db.execute("SELECT role_id FROM emergency_roles WHERE guild_id = ?", (ctx.guild.id,))
             emergency_roles = await cursor.fetchall()
 
@@ -405,7 +405,7 @@ class Emergency(commands.Cog):
         modified_roles = []
         unchanged_roles = []
 
-        async with aiosqlite.connect(self.db_path) as db:
+        async with storage.connect(self.db_path) as db:
             for role_data in emergency_roles:
                 role = ctx.guild.get_role(role_data[0])
 
@@ -448,6 +448,8 @@ class Emergency(commands.Cog):
         else:
             error_message = "No roles had permission errors."
 
+        # role.members only reflects cached members; picking the largest role needs all of them
+        await self.bot.cache_policy.ensure_chunked(ctx.guild)
         most_mem = max(
             [role for role in ctx.guild.roles if not role.managed and role.position < bot_highest_role.position and role != ctx.guild.default_role],
             key=lambda role: len(role.members),
@@ -480,7 +482,7 @@ class Emergency(commands.Cog):
                 color=0x000000))
 
         if antinuke_enabled:
-            async with aiosqlite.connect('db/anti.db') as anti:
+            async with storage.connect('db/anti.db') as anti:
                 await anti.execute("INSERT INTO antinuke (guild_id, status) VALUES (?, 1)", (guild_id,))
                 await anti.commit()
 
@@ -502,7 +504,7 @@ class Emergency(commands.Cog):
                 description="Only the server owner can execute the emergency restore command.", 
                 color=0x000000))
 
-        async with aiosqlite.connect(self.db_path) as db:
+        async with storage.connect(self.db_path) as db:
             cursor = await db.execute("SELECT role_id, disabled_perms FROM restore_roles WHERE guild_id = ?", (ctx.guild.id,))
             restore_roles = await cursor.fetchall()
 
@@ -537,7 +539,7 @@ class Emergency(commands.Cog):
         modified_roles = []
         unchanged_roles = []
 
-        async with aiosqlite.connect(self.db_path) as db:
+        async with storage.connect(self.db_path) as db:
             for role_id, disabled_perms in restore_roles:
                 role = ctx.guild.get_role(role_id)
 
@@ -16,7 +16,7 @@ from utils.config import BotName, serverLink
 from utils import Paginator, DescriptionEmbedPaginator, FieldPagePaginator, TextPaginator
 from core import Cog, axon, Context
 from typing import Optional
-import aiosqlite 
+from core import storage
 import asyncio
 import aiohttp
 
@@ -451,6 +451,7 @@ class Extra(commands.Cog):
   @blacklist_check()
   @ignore_check()
   @commands.cooldown(1, 3, commands.BucketType.user)
+  @needs_members()
   async def roleinfo(self, ctx, role: discord.Role):
     members = role.members
     created_at = role.created_at.strftime("%Y-%m-%d %H:%M:%S")
@@ -562,6 +563,7 @@ class Extra(commands.Cog):
   @blacklist_check()
   @ignore_check()
   @commands.cooldown(1, 3, commands.BucketType.user)
+  @needs_members()
   async def list_inrole(self, ctx, role: discord.Role):
     guild = ctx.guild
     entries = [
@@ -626,6 +628,7 @@ class Extra(commands.Cog):
   @blacklist_check()
   @ignore_check()
   @commands.cooldown(1, 3, commands.BucketType.user)
+  @needs_members()
   async def list_bots(self, ctx):
     guild = ctx.guild
     people = filter(lambda member: member.bot, ctx.guild.members)
@@ -649,6 +652,7 @@ class Extra(commands.Cog):
   @blacklist_check()
   @ignore_check()
   @commands.cooldown(1, 3, commands.BucketType.user)
+  @needs_members()
   async def list_admin(self, ctx):
     mems = ([
       mem for mem in ctx.guild.members
@@ -696,6 +700,7 @@ class Extra(commands.Cog):
   @blacklist_check()
   @ignore_check()
   @commands.cooldown(1, 3, commands.BucketType.user)
+  @needs_members()
   async def list_mod(self, ctx):
     membs = ([
       mem for mem in ctx.guild.members
@@ -726,6 +731,7 @@ class Extra(commands.Cog):
   @blacklist_check()
   @ignore_check()
   @commands.cooldown(1, 3, commands.BucketType.user)
+  @needs_members()
   async def list_early(self, ctx):
     mems = ([
       memb for memb in ctx.guild.members
@@ -755,6 +761,7 @@ class Extra(commands.Cog):
   @blacklist_check()
   @ignore_check()
   @commands.cooldown(1, 3, commands.BucketType.user)
+  @needs_members()
   async def list_activedeveloper(self, ctx):
     mems = ([
       memb for memb in ctx.guild.members
@@ -782,6 +789,7 @@ class Extra(commands.Cog):
   @blacklist_check()
   @ignore_check()
   @commands.cooldown(1, 3, commands.BucketType.user)
+  @needs_members()
   async def list_cpos(self, ctx):
     mems = ([memb for memb in ctx.guild.members])
     mems = sorted(mems, key=lambda memb: memb.created_at)
@@ -803,6 +811,7 @@ class Extra(commands.Cog):
   @blacklist_check()
   @ignore_check()
   @commands.cooldown(1, 3, commands.BucketType.user)
+  @needs_members()
   async def list_joinpos(self, ctx):
     mems = ([memb for memb in ctx.guild.members])
     mems = sorted(mems, key=lambda memb: memb.joined_at)
@@ -928,7 +937,7 @@ class Extra(commands.Cog):
     
     db_latency = None
     try:
-      async with aiosqlite.connect("db/afk.db") as db:
+      async with storage.connect("db/afk.db") as db:
         start_time = time.perf_counter()
         await db.execute("SELECT 1")
         end_time = time.perf_counter()
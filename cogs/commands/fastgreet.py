@@ -1,6 +1,6 @@
 import discord
 from discord.ext import commands
-import sqlite3
+from core import storage
 import asyncio
 import os
 
@@ -13,7 +13,7 @@ class FastGreet(commands.Cog):
         self.init_db()
 
     def init_db(self):
-        with sqlite3.connect(DB_PATH) as conn:
+        with storage.connect_sync(DB_PATH) as conn:
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS greet_channels (
                     guild_id INTEGER,
@@ -25,7 +25,7 @@ class FastGreet(commands.Cog):
     @commands.command(name="fastgreet_add")
     @commands.has_permissions(administrator=True)
     async def add_greet_channel(self, ctx, channel: discord.TextChannel):
-        with sqlite3.connect(DB_PATH) as conn:
+        with storage.connect_sync(DB_PATH) as conn:
             conn.execute("""
                 INSERT OR IGNORE INTO greet_channels (guild_id, channel_id)
                 VALUES (?, ?)
@@ -35,7 +35,7 @@ class FastGreet(commands.Cog):
     @commands.command(name="fastgreet_remove")
     @commands.has_permissions(administrator=True)
     async def remove_greet_channel(self, ctx, channel: discord.TextChannel):
-        with sqlite3.connect(DB_PATH) as conn:
+        with storage.connect_sync(DB_PATH) as conn:
             conn.execute("""
                 DELETE FROM greet_channels WHERE guild_id = ? AND channel_id = ?
             """, (ctx.guild.id, channel.id))
@@ -43,7 +43,7 @@ class FastGreet(commands.Cog):
 
     @commands.command(name="fastgreet_list")
     async def list_greet_channels(self, ctx):
-        with sqlite3.connect(DB_PATH) as conn:
+        with storage.connect_sync(DB_PATH) as conn:
             cursor = conn.execute("""
                 SELECT channel_id FROM greet_channels WHERE guild_id = ?
             """, (ctx.guild.id,))
@@ -58,7 +58,7 @@ class FastGreet(commands.Cog):
 
     @commands.Cog.listener()
     async def on_member_join(self, member):
-        with sqlite3.connect(DB_PATH) as conn:
+        with storage.connect_sync(DB_PATH) as conn:
             cursor = conn.execute("""
                 SELECT channel_id FROM greet_channels WHERE guild_id = ?
             """, (member.guild.id,))
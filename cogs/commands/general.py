@@ -179,6 +179,7 @@ class General(commands.Cog):
   @blacklist_check()
   @ignore_check()
   @commands.cooldown(1, 2, commands.BucketType.user)
+  @needs_members()
   async def membercount(self, ctx: commands.Context):
         total_members = len(ctx.guild.members)
         total_humans = len([member for member in ctx.guild.members if not member.bot])
@@ -197,7 +198,9 @@ class General(commands.Cog):
                         value=f"Total Members: {total_members}\nTotal Humans: {total_humans}\n Total Bots: {total_bots}",
                         inline=False)
 
-        embed.add_field(name="__Presence Stats:__", value=f" Online: {online}\n Dnd: {dnd}\n Idle: {idle}\n Offline: {offline}", inline=False)
+        # without presence tracking every cached member reads as offline
+        if self.bot.cache_policy.tracks_presence(ctx.guild):
+            embed.add_field(name="__Presence Stats:__", value=f" Online: {online}\n Dnd: {dnd}\n Idle: {idle}\n Offline: {offline}", inline=False)
 
         await ctx.send(embed=embed)
 
@@ -1,8 +1,8 @@
 from discord.ext import commands, tasks
 import datetime, pytz, time as t
 from discord.ui import Button, Select, View
-import aiosqlite, random, typing
-import sqlite3
+import random, typing
+from core import storage
 import asyncio
 import discord, logging
 from discord.utils import get
@@ -13,24 +13,6 @@ import aiohttp
 db_folder = 'db'
 db_file = 'giveaways.db'
 db_path = os.path.join(db_folder, db_file)
-connection = sqlite3.connect(db_path)
-
-cursor = connection.cursor()
-
-cursor.execute('''CREATE TABLE IF NOT EXISTS Giveaway (
-                    guild_id INTEGER,
-                    host_id INTEGER,
-                    start_time TIMESTAMP,
-                    ends_at TIMESTAMP,
-                    prize TEXT,
-                    winners INTEGER,
-                    message_id INTEGER,
-                    channel_id INTEGER,
-                    PRIMARY KEY (guild_id, message_id)
-                )''')
-
-connection.commit()
-connection.close()
 
 def convert(time):
     pos = ["s","m","h","d"]
@@ -59,7 +41,7 @@ class Giveaway(commands.Cog):
         self.bot = bot
 
     async def cog_load(self) -> None:
-        self.connection = await aiosqlite.connect(db_path)
+        self.connection = await storage.connect(db_path)
         self.cursor = await self.connection.cursor()
         await self.check_for_ended_giveaways() 
         self.GiveawayEnd.start()
@@ -1,7 +1,6 @@
 import discord
 from discord.ext import commands
 from discord import app_commands, Interaction
-from difflib import get_close_matches
 from contextlib import suppress
 from core import Context
 from core.axon import axon
@@ -10,13 +9,13 @@ from utils.Tools import getConfig
 from itertools import chain
 import json
 from utils import help as vhelp
+from utils.command_index import CommandIndex
 from utils import Paginator, DescriptionEmbedPaginator, FieldPagePaginator, TextPaginator
 import asyncio
 from utils.config import serverLink
 from utils.Tools import *
 
 color = 0x185fe5
-client = axon()
 
 class HelpCommand(commands.HelpCommand):
 
@@ -55,8 +54,7 @@ class HelpCommand(commands.HelpCommand):
         await self.send_ignore_message(ctx, "command")
         return
 
-    cmds = (str(cmd) for cmd in self.context.bot.walk_commands())
-    matches = get_close_matches(string, cmds)
+    matches = self.cog.command_index.suggest(string)
 
     embed = discord.Embed(
         title="",
@@ -87,12 +85,14 @@ class HelpCommand(commands.HelpCommand):
 
     data = await getConfig(self.context.guild.id)
     prefix = data["prefix"]
-    filtered = await self.filter_commands(self.context.bot.walk_commands(), sort=True)
+    catalog = self.cog.catalog
+    catalog.refresh()
+    ignored = (await get_ignore_data(ctx.guild.id))["command"]
 
     embed = discord.Embed(
         description=(
           f"**<a:BlueDot:1364125472539021352> Server Prefix:** `{prefix}`\n"
-          f"**<a:BlueDot:1364125472539021352> Total Commands:** `{len(set(self.context.bot.walk_commands()))}`\n"
+          f"**<a:BlueDot:1364125472539021352> Total Commands:** `{catalog.total_commands}`\n"
           f"**<a:BlueDot:1364125472539021352> Type `{prefix}antinuke enable` To get started**\n"),
         color=0x185fe5)
 
@@ -126,7 +126,7 @@ class HelpCommand(commands.HelpCommand):
       text=f"Requested By {self.context.author} | [Support](discord.gg/codexdev)",
     )
     
-    view = vhelp.View(mapping=mapping, ctx=self.context, homeembed=embed, ui=2)
+    view = vhelp.View(catalog=catalog, ctx=self.context, homeembed=embed, ui=2, ignored=ignored)
     await ctx.reply(embed=embed, view=view)
 
   async def send_command_help(self, command):
@@ -237,6 +237,8 @@ class HelpCommand(commands.HelpCommand):
 class Help(Cog, name="help"):
 
   def __init__(self, client: axon):
+    self.catalog = vhelp.HelpCatalog(client)
+    self.command_index = CommandIndex(client)
     self._original_help_command = client.help_command
     attributes = {
       'name': "help",
@@ -4,7 +4,7 @@ from discord.ext import commands
 from core import *
 from utils.Tools import *
 from typing import Optional
-import aiosqlite
+from core import storage
 
 class Ignore(commands.Cog):
   def __init__(self, bot):
@@ -14,7 +14,7 @@ class Ignore(commands.Cog):
     bot.loop.create_task(self.initialize_db())
 
   async def initialize_db(self):
-    async with aiosqlite.connect(self.db_path) as db:
+    async with storage.connect(self.db_path) as db:
       await db.execute("CREATE TABLE IF NOT EXISTS ignored_commands (guild_id INTEGER, command_name TEXT)")
       await db.execute("CREATE TABLE IF NOT EXISTS ignored_channels (guild_id INTEGER, channel_id INTEGER)")
       await db.execute("CREATE TABLE IF NOT EXISTS ignored_users (guild_id INTEGER, user_id INTEGER)")
@@ -55,7 +55,7 @@ class Ignore(commands.Cog):
           embed = discord.Embed(title="<:CrossIcon:1327829124894429235> Error", description=f"`{command_name}` is not a valid command.", color=self.color)
           await ctx.reply(embed=embed, mention_author=False)
           return
-      async with aiosqlite.connect(self.db_path) as db:
+      async with storage.connect(self.db_path) as db:
           cursor = await db.execute("SELECT COUNT(*) FROM ignored_commands WHERE guild_id = ?", (ctx.guild.id,))
           count = await cursor.fetchone()
           if count[0] >= 25:
@@ -78,7 +78,7 @@ class Ignore(commands.Cog):
   @blacklist_check()
   async def command_remove(self, ctx: commands.Context, command_name: str):
       command_name_normalized = command_name.strip().lower()
-      async with aiosqlite.connect(self.db_path) as db:
+      async with storage.connect(self.db_path) as db:
           cursor = await db.execute("SELECT command_name FROM ignored_commands WHERE guild_id = ? AND command_name = ?", (ctx.guild.id, command_name_normalized))
           result = await cursor.fetchone()
           if not result:
@@ -95,7 +95,7 @@ class Ignore(commands.Cog):
   @ignore_check()
   @commands.has_permissions(administrator=True)
   async def command_show(self, ctx: commands.Context):
-      async with aiosqlite.connect(self.db_path) as db:
+      async with storage.connect(self.db_path) as db:
           cursor = await db.execute("SELECT command_name FROM ignored_commands WHERE guild_id = ?", (ctx.guild.id,))
           commands = await cursor.fetchall()
           if not commands:
@@ -124,7 +124,7 @@ class Ignore(commands.Cog):
   #@ignore_check()
   @commands.has_permissions(administrator=True)
   async def channel_add(self, ctx: commands.Context, channel: discord.TextChannel):
-    async with aiosqlite.connect(self.db_path) as db:
+    async with storage.connect(self.db_path) as db:
       cursor = await db.execute("SELECT COUNT(*) FROM ignored_channels WHERE guild_id = ?", (ctx.guild.id,))
       count = await cursor.fetchone()
 
@@ -150,7 +150,7 @@ class Ignore(commands.Cog):
   #@ignore_check()
   @commands.has_permissions(administrator=True)
   async def channel_remove(self, ctx: commands.Context, channel: discord.TextChannel):
-    async with aiosqlite.connect(self.db_path) as db:
+    async with storage.connect(self.db_path) as db:
       cursor = await db.execute("SELECT channel_id FROM ignored_channels WHERE guild_id = ? AND channel_id = ?", (ctx.guild.id, channel.id))
       result = await cursor.fetchone()
 
@@ -168,7 +168,7 @@ class Ignore(commands.Cog):
   @ignore_check()
   @commands.has_permissions(administrator=True)
   async def channel_show(self, ctx: commands.Context):
-    async with aiosqlite.connect(self.db_path) as db:
+    async with storage.connect(self.db_path) as db:
       cursor = await db.execute("SELECT channel_id FROM ignored_channels WHERE guild_id = ?", (ctx.guild.id,))
       channels = await cursor.fetchall()
 
@@ -198,7 +198,7 @@ class Ignore(commands.Cog):
   @blacklist_check()
 
   async def user_add(self, ctx: commands.Context, user: discord.User):
-    async with aiosqlite.connect(self.db_path) as db:
+    async with storage.connect(self.db_path) as db:
       cursor = await db.execute("SELECT COUNT(*) FROM ignored_users WHERE guild_id = ?", (ctx.guild.id,))
       count = await cursor.fetchone()
 
@@ -224,7 +224,7 @@ class Ignore(commands.Cog):
 
   @commands.has_permissions(administrator=True)
   async def user_remove(self, ctx: commands.Context, user: discord.User):
-    async with aiosqlite.connect(self.db_path) as db:
+    async with storage.connect(self.db_path) as db:
       cursor = await db.execute("SELECT user_id FROM ignored_users WHERE guild_id = ? AND user_id = ?", (ctx.guild.id, user.id))
       result = await cursor.fetchone()
 
@@ -242,7 +242,7 @@ class Ignore(commands.Cog):
   @ignore_check()
   @commands.has_permissions(administrator=True)
   async def user_show(self, ctx: commands.Context):
-    async with aiosqlite.connect(self.db_path) as db:
+    async with storage.connect(self.db_path) as db:
       cursor = await db.execute("SELECT user_id FROM ignored_users WHERE guild_id = ?", (ctx.guild.id,))
       users = await cursor.fetchall()
 
@@ -271,7 +271,7 @@ class Ignore(commands.Cog):
   
   @commands.has_permissions(administrator=True)
   async def bypass_add(self, ctx: commands.Context, user: discord.User):
-    async with aiosqlite.connect(self.db_path) as db:
+    async with storage.connect(self.db_path) as db:
       cursor = await db.execute("SELECT COUNT(*) FROM bypassed_users WHERE guild_id = ?", (ctx.guild.id,))
       count = await cursor.fetchone()
 
@@ -297,7 +297,7 @@ class Ignore(commands.Cog):
   @ignore_check()
   @commands.has_permissions(administrator=True)
   async def bypass_remove(self, ctx: commands.Context, user: discord.User):
-    async with aiosqlite.connect(self.db_path) as db:
+    async with storage.connect(self.db_path) as db:
       cursor = await db.execute("SELECT user_id FROM bypassed_users WHERE guild_id = ? AND user_id = ?", (ctx.guild.id, user.id))
       result = await cursor.fetchone()
 
@@ -315,7 +315,7 @@ class Ignore(commands.Cog):
   @ignore_check()
   @commands.has_permissions(administrator=True)
   async def bypass_show(self, ctx: commands.Context):
-    async with aiosqlite.connect(self.db_path) as db:
+    async with storage.connect(self.db_path) as db:
       cursor = await db.execute("SELECT user_id FROM bypassed_users WHERE guild_id = ?", (ctx.guild.id,))
       users = await cursor.fetchall()
 
@@ -1,6 +1,7 @@
 import discord
 from discord.ext import commands, tasks
 import sqlite3
+from core import storage
 from datetime import datetime, timedelta
 import re
 
@@ -9,7 +10,7 @@ DB_FILE = "db/jail.db"
 class Jail(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
-        self.conn = sqlite3.connect(DB_FILE)
+        self.conn = storage.connect_sync(DB_FILE)
         self.conn.execute("""
             CREATE TABLE IF NOT EXISTS jailed (
                 guild_id TEXT,
@@ -1,7 +1,8 @@
 import discord
 from discord.ext import commands
-import sqlite3
+from core import storage
 from datetime import datetime
+from utils.log_dispatcher import LogDispatcher
 
 DB_FILE = "logging.db"
 
@@ -20,10 +21,16 @@ class Logging(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
         self.db_path = DB_FILE
+        self.channel_cache = {}
+        self.dispatcher = LogDispatcher(bot)
         self.create_table()
+        self.load_channels()
+
+    async def cog_unload(self):
+        await self.dispatcher.close()
 
     def create_table(self):
-        with sqlite3.connect(self.db_path) as conn:
+        with storage.connect_sync(self.db_path) as conn:
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS log_channels (
                     guild_id INTEGER,
@@ -32,21 +39,23 @@ class Logging(commands.Cog):
                 )
             """)
 
+    def load_channels(self):
+        with storage.connect_sync(self.db_path) as conn:
+            for guild_id, log_type, channel_id in conn.execute(
+                "SELECT guild_id, log_type, channel_id FROM log_channels"
+            ):
+                self.channel_cache[(guild_id, log_type)] = channel_id
+
     def set_log_channel(self, guild_id, log_type, channel_id):
-        with sqlite3.connect(self.db_path) as conn:
+        with storage.connect_sync(self.db_path) as conn:
             conn.execute(
                 "REPLACE INTO log_channels (guild_id, log_type, channel_id) VALUES (?, ?, ?)",
                 (guild_id, log_type, channel_id)
             )
+        self.channel_cache[(guild_id, log_type)] = channel_id
 
     def get_log_channel(self, guild_id, log_type):
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.execute(
-                "SELECT channel_id FROM log_channels WHERE guild_id = ? AND log_type = ?",
-                (guild_id, log_type)
-            )
-            result = cursor.fetchone()
-            return result[0] if result else None
+        return self.channel_cache.get((guild_id, log_type))
 
     async def send_log(self, guild, log_type, embed):
         embed.timestamp = datetime.utcnow()
@@ -54,7 +63,7 @@ class Logging(commands.Cog):
         if channel_id:
             channel = guild.get_channel(channel_id)
             if channel:
-                await channel.send(embed=embed)
+                self.dispatcher.enqueue(channel, embed)
 
     @commands.command(name="loggingsetup")
     @commands.has_permissions(administrator=True)
@@ -86,9 +95,11 @@ class Logging(commands.Cog):
         guild = ctx.guild
 
         # Remove DB entries
-        with sqlite3.connect(DB_FILE) as conn:
+        with storage.connect_sync(DB_FILE) as conn:
             conn.execute("DELETE FROM log_channels WHERE guild_id = ?", (guild.id,))
             conn.commit()
+        for key in [k for k in self.channel_cache if k[0] == guild.id]:
+            self.dispatcher.forget_channel(self.channel_cache.pop(key))
 
         # Delete channels and category
         category = discord.utils.get(guild.categories, name="Axon-logging")
@@ -102,23 +113,36 @@ class Logging(commands.Cog):
     # === Events ===
 
     @commands.Cog.listener()
-    async def on_message_delete(self, message):
-        if message.guild and not message.author.bot:
+    async def on_stored_message_delete(self, record):
+        guild = self.bot.get_guild(record.guild_id)
+        if guild:
             embed = discord.Embed(title="🗑️ Message Deleted", color=discord.Color.red())
-            embed.add_field(name="User", value=message.author.mention)
-            embed.add_field(name="Channel", value=message.channel.mention)
-            embed.add_field(name="Content", value=message.content or "None", inline=False)
-            await self.send_log(message.guild, "message", embed)
+            embed.add_field(name="User", value=f"<@{record.author_id}>")
+            embed.add_field(name="Channel", value=f"<#{record.channel_id}>")
+            embed.add_field(name="Content", value=record.content[:1024] or "None", inline=False)
+            await self.send_log(guild, "message", embed)
+
+    @commands.Cog.listener()
+    async def on_stored_bulk_message_delete(self, records):
+        guild = self.bot.get_guild(records[0].guild_id)
+        if not guild:
+            return
+        lines = [f"<@{r.author_id}>: {r.content or 'None'}" for r in records]
+        embed = discord.Embed(title=f"🗑️ {len(records)} Messages Bulk Deleted", color=discord.Color.red())
+        embed.add_field(name="Channel", value=f"<#{records[0].channel_id}>")
+        embed.description = "\n".join(lines)[:4096]
+        await self.send_log(guild, "message", embed)
 
     @commands.Cog.listener()
-    async def on_message_edit(self, before, after):
-        if before.guild and not before.author.bot and before.content != after.content:
+    async def on_stored_message_edit(self, before, after):
+        guild = self.bot.get_guild(before.guild_id)
+        if guild:
             embed = discord.Embed(title="✏️ Message Edited", color=discord.Color.orange())
-            embed.add_field(name="User", value=before.author.mention)
-            embed.add_field(name="Channel", value=before.channel.mention)
-            embed.add_field(name="Before", value=before.content or "None", inline=False)
-            embed.add_field(name="After", value=after.content or "None", inline=False)
-            await self.send_log(before.guild, "message", embed)
+            embed.add_field(name="User", value=f"<@{before.author_id}>")
+            embed.add_field(name="Channel", value=f"<#{before.channel_id}>")
+            embed.add_field(name="Before", value=before.content[:1024] or "None", inline=False)
+            embed.add_field(name="After", value=after.content[:1024] or "None", inline=False)
+            await self.send_log(guild, "message", embed)
 
     @commands.Cog.listener()
     async def on_member_ban(self, guild, user):
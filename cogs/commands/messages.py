@@ -1,6 +1,6 @@
 import discord
 from discord.ext import commands
-import sqlite3
+from core import storage
 from datetime import datetime
 
 class Messages(commands.Cog):
@@ -12,29 +12,13 @@ class Messages(commands.Cog):
         if message.author.bot or not message.guild:
             return
 
-        conn = sqlite3.connect("db/messages.db")
-        c = conn.cursor()
-        c.execute("""
-            CREATE TABLE IF NOT EXISTS messages (
-                guild_id INTEGER,
-                user_id INTEGER,
-                date TEXT,
-                count INTEGER
-            )
-        """)
-
         today = datetime.utcnow().strftime("%Y-%m-%d")
-        c.execute("SELECT count FROM messages WHERE guild_id = ? AND user_id = ? AND date = ?",
-                  (message.guild.id, message.author.id, today))
-        result = c.fetchone()
-
-        if result:
-            c.execute("UPDATE messages SET count = count + 1 WHERE guild_id = ? AND user_id = ? AND date = ?",
-                      (message.guild.id, message.author.id, today))
-        else:
-            c.execute("INSERT INTO messages (guild_id, user_id, date, count) VALUES (?, ?, ?, 1)",
-                      (message.guild.id, message.author.id, today))
-
+        conn = storage.connect_sync("db/messages.db")
+        conn.execute(
+            "INSERT INTO messages (guild_id, user_id, date, count) VALUES (?, ?, ?, 1) "
+            "ON CONFLICT (guild_id, user_id, date) DO UPDATE SET count = count + 1",
+            (message.guild.id, message.author.id, today)
+        )
         conn.commit()
         conn.close()
 
@@ -43,7 +27,7 @@ class Messages(commands.Cog):
         member = member or ctx.author
         today = datetime.utcnow().strftime("%Y-%m-%d")
 
-        conn = sqlite3.connect("db/messages.db")
+        conn = storage.connect_sync("db/messages.db")
         c = conn.cursor()
         c.execute("SELECT date, count FROM messages WHERE guild_id = ? AND user_id = ?",
                   (ctx.guild.id, member.id))
@@ -1,6 +1,6 @@
 import discord
 from discord.ext import commands
-import sqlite3
+from core import storage
 from datetime import datetime
 
 class Messagespack(commands.Cog):
@@ -14,7 +14,7 @@ class Messagespack(commands.Cog):
             return await ctx.send("Amount must be greater than 0.")
         
         today = datetime.utcnow().strftime("%Y-%m-%d")
-        conn = sqlite3.connect("db/messages.db")
+        conn = storage.connect_sync("db/messages.db")
         c = conn.cursor()
 
         c.execute("SELECT count FROM messages WHERE guild_id = ? AND user_id = ? AND date = ?",
@@ -39,7 +39,7 @@ class Messagespack(commands.Cog):
             return await ctx.send("Amount must be greater than 0.")
 
         today = datetime.utcnow().strftime("%Y-%m-%d")
-        conn = sqlite3.connect("db/messages.db")
+        conn = storage.connect_sync("db/messages.db")
         c = conn.cursor()
 
         c.execute("SELECT count FROM messages WHERE guild_id = ? AND user_id = ? AND date = ?",
@@ -59,7 +59,7 @@ class Messagespack(commands.Cog):
     @commands.command(name="clearmessage", aliases=["clearmsg"])
     @commands.has_permissions(manage_messages=True)
     async def clearmessage(self, ctx, member: discord.Member):
-        conn = sqlite3.connect("db/messages.db")
+        conn = storage.connect_sync("db/messages.db")
         c = conn.cursor()
         c.execute("DELETE FROM messages WHERE guild_id = ? AND user_id = ?",
                   (ctx.guild.id, member.id))
@@ -1,6 +1,6 @@
 import discord
 from discord.ext import commands
-import aiosqlite
+from core import storage
 from utils.Tools import *
 
 class NotifCommands(commands.Cog):
@@ -10,7 +10,7 @@ class NotifCommands(commands.Cog):
         self.loop_task = self.bot.loop.create_task(self.setup_db())
 
     async def setup_db(self):
-        async with aiosqlite.connect(self.db_path) as db:
+        async with storage.connect(self.db_path) as db:
             await db.execute('''CREATE TABLE IF NOT EXISTS notifications (
                                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                                 type TEXT NOT NULL UNIQUE,
@@ -29,7 +29,7 @@ class NotifCommands(commands.Cog):
     @ignore_check()
     @commands.has_permissions(administrator=True)
     async def twitch(self, ctx, role: discord.Role, channel: discord.TextChannel):
-        async with aiosqlite.connect(self.db_path) as db:
+        async with storage.connect(self.db_path) as db:
             async with db.execute('SELECT * FROM notifications WHERE type = ?', ('twitch',)) as existing:
                 row = await existing.fetchone()
                 if row:
@@ -38,6 +38,7 @@ class NotifCommands(commands.Cog):
 
             await db.execute('INSERT INTO notifications (type, role_id, channel_id) VALUES (?, ?, ?)', ('twitch', role.id, channel.id))
             await db.commit()
+            await self.bot.cache_policy.enable(ctx.guild, "notify")
             await ctx.reply(embed=discord.Embed(title="<:tick:1327829594954530896> Success", description=f"Twitch notifications set for {role.mention} in {channel.mention}.", color=0x000000))
 
     @setnotif.command()
@@ -45,7 +46,7 @@ class NotifCommands(commands.Cog):
     @ignore_check()
     @commands.has_permissions(administrator=True)
     async def youtube(self, ctx, role: discord.Role, channel: discord.TextChannel):
-        async with aiosqlite.connect(self.db_path) as db:
+        async with storage.connect(self.db_path) as db:
             async with db.execute('SELECT * FROM notifications WHERE type = ?', ('youtube',)) as existing:
                 row = await existing.fetchone()
                 if row:
@@ -54,11 +55,12 @@ class NotifCommands(commands.Cog):
 
             await db.execute('INSERT INTO notifications (type, role_id, channel_id) VALUES (?, ?, ?)', ('youtube', role.id, channel.id))
             await db.commit()
+            await self.bot.cache_policy.enable(ctx.guild, "notify")
             await ctx.reply(embed=discord.Embed(title="<:tick:1327829594954530896> Success", description=f"YouTube notifications set for {role.mention} in {channel.mention}.", color=0x000000))
 
     @setnotif.command()
     async def list(self, ctx):
-        async with aiosqlite.connect(self.db_path) as db:
+        async with storage.connect(self.db_path) as db:
             async with db.execute('SELECT * FROM notifications') as cursor:
                 rows = await cursor.fetchall()
                 if not rows:
@@ -79,12 +81,23 @@ class NotifCommands(commands.Cog):
 
     @setnotif.command()
     async def reset(self, ctx):
-        async with aiosqlite.connect(self.db_path) as db:
+        async with storage.connect(self.db_path) as db:
             await db.execute('DELETE FROM notifications WHERE type IN (?, ?)', ('twitch', 'youtube'))
             await db.commit()
+            await self.bot.cache_policy.disable(ctx.guild, "notify")
             await ctx.send(embed=discord.Embed(title="<:tick:1327829594954530896> Success", description="Twitch and YouTube notifications have been reset.", color=0x00FF00))
 
 
+    @commands.Cog.listener()
+    async def on_ready(self):
+        # the table isn't keyed by guild; the guild is whichever one owns the role
+        async with storage.connect(self.db_path) as db:
+            async with db.execute('SELECT role_id FROM notifications') as cursor:
+                role_ids = {row[0] for row in await cursor.fetchall()}
+        for guild in self.bot.guilds:
+            if any(guild.get_role(role_id) for role_id in role_ids):
+                await self.bot.cache_policy.enable(guild, "notify")
+
     @commands.Cog.listener()
     async def on_presence_update(self, before, after):
         
@@ -93,7 +106,7 @@ class NotifCommands(commands.Cog):
         if streaming:
             stream_type = "twitch" if "twitch" in streaming.url.lower() else "youtube" if "youtube" in streaming.url.lower() else None
             if stream_type:
-                async with aiosqlite.connect(self.db_path) as db:
+                async with storage.connect(self.db_path) as db:
                     async with db.execute('SELECT role_id, channel_id FROM notifications WHERE type = ?', (stream_type,)) as cursor:
                         row = await cursor.fetchone()
                         if row:
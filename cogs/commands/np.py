@@ -1,7 +1,7 @@
 from discord.ext import commands, tasks
 from discord import *
 import discord
-import aiosqlite
+from core import storage
 from typing import Optional
 from datetime import datetime, timedelta
 from discord.ui import View, Button, Select
@@ -68,7 +68,7 @@ class TimeSelect(Select):
         else:
             expiry_str = None
 
-        async with aiosqlite.connect(self.db_path) as db:
+        async with storage.connect(self.db_path) as db:
             await db.execute("INSERT INTO np (id, expiry_time) VALUES (?, ?)", (self.user.id, expiry_str))
             await db.commit()
 
@@ -123,7 +123,7 @@ class NoPrefix(commands.Cog):
         self.expiry_check.start()
 
     async def setup_database(self):
-        async with aiosqlite.connect(self.db_path) as db:
+        async with storage.connect(self.db_path) as db:
             
             await db.execute('''
                 CREATE TABLE IF NOT EXISTS np (
@@ -159,13 +159,13 @@ class NoPrefix(commands.Cog):
 
     async def load_staff(self):
         await self.client.wait_until_ready()
-        async with aiosqlite.connect(self.db_path) as db:
+        async with storage.connect(self.db_path) as db:
             async with db.execute('SELECT id FROM staff') as cursor:
                 self.staff = {row[0] for row in await cursor.fetchall()}
 
     @tasks.loop(minutes=10)
     async def expiry_check(self):
-        async with aiosqlite.connect(self.db_path) as db:
+        async with storage.connect(self.db_path) as db:
             now = datetime.utcnow().isoformat()
             async with db.execute("SELECT id FROM np WHERE expiry_time IS NOT NULL AND expiry_time <= ?", (now,)) as cursor:
                 expired_users = [row[0] for row in await cursor.fetchall()]
@@ -236,7 +236,7 @@ class NoPrefix(commands.Cog):
     @_np.command(name="list", help="List of no-prefix users")
     @commands.check(is_owner_or_staff)
     async def np_list(self, ctx):
-        async with aiosqlite.connect(self.db_path) as db:
+        async with storage.connect(self.db_path) as db:
             async with db.execute("SELECT id FROM np") as cursor:
                 ids = [row[0] for row in await cursor.fetchall()]
                 if not ids:
@@ -260,7 +260,7 @@ class NoPrefix(commands.Cog):
     @_np.command(name="add", help="Add user to no-prefix with time options")
     @commands.check(is_owner_or_staff)
     async def np_add(self, ctx, user: discord.User):
-        async with aiosqlite.connect(self.db_path) as db:
+        async with storage.connect(self.db_path) as db:
             async with db.execute("SELECT id FROM np WHERE id = ?", (user.id,)) as cursor:
                 result = await cursor.fetchone()
             if result:
@@ -277,7 +277,7 @@ class NoPrefix(commands.Cog):
     @_np.command(name="remove", help="Remove user from no-prefix")
     @commands.check(is_owner_or_staff)
     async def np_remove(self, ctx, user: discord.User):
-        async with aiosqlite.connect('db/np.db') as db:
+        async with storage.connect('db/np.db') as db:
             async with db.execute("SELECT id FROM np WHERE id = ?", (user.id,)) as cursor:
                 result = await cursor.fetchone()
             if not result:
@@ -335,7 +335,7 @@ class NoPrefix(commands.Cog):
     @_np.command(name="status", help="Check if a user is in the No Prefix list and show details.")
     @commands.check(is_owner_or_staff)
     async def np_status(self, ctx, user: discord.User):
-        async with aiosqlite.connect('db/np.db') as db:
+        async with storage.connect('db/np.db') as db:
             async with db.execute("SELECT id, expiry_time FROM np WHERE id = ?", (user.id,)) as cursor:
                 result = await cursor.fetchone()
 
@@ -387,7 +387,7 @@ class NoPrefix(commands.Cog):
 
     @autonp_guild.command(name="add", help="Add a guild to auto no-prefix.")
     async def add_guild(self, ctx, guild_id: int):
-        async with aiosqlite.connect(self.db_path) as db:
+        async with storage.connect(self.db_path) as db:
             async with db.execute("SELECT 1 FROM autonp WHERE guild_id = ?", (guild_id,)) as cursor:
                 if await cursor.fetchone():
                     await ctx.reply("Guild is already added.")
@@ -398,7 +398,7 @@ class NoPrefix(commands.Cog):
 
     @autonp_guild.command(name="remove", help="Remove a guild from auto no-prefix.")
     async def remove_guild(self, ctx, guild_id: int):
-        async with aiosqlite.connect(self.db_path) as db:
+        async with storage.connect(self.db_path) as db:
             async with db.execute("SELECT 1 FROM autonp WHERE guild_id = ?", (guild_id,)) as cursor:
                 if not await cursor.fetchone():
                     await ctx.reply("Guild is not in auto no-prefix.")
@@ -410,7 +410,7 @@ class NoPrefix(commands.Cog):
     @autonp_guild.command(name="list", help="List all guilds with auto no-prefix.")
     @commands.check(is_owner_or_staff)
     async def list_guilds(self, ctx):
-        async with aiosqlite.connect(self.db_path) as db:
+        async with storage.connect(self.db_path) as db:
             async with db.execute("SELECT guild_id FROM autonp") as cursor:
                 guilds = [row[0] for row in await cursor.fetchall()]
                 if not guilds:
@@ -420,7 +420,7 @@ class NoPrefix(commands.Cog):
 
 
     async def is_user_in_np(self, user_id):
-        async with aiosqlite.connect(self.db_path) as db:
+        async with storage.connect(self.db_path) as db:
             async with db.execute("SELECT 1 FROM np WHERE id = ?", (user_id,)) as cursor:
                 return await cursor.fetchone() is not None
             
@@ -430,7 +430,7 @@ class NoPrefix(commands.Cog):
     @commands.Cog.listener()
     async def on_member_update(self, before, after):
         if before.premium_since is None and after.premium_since is not None:
-            async with aiosqlite.connect(self.db_path) as db:
+            async with storage.connect(self.db_path) as db:
                 async with db.execute("SELECT 1 FROM autonp WHERE guild_id = ?", (after.guild.id,)) as cursor:
                     if not await cursor.fetchone():
                         return
@@ -453,7 +453,7 @@ class NoPrefix(commands.Cog):
         #await self.handle_boost_removal(member)
 
     async def handle_boost_removal(self, user):
-        async with aiosqlite.connect(self.db_path) as db:
+        async with storage.connect(self.db_path) as db:
             async with db.execute("SELECT 1 FROM autonp WHERE guild_id = ?", (user.guild.id,)) as cursor:
                 if not await cursor.fetchone():
                     return
@@ -471,7 +471,7 @@ class NoPrefix(commands.Cog):
 
     async def add_np(self, user, duration):
         expiry_time = datetime.utcnow() + duration
-        async with aiosqlite.connect(self.db_path) as db:
+        async with storage.connect(self.db_path) as db:
             await db.execute("INSERT INTO np (id, expiry_time) VALUES (?, ?)", (user.id, expiry_time.isoformat()))
             await db.commit()
             
@@ -499,7 +499,7 @@ class NoPrefix(commands.Cog):
 
 
     async def remove_np(self, user):
-        async with aiosqlite.connect(self.db_path) as db:
+        async with storage.connect(self.db_path) as db:
             async with db.execute("SELECT expiry_time FROM np WHERE id = ?", (user.id,)) as cursor:
                 row = await cursor.fetchone()
                 if row is None or row[0] is None:
@@ -553,7 +553,7 @@ class NoPrefix(commands.Cog):
                 return await interaction.response.send_message("This interaction is not for you.", ephemeral=True)
             
             # Remove all users from no-prefix list
-            async with aiosqlite.connect(self.db_path) as db:
+            async with storage.connect(self.db_path) as db:
                 # Get count of users before deletion
                 async with db.execute("SELECT COUNT(*) FROM np") as cursor:
                     count = (await cursor.fetchone())[0]
@@ -567,6 +567,7 @@ class NoPrefix(commands.Cog):
             if guild:
                 role = guild.get_role(1295883122902302771)
                 if role:
+                    await self.client.cache_policy.ensure_chunked(guild)
                     members_with_role = [member for member in guild.members if role in member.roles]
                     for member in members_with_role:
                         try:
@@ -6,14 +6,14 @@ import discord
 import json
 import datetime
 import asyncio
-import aiosqlite
+from core import storage
 from typing import Optional
 from utils import Paginator, DescriptionEmbedPaginator, FieldPagePaginator, TextPaginator
 from utils.Tools import *
 from utils.config import OWNER_IDS
 from core import Cog, axon, Context
-import sqlite3
 import os
+import psutil
 import requests
 from io import BytesIO
 from utils.config import OWNER_IDS
@@ -53,24 +53,17 @@ db_path = os.path.join(db_folder, db_file)
 FONT_PATH = os.path.join('utils', 'arial.ttf')
 
 
-conn = sqlite3.connect(db_path)
-c = conn.cursor()
+_conn = None
 
-
-c.execute('''CREATE TABLE IF NOT EXISTS badges (
-    user_id INTEGER PRIMARY KEY,
-    owner INTEGER DEFAULT 0,
-    staff INTEGER DEFAULT 0,
-    partner INTEGER DEFAULT 0,
-    sponsor INTEGER DEFAULT 0,
-    friend INTEGER DEFAULT 0,
-    early INTEGER DEFAULT 0,
-    vip INTEGER DEFAULT 0,
-    bug INTEGER DEFAULT 0
-)''')
-conn.commit()
+def badges_cursor():
+    # opened on first use; the table itself is created by core.migrations at startup
+    global _conn
+    if _conn is None:
+        _conn = storage.connect_sync(db_path)
+    return _conn.cursor()
 
 def add_badge(user_id, badge):
+    c = badges_cursor()
     c.execute(f"SELECT {badge} FROM badges WHERE user_id = ?", (user_id,))
     result = c.fetchone()
     if result is None:
@@ -79,15 +72,16 @@ def add_badge(user_id, badge):
         c.execute(f"UPDATE badges SET {badge} = 1 WHERE user_id = ?", (user_id,))
     else:
         return False
-    conn.commit()
+    c.connection.commit()
     return True
 
 def remove_badge(user_id, badge):
+    c = badges_cursor()
     c.execute(f"SELECT {badge} FROM badges WHERE user_id = ?", (user_id,))
     result = c.fetchone()
     if result and result[0] == 1:
         c.execute(f"UPDATE badges SET {badge} = 0 WHERE user_id = ?", (user_id,))
-        conn.commit()
+        c.connection.commit()
         return True
     return False
 
@@ -158,13 +152,16 @@ class Owner(commands.Cog):
         self.np_cache = []
         self.db_path = 'db/np.db'
         self.stop_tour = False
+        # globalunban runs started on this cluster, by the invoking message id
+        self.global_unbans = {}
         self.bot_owner_ids = [767979794411028491,]
         self.client.loop.create_task(self.setup_database())
         self.client.loop.create_task(self.load_staff())
-        
+        self.client.cluster.handle("guild_list", self.cluster_guild_list)
+        self.client.cluster.handle("cache_report", self.cluster_cache_report)
 
     async def setup_database(self):
-        async with aiosqlite.connect(self.db_path) as db:
+        async with storage.connect(self.db_path) as db:
             await db.execute('''
                 CREATE TABLE IF NOT EXISTS staff (
                     id INTEGER PRIMARY KEY
@@ -176,10 +173,71 @@ class Owner(commands.Cog):
 
     async def load_staff(self):
         await self.client.wait_until_ready()
-        async with aiosqlite.connect(self.db_path) as db:
+        async with storage.connect(self.db_path) as db:
             async with db.execute('SELECT id FROM staff') as cursor:
                 self.staff = {row[0] for row in await cursor.fetchall()}
 
+    @commands.Cog.listener()
+    async def on_cluster_staff_changed(self, _):
+        await self.load_staff()
+
+    async def cluster_guild_list(self, _):
+        return [[g.id, g.name, g.member_count or 0] for g in self.client.guilds]
+
+    async def cluster_cache_report(self, _):
+        report = await self.client.cache_policy.report()
+        report["cluster"] = self.client.cluster.id
+        report["rss"] = psutil.Process().memory_info().rss
+        return report
+
+    async def run_globalunban(self, job_id, origin, user_id):
+        """Unban ``user_id`` in this cluster's guilds and report to the cluster that started the job."""
+        success, errors = [], []
+        user = discord.Object(id=user_id)
+        for guild in self.client.guilds:
+            # unbanning someone who isn't banned is a NotFound, so no fetch_ban is needed first
+            try:
+                await guild.unban(user, reason="Global Unban")
+                success.append(guild.name)
+            except discord.NotFound:
+                continue
+            except discord.HTTPException:
+                errors.append(guild.name)
+        result = {"job": job_id, "cluster": self.client.cluster.id, "success": success, "errors": errors}
+        if origin == self.client.cluster.id:
+            await self.on_cluster_globalunban_done(result)
+        else:
+            await self.client.cluster.publish("globalunban_done", result)
+
+    @commands.Cog.listener()
+    async def on_cluster_globalunban(self, data):
+        await self.run_globalunban(data["job"], data["origin"], data["user"])
+
+    @commands.Cog.listener()
+    async def on_cluster_globalunban_done(self, result):
+        job = self.global_unbans.get(result["job"])
+        if job is None:
+            return
+        job["success"].extend(result["success"])
+        job["errors"].extend(result["errors"])
+        job["reported"].add(result["cluster"])
+        ctx, user = job["ctx"], job["user"]
+        if len(job["reported"]) < self.client.cluster.info.count:
+            try:
+                await job["message"].edit(content=f"Unbanning {user.mention} everywhere... {len(job['reported'])}/{self.client.cluster.info.count} clusters done.")
+            except discord.HTTPException:
+                pass
+            return
+        del self.global_unbans[result["job"]]
+
+        success_guilds, error_guilds = job["success"], job["errors"]
+        user_mention = f"{user.mention} (**{user.name}**)"
+
+        success_message = f"Successfully unbanned {user_mention} from the following guild(s):\n{',     '.join(success_guilds)}" if success_guilds else "No guilds where the user was successfully unbanned."
+        error_message = f"Failed to unban {user_mention} from the following guild(s):\n{',    '.join(error_guilds)}" if error_guilds else "No errors during unbanning."
+
+        await ctx.reply(f"{success_message}\n{error_message}", mention_author=False)
+
     @commands.command(name="staff_add", aliases=["staffadd", "addstaff"], help="Adds a user to the staff list.")
     @commands.is_owner()
     async def staff_add(self, ctx, user: discord.User):
@@ -188,9 +246,10 @@ class Owner(commands.Cog):
             await ctx.reply(embed=sonu, mention_author=False)
         else:
             self.staff.add(user.id)
-            async with aiosqlite.connect(self.db_path) as db:
+            async with storage.connect(self.db_path) as db:
                 await db.execute('INSERT OR IGNORE INTO staff (id) VALUES (?)', (user.id,))
                 await db.commit()
+            await self.client.cluster.publish("staff_changed")
             sonu2 = discord.Embed(title="<:tick:1327829594954530896> Success", description=f"Added {user} to the staff list.", color=0x000000)
             await ctx.reply(embed=sonu2, mention_author=False)
 
@@ -202,10 +261,11 @@ class Owner(commands.Cog):
             await ctx.reply(embed=sonu, mention_author=False)
         else:
             self.staff.remove(user.id)
-            async with aiosqlite.connect(self.db_path) as db:
+            async with storage.connect(self.db_path) as db:
                 await db.execute('DELETE FROM staff WHERE id = ?', (user.id,))
                 await db.commit()
                 sonu2 = discord.Embed(title="<:tick:1327829594954530896> Success", description=f"Removed {user} from the staff list.", color=0x000000)
+            await self.client.cluster.publish("staff_changed")
             await ctx.reply(embed=sonu2, mention_author=False)
 
     @commands.command(name="staff_list", aliases=["stafflist", "liststaff", "staffs"], help="Lists all staff members.")
@@ -225,21 +285,59 @@ class Owner(commands.Cog):
     @commands.command(name="slist")
     @commands.check(is_owner_or_staff)
     async def _slist(self, ctx):
-        servers = sorted(self.client.guilds, key=lambda g: g.member_count, reverse=True)
+        servers = [g for cluster in await self.client.cluster.query("guild_list") for g in cluster]
+        servers.sort(key=lambda g: g[2], reverse=True)
         entries = [
-            f"`#{i}` | [{g.name}](https://discord.com/guilds/{g.id}) - {g.member_count}"
-            for i, g in enumerate(servers, start=1)
+            f"`#{i}` | [{name}](https://discord.com/guilds/{guild_id}) - {member_count}"
+            for i, (guild_id, name, member_count) in enumerate(servers, start=1)
         ]
         paginator = Paginator(source=DescriptionEmbedPaginator(
             entries=entries,
             description="",
-            title=f"Guild List of Axon X [{len(self.client.guilds)}]",
+            title=f"Guild List of Axon X [{len(servers)}]",
             color=0x000000,
             per_page=10),
             ctx=ctx)
         await paginator.paginate()
 
 
+    @commands.command(name="cachestats", aliases=["memreport"], help="Shows the member and presence cache per guild.")
+    @commands.is_owner()
+    async def cachestats(self, ctx, guild_id: Optional[int] = None):
+        reports = sorted(await self.client.cluster.query("cache_report", timeout=30), key=lambda r: r["cluster"])
+        guilds = [g for report in reports for g in report["guilds"]]
+        if guild_id is not None:
+            guilds = [g for g in guilds if g["id"] == guild_id]
+            if not guilds:
+                return await ctx.send("That guild isn't on any cluster.")
+
+        embed = discord.Embed(title="Member Cache", color=0x000000)
+        embed.description = "\n".join(
+            f"**Cluster {report['cluster']}:** RSS {report['rss'] / 1024 ** 2:,.0f} MB | "
+            f"{len(report['guilds'])} guilds | "
+            f"{sum(g['members'] for g in report['guilds']):,} members cached | "
+            f"{sum(g['presences'] for g in report['guilds']):,} presences | "
+            f"~{sum(g['bytes'] for g in report['guilds']) / 1024 ** 2:,.1f} MB | "
+            f"{report['presence_guilds']} tracking presences"
+            for report in reports
+        )
+        await ctx.send(embed=embed)
+
+        guilds.sort(key=lambda g: g["bytes"], reverse=True)
+        entries = [
+            f"`#{i}` | {g['name']} ({g['id']}) - {g['members']:,}/{g['member_count']:,} cached"
+            f"{' (chunked)' if g['chunked'] else ''}, {g['presences']:,} presences, ~{g['bytes'] / 1024:,.0f} KB"
+            for i, g in enumerate(guilds, start=1)
+        ]
+        paginator = Paginator(source=DescriptionEmbedPaginator(
+            entries=entries,
+            description="",
+            title=f"Member Cache per Guild [{len(guilds)}]",
+            color=0x000000,
+            per_page=10),
+            ctx=ctx)
+        await paginator.paginate()
+
     @commands.command(name="mutuals", aliases=["mutual"])
     @commands.is_owner()
     async def mutuals(self, ctx, user: discord.User):
@@ -297,7 +395,8 @@ class Owner(commands.Cog):
     @commands.is_owner()
     async def _restart(self, ctx: Context):
         await ctx.reply("Restarting Quantum...")
-        restart_program()
+        if not await self.client.cluster.restart_all():
+            restart_program()
 
     @commands.command(name="sync", help="Syncs all database.")
     @commands.is_owner()
@@ -447,26 +546,15 @@ class Owner(commands.Cog):
     @commands.command(name="globalunban")
     @commands.is_owner()
     async def globalunban(self, ctx: Context, user: discord.User):
-        success_guilds = []
-        error_guilds = []
-
-        for guild in self.client.guilds:
-            bans = await guild.bans()
-            if any(ban_entry.user.id == user.id for ban_entry in bans):
-                try:
-                    await guild.unban(user, reason="Global Unban")
-                    success_guilds.append(guild.name)
-                except discord.HTTPException:
-                    error_guilds.append(guild.name)
-                except discord.Forbidden:
-                    error_guilds.append(guild.name)
-
-        user_mention = f"{user.mention} (**{user.name}**)"
-
-        success_message = f"Successfully unbanned {user_mention} from the following guild(s):\n{',     '.join(success_guilds)}" if success_guilds else "No guilds where the user was successfully unbanned."
-        error_message = f"Failed to unban {user_mention} from the following guild(s):\n{',    '.join(error_guilds)}" if error_guilds else "No errors during unbanning."
-
-        await ctx.reply(f"{success_message}\n{error_message}", mention_author=False)
+        # one request per guild can take far longer than any query timeout, so every cluster
+        # runs it as a background job and reports back here once it is done
+        message = await ctx.reply(f"Unbanning {user.mention} everywhere... 0/{self.client.cluster.info.count} clusters done.", mention_author=False)
+        self.global_unbans[ctx.message.id] = {
+            "ctx": ctx, "user": user, "message": message,
+            "success": [], "errors": [], "reported": set(),
+        }
+        await self.client.cluster.publish("globalunban", {"job": ctx.message.id, "origin": self.client.cluster.id, "user": user.id})
+        self.client.loop.create_task(self.run_globalunban(ctx.message.id, self.client.cluster.id, user.id))
 
     @commands.command(name="guildban")
     @commands.is_owner()
@@ -568,6 +656,8 @@ class Owner(commands.Cog):
             return
 
         self.stop_tour = False
+        # globalunban runs started on this cluster, by the invoking message id
+        self.global_unbans = {}
 
         class StopButton(discord.ui.View):
             def __init__(self, outer_self):
@@ -726,7 +816,7 @@ class Badges(commands.Cog):
         member = member or ctx.author
         user_id = member.id
 
-        
+        c = badges_cursor()
         c.execute("SELECT * FROM badges WHERE user_id = ?", (user_id,))
         badges = c.fetchone()
 
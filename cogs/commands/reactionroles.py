@@ -2,16 +2,19 @@ import discord
 from discord.ext import commands
 from discord.ext.commands import Context
 from discord import app_commands
-import sqlite3
+from core import storage
 
 class ReactionRoles(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
         self.db = "rr.db"
+        self.index = {}
+        self.dm_settings = {}
         self._create_table()
+        self._load_index()
 
     def _create_table(self):
-        with sqlite3.connect(self.db) as conn:
+        with storage.connect_sync(self.db) as conn:
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS reaction_roles (
                     guild_id INTEGER,
@@ -27,31 +30,45 @@ class ReactionRoles(commands.Cog):
                 )
             """)
 
+    def _load_index(self):
+        with storage.connect_sync(self.db) as conn:
+            for guild_id, message_id, emoji, role_id in conn.execute(
+                "SELECT guild_id, message_id, emoji, role_id FROM reaction_roles"
+            ):
+                self.index.setdefault((guild_id, message_id), {}).setdefault(emoji, role_id)
+            for guild_id, dm_enabled in conn.execute("SELECT guild_id, dm_enabled FROM rr_settings"):
+                self.dm_settings[guild_id] = dm_enabled == 1
+
     def add_reaction_role(self, guild_id, message_id, emoji, role_id):
-        with sqlite3.connect(self.db) as conn:
+        with storage.connect_sync(self.db) as conn:
             conn.execute(
                 "INSERT INTO reaction_roles (guild_id, message_id, emoji, role_id) VALUES (?, ?, ?, ?)",
                 (guild_id, message_id, emoji, role_id)
             )
+        self.index.setdefault((guild_id, message_id), {}).setdefault(emoji, role_id)
 
-    def get_role_by_emoji(self, guild_id, message_id, emoji):
-        with sqlite3.connect(self.db) as conn:
-            cur = conn.execute(
-                "SELECT role_id FROM reaction_roles WHERE guild_id = ? AND message_id = ? AND emoji = ?",
-                (guild_id, message_id, emoji)
+    def remove_message(self, guild_id, message_id):
+        if self.index.pop((guild_id, message_id), None) is None:
+            return
+        with storage.connect_sync(self.db) as conn:
+            conn.execute(
+                "DELETE FROM reaction_roles WHERE guild_id = ? AND message_id = ?",
+                (guild_id, message_id)
             )
-            result = cur.fetchone()
-            return result[0] if result else None
+
+    def get_role_by_emoji(self, guild_id, message_id, emoji):
+        emojis = self.index.get((guild_id, message_id))
+        if emojis is None:
+            return None
+        return emojis.get(emoji)
 
     def get_dm_setting(self, guild_id):
-        with sqlite3.connect(self.db) as conn:
-            cur = conn.execute("SELECT dm_enabled FROM rr_settings WHERE guild_id = ?", (guild_id,))
-            row = cur.fetchone()
-            return row[0] == 1 if row else True
+        return self.dm_settings.get(guild_id, True)
 
     def set_dm_setting(self, guild_id, value):
-        with sqlite3.connect(self.db) as conn:
+        with storage.connect_sync(self.db) as conn:
             conn.execute("REPLACE INTO rr_settings (guild_id, dm_enabled) VALUES (?, ?)", (guild_id, value))
+        self.dm_settings[guild_id] = value == 1
 
     @commands.hybrid_command(name="createrr", help="Create a reaction role.", usage="createrr <channel> <message_id> <emoji> <role>")
     @commands.has_permissions(manage_roles=True)
@@ -79,7 +96,9 @@ class ReactionRoles(commands.Cog):
 
     @commands.Cog.listener()
     async def on_raw_reaction_add(self, payload):
-        if payload.guild_id is None or payload.member.bot:
+        if payload.guild_id is None or (payload.guild_id, payload.message_id) not in self.index:
+            return
+        if payload.member is None or payload.member.bot:
             return
 
         role_id = self.get_role_by_emoji(payload.guild_id, payload.message_id, str(payload.emoji))
@@ -92,13 +111,11 @@ class ReactionRoles(commands.Cog):
                 await member.add_roles(role, reason="Reaction role added")
 
                 # Remove reaction
-                channel = guild.get_channel(payload.channel_id)
-                if channel:
-                    try:
-                        message = await channel.fetch_message(payload.message_id)
-                        await message.remove_reaction(payload.emoji, member)
-                    except discord.NotFound:
-                        pass
+                message = self.bot.get_partial_messageable(payload.channel_id).get_partial_message(payload.message_id)
+                try:
+                    await message.remove_reaction(payload.emoji, member)
+                except (discord.NotFound, discord.Forbidden):
+                    pass
 
                 # DM if enabled
                 if self.get_dm_setting(payload.guild_id):
@@ -109,7 +126,7 @@ class ReactionRoles(commands.Cog):
 
     @commands.Cog.listener()
     async def on_raw_reaction_remove(self, payload):
-        if payload.guild_id is None:
+        if payload.guild_id is None or (payload.guild_id, payload.message_id) not in self.index:
             return
 
         role_id = self.get_role_by_emoji(payload.guild_id, payload.message_id, str(payload.emoji))
@@ -120,6 +137,17 @@ class ReactionRoles(commands.Cog):
             if role and member:
                 await member.remove_roles(role, reason="Reaction role removed")
 
+    @commands.Cog.listener()
+    async def on_raw_message_delete(self, payload):
+        if payload.guild_id is not None:
+            self.remove_message(payload.guild_id, payload.message_id)
+
+    @commands.Cog.listener()
+    async def on_raw_bulk_message_delete(self, payload):
+        if payload.guild_id is not None:
+            for message_id in payload.message_ids:
+                self.remove_message(payload.guild_id, message_id)
+
 # Setup
 async def setup(bot):
     await bot.add_cog(ReactionRoles(bot))
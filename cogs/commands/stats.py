@@ -3,14 +3,15 @@ import psutil
 import sys
 import os
 import time
-import aiosqlite
+from core import storage
 import platform
-import pkg_resources
 import datetime
+import asyncio
 from discord import Embed, ButtonStyle
 from discord.ui import Button, View
 from discord.ext import commands
 from utils.Tools import *
+from utils.stats_cache import StatsCache
 import wavelink
 
 class Stats(commands.Cog):
@@ -18,11 +19,21 @@ class Stats(commands.Cog):
         self.bot = bot
         self.start_time = time.time()
         self.total_songs_played = 0
+        self.cache = StatsCache()
         self.bot.loop.create_task(self.setup_database())
+        self.bot.loop.create_task(self.load_static_stats())
+        self.bot.cluster.handle("stats", self.cluster_stats)
+
+    async def cluster_stats(self, _):
+        snapshot = self.cache.snapshot()
+        snapshot["voice"] = sum(1 for vc in self.bot.voice_clients if vc)
+        snapshot["playing"] = sum(1 for vc in self.bot.voice_clients if vc.playing)
+        snapshot["songs"] = self.total_songs_played
+        return snapshot
 
     async def setup_database(self):
         os.makedirs("db", exist_ok=True)
-        async with aiosqlite.connect("db/stats.db") as db:
+        async with storage.connect("db/stats.db") as db:
             await db.execute("CREATE TABLE IF NOT EXISTS stats (key TEXT PRIMARY KEY, value INTEGER)")
             await db.commit()
             async with db.execute("SELECT value FROM stats WHERE key = 'total_songs_played'") as cursor:
@@ -33,42 +44,51 @@ class Stats(commands.Cog):
                 await db.commit()
 
     async def update_total_songs_played(self):
-        async with aiosqlite.connect("db/stats.db") as db:
-            await db.execute("INSERT OR REPLACE INTO stats (key, value) VALUES ('total_songs_played', ?)", (self.total_songs_played,))
+        # incremented in place: every cluster counts into the same row
+        async with storage.connect("db/stats.db") as db:
+            await db.execute(
+                "INSERT INTO stats (key, value) VALUES ('total_songs_played', 1) "
+                "ON CONFLICT (key) DO UPDATE SET value = value + 1"
+            )
             await db.commit()
+            async with db.execute("SELECT value FROM stats WHERE key = 'total_songs_played'") as cursor:
+                row = await cursor.fetchone()
+                self.total_songs_played = row[0] if row else self.total_songs_played
 
     @commands.Cog.listener()
     async def on_wavelink_track_start(self, payload: wavelink.TrackStartEventPayload):
-        self.total_songs_played += 1
         await self.update_total_songs_played()
 
-    def count_code_stats(self, file_path):
-        total_lines = 0
-        total_words = 0
-        try:
-            with open(file_path, 'r', encoding='utf-8') as file:
-                for line in file:
-                    stripped_line = line.strip()
-                    if stripped_line and not stripped_line.startswith(('〇')):
-                        total_lines += 1
-                        total_words += len(stripped_line.split())
-        except (UnicodeDecodeError, IOError):
-            pass
-        return total_lines, total_words
-
-    def gather_file_stats(self, directory):
-        total_files = 0
-        total_lines = 0
-        total_words = 0
-        for root, _, files in os.walk(directory):
-            for file in files:
-                file_path = os.path.join(root, file)
-                if file.endswith('.py') and '.local' not in root:
-                    total_files += 1
-                    file_lines, file_words = self.count_code_stats(file_path)
-                    total_lines += file_lines
-                    total_words += file_words
-        return total_files, total_lines, total_words
+    async def load_static_stats(self):
+        await asyncio.to_thread(self.cache.load_static, '.')
+
+    @commands.Cog.listener()
+    async def on_ready(self):
+        self.cache.rebuild(self.bot.guilds)
+
+    @commands.Cog.listener()
+    async def on_guild_join(self, guild):
+        self.cache.add_guild(guild)
+
+    @commands.Cog.listener()
+    async def on_guild_remove(self, guild):
+        self.cache.remove_guild(guild)
+
+    @commands.Cog.listener()
+    async def on_member_join(self, member):
+        self.cache.member_delta(member.guild.id, 1)
+
+    @commands.Cog.listener()
+    async def on_raw_member_remove(self, payload):
+        self.cache.member_delta(payload.guild_id, -1)
+
+    @commands.Cog.listener()
+    async def on_guild_channel_create(self, channel):
+        self.cache.channel_delta(channel, 1)
+
+    @commands.Cog.listener()
+    async def on_guild_channel_delete(self, channel):
+        self.cache.channel_delta(channel, -1)
 
     @commands.hybrid_command(name="stats", aliases=["botinfo", "botstats", "bi", "statistics"], help="Shows the bot's information.")
     @blacklist_check()
@@ -76,35 +96,36 @@ class Stats(commands.Cog):
     @commands.cooldown(1, 7, commands.BucketType.user)
     async def stats(self, ctx):
         processing_message = await ctx.send("<a:Loading:1328740531907461233> Loading Axon X information...")
-        guild_count = len(self.bot.guilds)
-        user_count = sum(g.member_count for g in self.bot.guilds if g.member_count is not None)
-        bot_count = sum(sum(1 for m in g.members if m.bot) for g in self.bot.guilds)
-        human_count = user_count - bot_count
-        channel_count = len(set(self.bot.get_all_channels()))
-        blahh = human_count + bot_count
-        text_channel_count = len([c for c in self.bot.get_all_channels() if isinstance(c, discord.TextChannel)])
-        voice_channel_count = len([c for c in self.bot.get_all_channels() if isinstance(c, discord.VoiceChannel)])
-        category_channel_count = len([c for c in self.bot.get_all_channels() if isinstance(c, discord.CategoryChannel)])
+        cache = self.cache
+        # one snapshot per cluster; a single process answers for itself
+        snapshots = await self.bot.cluster.query("stats")
+        guild_count = sum(s["guilds"] for s in snapshots)
+        blahh = sum(s["members"] for s in snapshots)
+        text_channel_count = sum(s["channels"]["text"] for s in snapshots)
+        voice_channel_count = sum(s["channels"]["voice"] for s in snapshots)
+        category_channel_count = sum(s["channels"]["category"] for s in snapshots)
+        channel_count = sum(sum(s["channels"].values()) for s in snapshots)
         slash_commands = len([cmd for cmd in self.bot.tree.get_commands()])
         commands_count = len(set(self.bot.walk_commands()))
         uptime_seconds = int(round(time.time() - self.start_time))
         uptime_timedelta = datetime.timedelta(seconds=uptime_seconds)
         uptime = f"{uptime_timedelta.days} days, {uptime_timedelta.seconds // 3600} hours, {(uptime_timedelta.seconds // 60) % 60} minutes, {uptime_timedelta.seconds % 60} seconds"
-        total_files, total_lines, total_words = self.gather_file_stats('.')
+        total_files, total_lines, total_words = cache.code
         cpu_info = psutil.cpu_freq()
         memory_info = psutil.virtual_memory()
-        total_libraries = sum(1 for _ in pkg_resources.working_set)
-        channels_connected = sum(1 for vc in self.bot.voice_clients if vc)
-        playing_tracks = sum(1 for vc in self.bot.voice_clients if vc.playing)
+        total_libraries = cache.libraries
+        channels_connected = sum(s["voice"] for s in snapshots)
+        playing_tracks = sum(s["playing"] for s in snapshots)
+        songs_played = max((s["songs"] for s in snapshots), default=self.total_songs_played)
 
         embed = Embed(title="Quantum Statistics: General", color=0x000000)
         embed.add_field(name=" Channels", value=f"Total: **{channel_count}**\nText: **{text_channel_count}**   |   Voice: **{voice_channel_count}**   |   Category: **{category_channel_count}**", inline=False)
         embed.add_field(name="<:icon_ping:1327829337461882913> Uptime", value=f"{uptime}", inline=False)
-        embed.add_field(name="<:user:1329379728603353108> User Count", value=f"Humans: **{human_count}**   |   Bots: **{bot_count}**", inline=False)
+        embed.add_field(name="<:user:1329379728603353108> User Count", value=f"Total: **{blahh}**", inline=False)
         embed.add_field(name="<:file:1327842123906547713> Commands", value=f"Total: **{commands_count}**   |   Slash: **{slash_commands}**", inline=False)
         embed.add_field(name="<:icons_channel:1327829380935843941> Libraries Used", value=f"Discord Library: **[discord.py](https://discordpy.readthedocs.io/en/stable/)**\nTotal Libraries: **{total_libraries}**", inline=False)
         embed.add_field(name="<:icons_discordbotdev:1327829391178338304> Codebase Stats", value=f"Total Python Files: **{total_files}**\nTotal Lines: **{total_lines}**\nTotal Words: **{total_words}**", inline=False)
-        embed.add_field(name="<:icons_music:1327829459729911900> Music Stats", value=f"Currently Connected: **{channels_connected}**\nCurrently Playing: **{playing_tracks}**\nTotal Songs Played: **{self.total_songs_played}**", inline=False)
+        embed.add_field(name="<:icons_music:1327829459729911900> Music Stats", value=f"Currently Connected: **{channels_connected}**\nCurrently Playing: **{playing_tracks}**\nTotal Songs Played: **{songs_played}**", inline=False)
         embed.set_footer(text="Powered by Quantum X Development™", icon_url=self.bot.user.display_avatar.url)
 
         view = View()
@@ -135,7 +156,7 @@ class Stats(commands.Cog):
                 sh = self.bot.get_shard(s_id)
                 db_latency = None
                 try:
-                    async with aiosqlite.connect("db/afk.db") as db:
+                    async with storage.connect("db/afk.db") as db:
                         start_time = time.perf_counter()
                         await db.execute("SELECT 1")
                         end_time = time.perf_counter()
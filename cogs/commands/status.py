@@ -26,10 +26,13 @@ class Status(commands.Cog):
         }
 
         member = None
-        for guild in self.bot.guilds:
-            member = guild.get_member(user.id)
-            if member:
-                break
+        if ctx.guild is not None:
+            member = await self.bot.cache_policy.fetch_presence(ctx.guild, user.id)
+        if member is None:
+            for guild in self.bot.guilds:
+                member = guild.get_member(user.id)
+                if member:
+                    break
 
         if member:
             status = status_emoji.get(str(member.status), "<:offline:1329382356804440107> Offline")
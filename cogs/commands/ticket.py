@@ -1,71 +1,136 @@
 import discord
 from discord.ext import commands
 from discord.ui import View, Button, Select
-import sqlite3
+from core import storage
 import os
-import asyncio
-from typing import Optional, Tuple
+from typing import Dict, Optional, Set, Tuple
+
+from utils.transcript import TranscriptWriter
 
 class TicketSystem(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
         self.db_path = "db/ticket.db"
         os.makedirs("db", exist_ok=True)
-        self.setup_db()
-        
+        self.configs: Dict[int, Tuple[int, int, int]] = {}
+        self.tickets: Dict[int, Tuple[int, int]] = {}
+        self.owners: Set[Tuple[int, int]] = set()
+        self.closing: Set[int] = set()
+        self.transcripts = TranscriptWriter()
+
     async def cog_load(self):
+        await self.setup_db()
         self.bot.add_view(TicketButtonView())
         self.bot.add_view(TicketManageView(None))
 
-    def setup_db(self):
-        conn = sqlite3.connect(self.db_path)
-        c = conn.cursor()
-        c.execute("""
-        CREATE TABLE IF NOT EXISTS guild_config (
-            guild_id INTEGER PRIMARY KEY,
-            category_id INTEGER,
-            log_channel_id INTEGER,
-            staff_role_id INTEGER
-        )""")
-        c.execute("""
-        CREATE TABLE IF NOT EXISTS active_tickets (
-            channel_id INTEGER PRIMARY KEY,
-            user_id INTEGER,
-            guild_id INTEGER
-        )""")
-        conn.commit()
-        conn.close()
+    async def setup_db(self):
+        async with storage.connect(self.db_path) as db:
+            await db.execute("""
+            CREATE TABLE IF NOT EXISTS guild_config (
+                guild_id INTEGER PRIMARY KEY,
+                category_id INTEGER,
+                log_channel_id INTEGER,
+                staff_role_id INTEGER
+            )""")
+            await db.execute("""
+            CREATE TABLE IF NOT EXISTS active_tickets (
+                channel_id INTEGER PRIMARY KEY,
+                user_id INTEGER,
+                guild_id INTEGER
+            )""")
+            await db.commit()
+            async with db.execute("SELECT guild_id, category_id, log_channel_id, staff_role_id FROM guild_config") as cursor:
+                async for guild_id, *config in cursor:
+                    self.configs[guild_id] = tuple(config)
+            async with db.execute("SELECT channel_id, user_id, guild_id FROM active_tickets") as cursor:
+                async for channel_id, user_id, guild_id in cursor:
+                    self.tickets[channel_id] = (user_id, guild_id)
+                    self.owners.add((user_id, guild_id))
 
     def get_config(self, guild_id: int) -> Optional[Tuple[int, int, int]]:
-        conn = sqlite3.connect(self.db_path)
-        c = conn.cursor()
-        c.execute("SELECT category_id, log_channel_id, staff_role_id FROM guild_config WHERE guild_id = ?", (guild_id,))
-        result = c.fetchone()
-        conn.close()
-        return result
-
-    def add_active_ticket(self, channel_id: int, user_id: int, guild_id: int) -> None:
-        conn = sqlite3.connect(self.db_path)
-        c = conn.cursor()
-        c.execute("INSERT INTO active_tickets (channel_id, user_id, guild_id) VALUES (?, ?, ?)",
-                 (channel_id, user_id, guild_id))
-        conn.commit()
-        conn.close()
-
-    def remove_active_ticket(self, channel_id: int) -> None:
-        conn = sqlite3.connect(self.db_path)
-        c = conn.cursor()
-        c.execute("DELETE FROM active_tickets WHERE channel_id = ?", (channel_id,))
-        conn.commit()
-        conn.close()
+        return self.configs.get(guild_id)
+
+    async def set_config(self, guild_id: int, category_id: int, log_channel_id: int, staff_role_id: int) -> None:
+        async with storage.connect(self.db_path) as db:
+            await db.execute("""
+                INSERT OR REPLACE INTO guild_config
+                (guild_id, category_id, log_channel_id, staff_role_id)
+                VALUES (?, ?, ?, ?)
+            """, (guild_id, category_id, log_channel_id, staff_role_id))
+            await db.commit()
+        self.configs[guild_id] = (category_id, log_channel_id, staff_role_id)
+
+    async def add_active_ticket(self, channel_id: int, user_id: int, guild_id: int) -> None:
+        self.tickets[channel_id] = (user_id, guild_id)
+        self.owners.add((user_id, guild_id))
+        async with storage.connect(self.db_path) as db:
+            await db.execute("INSERT OR REPLACE INTO active_tickets (channel_id, user_id, guild_id) VALUES (?, ?, ?)",
+                             (channel_id, user_id, guild_id))
+            await db.commit()
+
+    async def remove_active_ticket(self, channel_id: int) -> None:
+        ticket = self.tickets.pop(channel_id, None)
+        if ticket is None:
+            return
+        if ticket not in self.tickets.values():
+            self.owners.discard(ticket)
+        async with storage.connect(self.db_path) as db:
+            await db.execute("DELETE FROM active_tickets WHERE channel_id = ?", (channel_id,))
+            await db.commit()
 
     def has_active_ticket(self, user_id: int, guild_id: int) -> bool:
-        conn = sqlite3.connect(self.db_path)
-        c = conn.cursor()
-        c.execute("SELECT channel_id FROM active_tickets WHERE user_id = ? AND guild_id = ?", (user_id, guild_id))
-        result = c.fetchone()
-        conn.close()
-        return bool(result)
+        return (user_id, guild_id) in self.owners
+
+    def ticket_owner(self, channel_id: int) -> Optional[int]:
+        ticket = self.tickets.get(channel_id)
+        return ticket[0] if ticket else None
+
+    async def close_ticket(self, channel: discord.TextChannel, closed_by: discord.Member) -> None:
+        """Save a transcript of ``channel`` to the log channel, then delete it."""
+        if channel.id in self.closing:
+            return
+        self.closing.add(channel.id)
+        try:
+            config = self.get_config(channel.guild.id)
+            log_channel = channel.guild.get_channel(config[1]) if config else None
+            owner_id = self.ticket_owner(channel.id)
+
+            path = None
+            if log_channel:
+                try:
+                    path = await self.transcripts.write(channel, max_bytes=channel.guild.filesize_limit)
+                except discord.HTTPException:
+                    path = None
+
+                log_embed = discord.Embed(
+                    title="Ticket Closed",
+                    color=0xfcd005,
+                    timestamp=discord.utils.utcnow()
+                )
+                log_embed.add_field(name="Closed by", value=closed_by.mention)
+                log_embed.add_field(name="Channel", value=f"`{channel.name}`")
+                if owner_id:
+                    log_embed.add_field(name="Opened by", value=f"<@{owner_id}>")
+                try:
+                    if path:
+                        await log_channel.send(embed=log_embed, file=discord.File(path, f"transcript-{channel.name}.html"))
+                    else:
+                        await log_channel.send(embed=log_embed)
+                except discord.HTTPException:
+                    pass
+                finally:
+                    if path:
+                        os.remove(path)
+
+            await self.remove_active_ticket(channel.id)
+            await channel.delete(reason=f"Ticket closed by {closed_by}")
+        finally:
+            self.closing.discard(channel.id)
+
+    @commands.Cog.listener()
+    async def on_guild_channel_delete(self, channel):
+        if channel.id in self.tickets and channel.id not in self.closing:
+            await self.remove_active_ticket(channel.id)
 
     @commands.hybrid_command()
     @commands.has_permissions(administrator=True)
@@ -75,19 +140,10 @@ class TicketSystem(commands.Cog):
                        staff_role: discord.Role):
         """Set up ticket system configuration"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            c = conn.cursor()
-            c.execute("""
-                INSERT OR REPLACE INTO guild_config 
-                (guild_id, category_id, log_channel_id, staff_role_id) 
-                VALUES (?, ?, ?, ?)
-            """, (ctx.guild.id, category.id, log_channel.id, staff_role.id))
-            conn.commit()
+            await self.set_config(ctx.guild.id, category.id, log_channel.id, staff_role.id)
             await ctx.send("✅ Ticket configuration saved for this server.", ephemeral=True)
         except Exception as e:
             await ctx.send(f"❌ Error saving configuration: {e}", ephemeral=True)
-        finally:
-            conn.close()
 
     @commands.hybrid_command()
     async def ticketconfig(self, ctx):
@@ -194,7 +250,7 @@ class ReasonSelectView(View):
             await ticket_channel.delete()
             return await interaction.response.send_message("❌ Failed to set channel permissions.", ephemeral=True)
 
-        cog.add_active_ticket(ticket_channel.id, interaction.user.id, interaction.guild.id)
+        await cog.add_active_ticket(ticket_channel.id, interaction.user.id, interaction.guild.id)
         await interaction.response.send_message(f"✅ Ticket created: {ticket_channel.mention}", ephemeral=True)
 
         embed = discord.Embed(
@@ -234,33 +290,21 @@ class TicketManageView(View):
             
         config = cog.get_config(interaction.guild.id)
         staff_role = interaction.guild.get_role(config[2]) if config else None
-        
-        has_permission = (interaction.user == self.ticket_owner or 
+        owner_id = cog.ticket_owner(interaction.channel.id)
+
+        has_permission = (interaction.user == self.ticket_owner or
+                         interaction.user.id == owner_id or
                          interaction.user.guild_permissions.manage_channels or
                          (staff_role and staff_role in interaction.user.roles))
-        
+
         if not has_permission:
             return await interaction.response.send_message("You don't have permission to close this ticket.", ephemeral=True)
 
-        if config:
-            log_channel = interaction.guild.get_channel(config[1])
-            if log_channel:
-                log_embed = discord.Embed(
-                    title="Ticket Closed",
-                    color=0xfcd005,
-                    timestamp=discord.utils.utcnow()
-                )
-                log_embed.add_field(name="Closed by", value=interaction.user.mention)
-                log_embed.add_field(name="Channel", value=f"`{interaction.channel.name}`")
-                try:
-                    await log_channel.send(embed=log_embed)
-                except discord.HTTPException:
-                    pass
+        if interaction.channel.id in cog.closing:
+            return await interaction.response.send_message("This ticket is already closing.", ephemeral=True)
 
-        cog.remove_active_ticket(interaction.channel.id)
-        await interaction.response.send_message("Closing ticket in 5 seconds...")
-        await asyncio.sleep(5)
-        await interaction.channel.delete()
+        await interaction.response.send_message("Saving transcript and closing ticket...")
+        await cog.close_ticket(interaction.channel, interaction.user)
 
     @discord.ui.button(label="Call Staff", style=discord.ButtonStyle.blurple, emoji="🔔", custom_id="persistent:call_staff")
     async def call_staff(self, interaction: discord.Interaction, button: Button):
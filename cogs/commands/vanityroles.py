@@ -1,21 +1,24 @@
 import discord
-from discord.ext import commands, tasks
-import aiosqlite
-import aiohttp
+from discord.ext import commands
+from core import storage
 import os
 from utils.Tools import *
+from utils.vanity_engine import VanityEngine
 
 DB_PATH = "db/vanity.db"
 
 class VanityRoles(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
+        self.engine = VanityEngine(bot, DB_PATH)
         self.bot.loop.create_task(self.initialize_db())
-        self.vanity_checker.start()
+
+    def cog_unload(self):
+        self.engine.close()
 
     async def initialize_db(self):
         os.makedirs(os.path.dirname(DB_PATH), exist_ok=True)
-        async with aiosqlite.connect(DB_PATH) as db:
+        async with storage.connect(DB_PATH) as db:
             await db.execute("""
                 CREATE TABLE IF NOT EXISTS vanity_roles (
                     guild_id INTEGER,
@@ -35,6 +38,32 @@ class VanityRoles(commands.Cog):
             if "current_status" not in column_names:
                 await db.execute("ALTER TABLE vanity_roles ADD COLUMN current_status TEXT")
                 await db.commit()
+        await self.engine.load()
+        await self.bot.cache_policy.track(self.engine.configs, "vanity")
+        if self.bot.is_ready():
+            await self.refresh_all()
+
+    async def refresh_all(self):
+        for guild_id in list(self.engine.configs):
+            guild = self.bot.get_guild(guild_id)
+            if guild:
+                await self.engine.refresh(guild)
+
+    @commands.Cog.listener()
+    async def on_ready(self):
+        await self.refresh_all()
+
+    @commands.Cog.listener()
+    async def on_presence_update(self, before, after):
+        await self.engine.on_presence_update(before, after)
+
+    @commands.Cog.listener()
+    async def on_guild_update(self, before, after):
+        await self.engine.on_guild_update(before, after)
+
+    @commands.Cog.listener()
+    async def on_member_remove(self, member):
+        self.engine.on_member_remove(member)
 
     @commands.group(name="vanityroles", invoke_without_command=True)
     @blacklist_check()
@@ -46,12 +75,15 @@ class VanityRoles(commands.Cog):
     @blacklist_check()
     @ignore_check()
     async def setup(self, ctx, vanity: str, role: discord.Role, channel: discord.TextChannel):
-        async with aiosqlite.connect(DB_PATH) as db:
+        async with storage.connect(DB_PATH) as db:
             await db.execute("""
                 INSERT OR REPLACE INTO vanity_roles (guild_id, vanity, role_id, log_channel_id, current_status)
                 VALUES (?, ?, ?, ?, NULL)
             """, (ctx.guild.id, vanity.lower(), role.id, channel.id))
             await db.commit()
+        await self.engine.load(ctx.guild.id)
+        await self.bot.cache_policy.enable(ctx.guild, "vanity")
+        self.bot.loop.create_task(self.engine.refresh(ctx.guild))
         embed = discord.Embed(
             title="✅ Vanity Role Setup",
             description=f"Vanity: `{vanity}`\nRole: {role.mention}\nLog Channel: {channel.mention}",
@@ -63,7 +95,7 @@ class VanityRoles(commands.Cog):
     @blacklist_check()
     @ignore_check()
     async def show(self, ctx):
-        async with aiosqlite.connect(DB_PATH) as db:
+        async with storage.connect(DB_PATH) as db:
             async with db.execute("SELECT vanity, role_id, log_channel_id FROM vanity_roles WHERE guild_id = ?", (ctx.guild.id,)) as cursor:
                 rows = await cursor.fetchall()
 
@@ -74,9 +106,12 @@ class VanityRoles(commands.Cog):
         for vanity, role_id, log_channel_id in rows:
             role = ctx.guild.get_role(role_id)
             channel = ctx.guild.get_channel(log_channel_id)
+            config = next((c for c in self.engine.configs.get(ctx.guild.id, ()) if c.vanity == vanity), None)
+            qualifying = len(self.engine.qualifying.get((ctx.guild.id, vanity), ()))
             embed.add_field(
                 name=f"Vanity: `{vanity}`",
-                value=f"Role: {role.mention if role else role_id}\nLog: {channel.mention if channel else log_channel_id}",
+                value=f"Role: {role.mention if role else role_id}\nLog: {channel.mention if channel else log_channel_id}\n"
+                      f"Invite: {'active' if config and config.active else 'inactive'} | In status: {qualifying}",
                 inline=False
             )
         await ctx.send(embed=embed)
@@ -85,68 +120,12 @@ class VanityRoles(commands.Cog):
     @blacklist_check()
     @ignore_check()
     async def reset(self, ctx):
-        async with aiosqlite.connect(DB_PATH) as db:
+        async with storage.connect(DB_PATH) as db:
             await db.execute("DELETE FROM vanity_roles WHERE guild_id = ?", (ctx.guild.id,))
             await db.commit()
+        self.engine.forget(ctx.guild.id)
+        await self.bot.cache_policy.disable(ctx.guild, "vanity")
         await ctx.send("✅ All vanity role configurations have been reset.")
 
-    @tasks.loop(seconds=15)
-    async def vanity_checker(self):
-        async with aiosqlite.connect(DB_PATH) as db:
-            async with db.execute("SELECT guild_id, vanity, role_id, log_channel_id, current_status FROM vanity_roles") as cursor:
-                rows = await cursor.fetchall()
-
-        for guild_id, vanity, role_id, log_channel_id, current_status in rows:
-            guild = self.bot.get_guild(guild_id)
-            if not guild:
-                continue
-
-            role = guild.get_role(role_id)
-            log_channel = guild.get_channel(log_channel_id)
-
-            try:
-                async with aiohttp.ClientSession() as session:
-                    async with session.get(f"https://discord.com/api/v10/invites/{vanity}") as response:
-                        is_active = response.status == 200
-            except Exception:
-                continue
-
-            if is_active and current_status != "active":
-                await self.update_status(guild_id, vanity, "active")
-                assigned = 0
-                for member in guild.members:
-                    if member.status != discord.Status.offline and role and role not in member.roles:
-                        try:
-                            await member.add_roles(role, reason="Vanity active")
-                            assigned += 1
-                        except Exception:
-                            pass
-                if log_channel:
-                    await log_channel.send(f"✅ Vanity `{vanity}` is now **active**. Role assigned to {assigned} members.")
-
-            elif not is_active and current_status == "active":
-                await self.update_status(guild_id, vanity, None)
-                removed = 0
-                for member in guild.members:
-                    if role and role in member.roles:
-                        try:
-                            await member.remove_roles(role, reason="Vanity inactive")
-                            removed += 1
-                        except Exception:
-                            pass
-                if log_channel:
-                    await log_channel.send(f"❌ Vanity `{vanity}` is now **inactive**. Role removed from {removed} members.")
-
-    async def update_status(self, guild_id, vanity, new_status):
-        async with aiosqlite.connect(DB_PATH) as db:
-            await db.execute("""
-                UPDATE vanity_roles SET current_status = ? WHERE guild_id = ? AND vanity = ?
-            """, (new_status, guild_id, vanity))
-            await db.commit()
-
-    @vanity_checker.before_loop
-    async def before_checker(self):
-        await self.bot.wait_until_ready()
-
 async def setup(bot):
     await bot.add_cog(VanityRoles(bot))
@@ -7,6 +7,7 @@ from typing import Optional, Union
 from discord.ext.commands import Context
 from utils import Paginator, DescriptionEmbedPaginator, FieldPagePaginator, TextPaginator
 from utils import *
+from utils.voice_ops import VoiceBulkOps, voice_members
 
 
 class Voice(commands.Cog):
@@ -14,6 +15,7 @@ class Voice(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
         self.color = 0x000000
+        self.bulk = VoiceBulkOps()
 
     @commands.group(name="voice", invoke_without_command=True, aliases=['vc'])
     @blacklist_check()
@@ -75,16 +77,14 @@ class Voice(commands.Cog):
                                icon_url=ctx.author.avatar.url if ctx.author.avatar else ctx.author.default_avatar.url)
             embed.set_thumbnail(url="https://cdn.discordapp.com/emojis/1279464563150032991.png")
             return await ctx.reply(embed=embed)
-        count = 0
         ch = ctx.author.voice.channel.mention
-        for member in ctx.author.voice.channel.members:
-            await member.edit(
-                voice_channel=None,
-                reason=f"Disconnect All Command Executed By: {str(ctx.author)}")
-            count += 1
+        result = await self.bulk.edit(
+            ctx.author.voice.channel.members,
+            voice_channel=None,
+            reason=f"Disconnect All Command Executed By: {str(ctx.author)}")
         embed2 = discord.Embed(title="<:tick:1327829594954530896> Success",
 
-            description=f"Disconnected {count} members from {ch}",
+            description=f"Disconnected {result.changed} members from {ch}\n{result.details()}",
             color=self.color)
         embed2.set_footer(text=f"Requested by: {ctx.author}",
                                icon_url=ctx.author.avatar.url if ctx.author.avatar else ctx.author.default_avatar.url)
@@ -207,17 +207,13 @@ class Voice(commands.Cog):
                                icon_url=ctx.author.avatar.url if ctx.author.avatar else ctx.author.default_avatar.url)
             embed.set_thumbnail(url="https://cdn.discordapp.com/emojis/1279464563150032991.png")
             return await ctx.reply(embed=embed)
-        count = 0
         ch = ctx.author.voice.channel.mention
-        for member in ctx.author.voice.channel.members:
-            if member.voice.mute == False:
-                await member.edit(
-                    mute=True,
-                    reason=
-                    f"voice muteall Command Executed by {str(ctx.author)}")
-                count += 1
+        result = await self.bulk.edit(
+            ctx.author.voice.channel.members,
+            mute=True,
+            reason=f"voice muteall Command Executed by {str(ctx.author)}")
         embed2 = discord.Embed(title="<:tick:1327829594954530896> Success",
-                               description=f"Muted {count} members in {ch}",
+                               description=f"Muted {result.changed} members in {ch}\n{result.details()}",
                                color=self.color)
         embed2.set_footer(text=f"Requested by: {ctx.author}",
                                icon_url=ctx.author.avatar.url if ctx.author.avatar else ctx.author.default_avatar.url)
@@ -244,17 +240,13 @@ class Voice(commands.Cog):
                                icon_url=ctx.author.avatar.url if ctx.author.avatar else ctx.author.default_avatar.url)
             embed.set_thumbnail(url="https://cdn.discordapp.com/emojis/1279464563150032991.png")
             return await ctx.reply(embed=embed)
-        count = 0
         ch = ctx.author.voice.channel.mention
-        for member in ctx.author.voice.channel.members:
-            if member.voice.mute == True:
-                await member.edit(
-                    mute=False,
-                    reason=
-                    f"Voice unmuteall Command Executed by: {str(ctx.author)}")
-                count += 1
+        result = await self.bulk.edit(
+            ctx.author.voice.channel.members,
+            mute=False,
+            reason=f"Voice unmuteall Command Executed by: {str(ctx.author)}")
         embed2 = discord.Embed(title="<:tick:1327829594954530896> Success",
-                               description=f"Unmuted {count} members in {ch}",
+                               description=f"Unmuted {result.changed} members in {ch}\n{result.details()}",
                                color=self.color)
         embed2.set_footer(text=f"Requested by: {ctx.author}",
                                icon_url=ctx.author.avatar.url if ctx.author.avatar else ctx.author.default_avatar.url)
@@ -364,17 +356,13 @@ class Voice(commands.Cog):
                                icon_url=ctx.author.avatar.url if ctx.author.avatar else ctx.author.default_avatar.url)
             embed.set_thumbnail(url="https://cdn.discordapp.com/emojis/1279464563150032991.png")
             return await ctx.reply(embed=embed)
-        count = 0
         ch = ctx.author.voice.channel.mention
-        for member in ctx.author.voice.channel.members:
-            if member.voice.deaf == False:
-                await member.edit(
-                    deafen=True,
-                    reason=
-                    f"voice deafenall Command Executed by {str(ctx.author)}")
-                count += 1
+        result = await self.bulk.edit(
+            ctx.author.voice.channel.members,
+            deafen=True,
+            reason=f"voice deafenall Command Executed by {str(ctx.author)}")
         embed2 = discord.Embed(title="<:tick:1327829594954530896> Success",
-                               description=f"Deafened {count} members in {ch}",
+                               description=f"Deafened {result.changed} members in {ch}\n{result.details()}",
                                color=self.color)
         embed2.set_footer(text=f"Requested by: {ctx.author}",
                            icon_url=ctx.author.avatar.url if ctx.author.avatar else ctx.author.default_avatar.url)
@@ -401,18 +389,14 @@ class Voice(commands.Cog):
                                icon_url=ctx.author.avatar.url if ctx.author.avatar else ctx.author.default_avatar.url)
             embed.set_thumbnail(url="https://cdn.discordapp.com/emojis/1279464563150032991.png")
             return await ctx.reply(embed=embed)
-        count = 0
         ch = ctx.author.voice.channel.mention
-        for member in ctx.author.voice.channel.members:
-            if member.voice.deaf == True:
-                await member.edit(
-                    deafen=False,
-                    reason=
-                    f"Voice undeafenall Command Executed by: {str(ctx.author)}")
-                count += 1
+        result = await self.bulk.edit(
+            ctx.author.voice.channel.members,
+            deafen=False,
+            reason=f"Voice undeafenall Command Executed by: {str(ctx.author)}")
         embed2 = discord.Embed(title="<:tick:1327829594954530896> Success",
 
-            description=f"Undeafened {count} members in {ch}",
+            description=f"Undeafened {result.changed} members in {ch}\n{result.details()}",
             color=self.color)
         embed2.set_footer(text=f"Requested by: {ctx.author}",
                            icon_url=ctx.author.avatar.url if ctx.author.avatar else ctx.author.default_avatar.url)
@@ -442,16 +426,13 @@ class Voice(commands.Cog):
         try:
             ch = ctx.author.voice.channel.mention
             nch = channel.mention
-            count = 0
-            for member in ctx.author.voice.channel.members:
-                await member.edit(
-                    voice_channel=channel,
-                    reason=
-                    f"voice moveall Command Executed by: {str(ctx.author)}")
-                count += 1
+            result = await self.bulk.edit(
+                ctx.author.voice.channel.members,
+                voice_channel=channel,
+                reason=f"voice moveall Command Executed by: {str(ctx.author)}")
             embed2 = discord.Embed(title="<:tick:1327829594954530896> Success",
 
-                description=f"{count} Members moved from {ch} to {nch}",
+                description=f"{result.changed} Members moved from {ch} to {nch}\n{result.details()}",
                 color=self.color)
             embed2.set_footer(text=f"Requested by: {ctx.author}",
                                icon_url=ctx.author.avatar.url if ctx.author.avatar else ctx.author.default_avatar.url)
@@ -489,19 +470,12 @@ class Voice(commands.Cog):
                                icon_url=ctx.author.avatar.url if ctx.author.avatar else ctx.author.default_avatar.url)
             embed.set_thumbnail(url="https://cdn.discordapp.com/emojis/1279464563150032991.png")
             return await ctx.reply(embed=embed)
-        count = 0
-        for vc in ctx.guild.voice_channels:
-            for member in vc.members:
-                if member != ctx.author:
-                    try:
-                        await member.edit(
-                            voice_channel=channel,
-                            reason=f"Pullall Command Executed by: {str(ctx.author)}")
-                        count += 1
-                    except:
-                        pass
+        result = await self.bulk.edit(
+            [member for member in voice_members(ctx.guild) if member != ctx.author],
+            voice_channel=channel,
+            reason=f"Pullall Command Executed by: {str(ctx.author)}")
         embed2 = discord.Embed(title="<:tick:1327829594954530896> Success",
-                               description=f"Moved {count} members to {channel.mention}",
+                               description=f"Moved {result.changed} members to {channel.mention}\n{result.details()}",
                                color=self.color)
         embed2.set_footer(text=f"Requested by: {ctx.author}",
                                icon_url=ctx.author.avatar.url if ctx.author.avatar else ctx.author.default_avatar.url)
@@ -0,0 +1,71 @@
+import discord
+from discord.ext import commands, tasks
+from colorama import Fore, Style
+from utils.config import WATCHDOG_THRESHOLD, WATCHDOG_REPORT_MINUTES
+from utils.loop_watchdog import LoopWatchdog
+
+
+class Watchdog(commands.Cog):
+    def __init__(self, bot):
+        self.bot = bot
+        self.watchdog = LoopWatchdog(threshold=WATCHDOG_THRESHOLD)
+        self.bot.loop_watchdog = self.watchdog
+
+    async def cog_load(self):
+        self.watchdog.start(self.bot.loop)
+        self.report.start()
+
+    async def cog_unload(self):
+        self.report.cancel()
+        self.watchdog.stop()
+
+    def summary(self, limit: int = 10) -> str:
+        lines = []
+        for finding in self.watchdog.top(limit):
+            lines.append(
+                f"`{finding.cog}.{finding.function}` ({finding.location}) — "
+                f"{finding.count}x, worst {finding.worst * 1000:.0f} ms, total {finding.total:.2f} s"
+            )
+        return "\n".join(lines) or "No blocking calls recorded."
+
+    @tasks.loop(minutes=WATCHDOG_REPORT_MINUTES)
+    async def report(self):
+        if not self.watchdog.findings:
+            return
+        print(Fore.YELLOW + Style.BRIGHT +
+              f"[watchdog] lag avg {self.watchdog.avg_lag * 1000:.1f} ms, max {self.watchdog.max_lag * 1000:.0f} ms, "
+              f"{self.watchdog.stalls} stalls over {WATCHDOG_THRESHOLD * 1000:.0f} ms")
+        for finding in self.watchdog.top(5):
+            print(Fore.YELLOW + f"  {finding.cog}.{finding.function} {finding.location} "
+                  f"{finding.count}x worst {finding.worst * 1000:.0f} ms")
+
+    @report.before_loop
+    async def before_report(self):
+        await self.bot.wait_until_ready()
+
+    @commands.group(name="looplag", invoke_without_command=True, help="Shows event-loop lag and the calls blocking it.")
+    @commands.is_owner()
+    async def looplag(self, ctx):
+        wd = self.watchdog
+        embed = discord.Embed(title="Event Loop Watchdog", color=0x000000)
+        embed.add_field(
+            name="Lag",
+            value=f"Current: **{wd.lag * 1000:.1f} ms**\nAverage: **{wd.avg_lag * 1000:.1f} ms**\nMax: **{wd.max_lag * 1000:.0f} ms**",
+            inline=False)
+        embed.add_field(name=f"Top Blockers ({wd.stalls} stalls)", value=self.summary()[:1024], inline=False)
+        await ctx.send(embed=embed)
+
+    @looplag.command(name="stack", help="Shows the last captured stack for the worst blocker.")
+    @commands.is_owner()
+    async def looplag_stack(self, ctx, rank: int = 1):
+        top = self.watchdog.top(rank)
+        if len(top) < rank or rank < 1:
+            return await ctx.send("No blocker recorded at that rank.")
+        finding = top[rank - 1]
+        await ctx.send(f"**{finding.cog}.{finding.function}** ({finding.location})\n```py\n{finding.stack[-1800:]}\n```")
+
+    @looplag.command(name="reset", help="Clears recorded watchdog findings.")
+    @commands.is_owner()
+    async def looplag_reset(self, ctx):
+        self.watchdog.reset()
+        await ctx.send("Watchdog findings cleared.")
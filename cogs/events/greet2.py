@@ -1,5 +1,5 @@
 import discord
-import aiosqlite
+from core import storage
 import json
 import re
 import asyncio
@@ -30,7 +30,7 @@ class greet(commands.Cog):
     async def process_queue(self, guild):
         while self.join_queue[guild.id]:
             member = self.join_queue[guild.id].pop(0)
-            async with aiosqlite.connect("db/welcome.db") as db:
+            async with storage.connect("db/welcome.db") as db:
                 async with db.execute("SELECT welcome_type, welcome_message, channel_id, embed_data, auto_delete_duration FROM welcome WHERE guild_id = ?", (guild.id,)) as cursor:
                     row = await cursor.fetchone()
             if row is None:
@@ -2,7 +2,7 @@ from utils import getConfig
 import discord
 from discord.ext import commands
 from utils.Tools import get_ignore_data
-import aiosqlite
+from core import storage
 
 class Mention(commands.Cog):
 
@@ -12,7 +12,7 @@ class Mention(commands.Cog):
         self.bot_name = "Axon X"
 
     async def is_blacklisted(self, message):
-        async with aiosqlite.connect("db/block.db") as db:
+        async with storage.connect("db/block.db") as db:
             cursor = await db.execute("SELECT 1 FROM guild_blacklist WHERE guild_id = ?", (message.guild.id,))
             if await cursor.fetchone():
                 return True
@@ -0,0 +1,79 @@
+import discord
+from discord.ext import commands
+from utils.config import (MESSAGE_STORE_ENABLED, MESSAGE_STORE_RETENTION,
+                          MESSAGE_STORE_BUDGET, MESSAGE_STORE_PER_CHANNEL)
+from utils.message_store import MessageStore, StoredMessage
+
+
+class MessageTracker(commands.Cog):
+    """Turns raw delete/edit gateway events into ``stored_message_*`` events.
+
+    Consumers (message logs, snipe) listen for:
+
+    * ``on_stored_message_delete(record)``
+    * ``on_stored_bulk_message_delete(records)``
+    * ``on_stored_message_edit(before, after)``
+
+    Records come from the bot's :class:`MessageStore` when it is enabled,
+    otherwise from the gateway message cache, so these fire for messages
+    older than ``max_messages`` whenever the store still holds them.
+    """
+
+    def __init__(self, bot):
+        self.bot = bot
+        self.store = None
+        if MESSAGE_STORE_ENABLED:
+            self.store = MessageStore(MESSAGE_STORE_RETENTION, MESSAGE_STORE_BUDGET,
+                                      MESSAGE_STORE_PER_CHANNEL)
+        self.bot.message_store = self.store
+
+    def _cached(self, message):
+        if message is None or message.guild is None or message.author.bot:
+            return None
+        return StoredMessage.from_message(message)
+
+    @commands.Cog.listener()
+    async def on_message(self, message):
+        if self.store is None or message.guild is None or message.author.bot:
+            return
+        self.store.add(message)
+
+    @commands.Cog.listener()
+    async def on_raw_message_delete(self, payload: discord.RawMessageDeleteEvent):
+        record = self.store.pop(payload.message_id) if self.store else None
+        if record is None:
+            record = self._cached(payload.cached_message)
+        if record is not None:
+            self.bot.dispatch("stored_message_delete", record)
+
+    @commands.Cog.listener()
+    async def on_raw_bulk_message_delete(self, payload: discord.RawBulkMessageDeleteEvent):
+        records = self.store.pop_many(payload.message_ids) if self.store else []
+        found = {r.id for r in records}
+        for message in payload.cached_messages:
+            if message.id not in found:
+                record = self._cached(message)
+                if record is not None:
+                    records.append(record)
+        if records:
+            records.sort(key=lambda r: r.id)
+            self.bot.dispatch("stored_bulk_message_delete", records)
+
+    @commands.Cog.listener()
+    async def on_raw_message_edit(self, payload: discord.RawMessageUpdateEvent):
+        content = payload.data.get("content")
+        if content is None:
+            return
+        pair = self.store.edit(payload.message_id, content) if self.store else None
+        if pair is None:
+            before = self._cached(payload.cached_message)
+            if before is None:
+                return
+            pair = (before, before.edited(content))
+        if pair[0].content != pair[1].content:
+            self.bot.dispatch("stored_message_edit", *pair)
+
+    @commands.Cog.listener()
+    async def on_guild_channel_delete(self, channel):
+        if self.store is not None:
+            self.store.forget_channel(channel.id)
@@ -10,18 +10,18 @@ logging.basicConfig(
     datefmt="%H:%M:%S",
 )
 
-client = axon()
-
 class Guild(Cog):
     def __init__(self, client: axon):
         self.client = client
 
-    @client.event
     @commands.Cog.listener(name="on_guild_join")
     async def on_guild_add(self, guild):
         try:
             
             rope = [inv for inv in await guild.invites() if inv.max_age == 0 and inv.max_uses == 0]
+            # guilds aren't chunked at startup any more; the human / bot split needs every member
+            complete = await self.client.cache_policy.ensure_chunked(guild)
+            bots = sum(1 for m in guild.members if m.bot) if complete else None
             ch = 1327829068644876391  
             me = self.client.get_channel(ch)
             if me is None:
@@ -36,7 +36,7 @@ class Guild(Cog):
 
             embed.add_field(
                 name="**__About__**",
-                value=f"**Name : ** {guild.name}\n**ID :** {guild.id}\n**Owner <:owner:1329041011984433185> :** {guild.owner} (<@{guild.owner_id}>)\n**Created At : **{guild.created_at.month}/{guild.created_at.day}/{guild.created_at.year}\n**Members :** {len(guild.members)}",
+                value=f"**Name : ** {guild.name}\n**ID :** {guild.id}\n**Owner <:owner:1329041011984433185> :** {guild.owner} (<@{guild.owner_id}>)\n**Created At : **{guild.created_at.month}/{guild.created_at.day}/{guild.created_at.year}\n**Members :** {guild.member_count}",
                 inline=False
             )
             embed.add_field(
@@ -46,7 +46,7 @@ class Guild(Cog):
             )
             embed.add_field(
                 name="**__Members__**",
-                value=f"""<:riverse_fun:1327829569264160870> Members : {len(guild.members)}\n <:user:1329379728603353108> Humans : {len(list(filter(lambda m: not m.bot, guild.members)))}\n<:icons_bot:1327829370881966092> Bots : {len(list(filter(lambda m: m.bot, guild.members)))}
+                value=f"""<:riverse_fun:1327829569264160870> Members : {guild.member_count}\n <:user:1329379728603353108> Humans : {guild.member_count - bots if bots is not None else 'Unknown'}\n<:icons_bot:1327829370881966092> Bots : {bots if bots is not None else 'Unknown'}
                 """,
                 inline=False
             )
@@ -69,9 +69,6 @@ Threads : {len(guild.threads)}
             embed.timestamp = discord.utils.utcnow()
             await me.send(f"{rope[0]}" if rope else "No Pre-Made Invite Found", embed=embed)
 
-            if not guild.chunked:
-                await guild.chunk()
-
             embed = discord.Embed(description="<:iconArrowRight:1327829310962401331> Prefix For This Server is `>`\n<:iconArrowRight:1327829310962401331> Get Started with `>help`\n<:iconArrowRight:1327829310962401331> For detailed guides, FAQ & information, visit our **[Support Server](https://discord.gg/codexdev)**",
     color=0xff0000)
             embed.set_author(name="Thanks for adding me!", icon_url=guild.me.display_avatar.url)
@@ -99,7 +96,6 @@ Threads : {len(guild.threads)}
         except Exception as e:
             logging.error(f"Error in on_guild_join: {e}")
 
-    @client.event
     @commands.Cog.listener(name="on_guild_remove")
     async def on_guild_remove(self, guild):
         try:
@@ -110,6 +106,8 @@ Threads : {len(guild.threads)}
                 return
 
             channels = len(set(self.client.get_all_channels()))
+            # the guild can no longer be chunked; unless it already was, only the total is known
+            bots = sum(1 for m in guild.members if m.bot) if guild.chunked else None
             embed = discord.Embed(title=f"{guild.name}'s Information", color=0x000000)
         
             embed.set_author(name="Guild Removed")
@@ -117,7 +115,7 @@ Threads : {len(guild.threads)}
 
             embed.add_field(
                 name="**__About__**",
-                value=f"**Name : ** {guild.name}\n**ID :** {guild.id}\n**Owner <:axon_owner:1228227536207740989> :** {guild.owner} (<@{guild.owner_id}>)\n**Created At : **{guild.created_at.month}/{guild.created_at.day}/{guild.created_at.year}\n**Members :** {len(guild.members)}",
+                value=f"**Name : ** {guild.name}\n**ID :** {guild.id}\n**Owner <:axon_owner:1228227536207740989> :** {guild.owner} (<@{guild.owner_id}>)\n**Created At : **{guild.created_at.month}/{guild.created_at.day}/{guild.created_at.year}\n**Members :** {guild.member_count}",
                 inline=False
             )
             embed.add_field(
@@ -130,9 +128,9 @@ Threads : {len(guild.threads)}
             embed.add_field(
                 name="**__Members__**",
                 value=f"""
-Members : {len(guild.members)}
-Humans : {len(list(filter(lambda m: not m.bot, guild.members)))}
-Bots : {len(list(filter(lambda m: m.bot, guild.members)))}
+Members : {guild.member_count}
+Humans : {guild.member_count - bots if bots is not None else 'Unknown'}
+Bots : {bots if bots is not None else 'Unknown'}
                 """,
                 inline=False
             )
@@ -21,6 +21,8 @@ from datetime import datetime, timezone, timedelta
 import sqlite3
 from typing import *
 from discord.utils import utcnow
+from utils.overwrite_engine import OverwriteEngine
+from utils.unban_job import UnbanCheckpoints, UnbanJob
 
 
 
@@ -85,6 +87,74 @@ class Moderation(commands.Cog):
     self.bot = bot
     self.color = 0x000000
     self.sniped = {}
+    self.overwrites = OverwriteEngine()
+    self.unban_checkpoints = UnbanCheckpoints()
+    self.unban_jobs = {}
+
+  async def cog_load(self):
+    await self.overwrites.setup()
+    await self.unban_checkpoints.setup()
+    self.bot.loop.create_task(self.resume_unbans())
+
+  async def cog_unload(self):
+    for job, task in self.unban_jobs.values():
+      job.cancelled = True
+      task.cancel()
+
+  async def resume_unbans(self):
+    await self.bot.wait_until_ready()
+    for guild_id, channel_id, author_id, last_id, unbanned, failed, total in await self.unban_checkpoints.pending():
+      guild = self.bot.get_guild(guild_id)
+      if guild is None or guild_id in self.unban_jobs:
+        continue
+      channel = guild.get_channel(channel_id)
+      message = None
+      if channel:
+        try:
+          message = await channel.send("Resuming the interrupted unban job...")
+        except discord.HTTPException:
+          pass
+      job = UnbanJob(guild, self.unban_checkpoints,
+                     reason="Unbanall Command Executed By: {} (resumed)".format(author_id),
+                     channel_id=channel_id, author_id=author_id)
+      job.restore(last_id, unbanned, failed, total)
+      self.start_unban(job, message)
+
+  def start_unban(self, job: UnbanJob, message: Optional[discord.Message]):
+    async def report(job: UnbanJob):
+      if message:
+        await message.edit(content=f"Unbanning all banned members...\n{job.status()}", embed=None, view=None)
+    job.report = report
+
+    async def run():
+      try:
+        await job.run()
+      except discord.Forbidden:
+        text = f"<:icons_warning:1327829522573430864> Unban job stopped: {job.error}. Run the command again to resume."
+      except Exception as e:
+        await self.unban_checkpoints.save(job)
+        text = f"<:icons_warning:1327829522573430864> Unban job stopped after {job.unbanned} unbans ({e}). Run the command again to resume."
+      else:
+        text = f"<:tick:1327829594954530896> Successfully Unbanned {job.unbanned} Members ({job.failed} failed, {job.rate:.1f}/s)"
+      finally:
+        self.unban_jobs.pop(job.guild.id, None)
+      if message:
+        try:
+          await message.channel.send(content=text)
+        except discord.HTTPException:
+          pass
+
+    self.unban_jobs[job.guild.id] = (job, self.bot.loop.create_task(run()))
+
+  def overwrite_progress(self, interaction: discord.Interaction, action: str):
+    async def progress(done: int, total: int):
+      embed = discord.Embed(color=self.color,
+                            description=f"{action} `{done}/{total}`")
+      try:
+        await interaction.edit_original_response(embed=embed, view=None)
+      except discord.HTTPException:
+        pass
+    return progress
 
   def convert(self, time):
     pos = ["s", "m", "h", "d"]
@@ -130,7 +200,6 @@ class Moderation(commands.Cog):
                      style=discord.ButtonStyle.red,
                      emoji="<:icons_warning:1327829522573430864>")
           async def button_callback(interaction: discord.Interaction):
-              a = 0
               if interaction.user == ctx.author:
                   if interaction.guild.me.guild_permissions.manage_roles:
                       embed1 = discord.Embed(
@@ -138,18 +207,13 @@ class Moderation(commands.Cog):
                     description=f"Unlocking all channels in {ctx.guild.name} .")
                       await interaction.response.edit_message(
                        embed=embed1, view=None)
-                      for channel in interaction.guild.channels:
-                          try:
-                              await channel.set_permissions(
-                                   ctx.guild.default_role,
-                                overwrite=discord.PermissionOverwrite(send_messages=True,
-                                                 read_messages=True),
-                                         reason="Unlockall Command Executed By: {}".format(ctx.author))
-                              a += 1  
-                          except Exception as e:
-                              print(e)
+                      result = await self.overwrites.restore(
+                          interaction.guild, ctx.guild.default_role, "lock",
+                          {"send_messages": True},
+                          reason="Unlockall Command Executed By: {}".format(ctx.author),
+                          progress=self.overwrite_progress(interaction, f"Unlocking all channels in {ctx.guild.name} ."))
                       await interaction.channel.send(
-                              content=f"<:tick:1327829594954530896> | Successfully Unlocked {a} Channels")   
+                              content=f"<:tick:1327829594954530896> | {result.summary('Unlocked')}")   
                       return
                   else:
                     await interaction.response.edit_message(
@@ -215,7 +279,6 @@ class Moderation(commands.Cog):
                      style=discord.ButtonStyle.red,
                      emoji="<:CrossIcon:1327829124894429235>")
           async def button_callback(interaction: discord.Interaction):
-              a = 0
               if interaction.user == ctx.author:
                   if interaction.guild.me.guild_permissions.manage_roles:
                       embed1 = discord.Embed(
@@ -223,18 +286,13 @@ class Moderation(commands.Cog):
                     description=f"Locking all channels in {ctx.guild.name}...")
                       await interaction.response.edit_message(
                        embed=embed1, view=None)
-                      for channel in interaction.guild.channels:
-                          try:
-                              await channel.set_permissions(ctx.guild.default_role,
-                                      overwrite=discord.PermissionOverwrite(
-                                        send_messages=False,
-                                        read_messages=True),
-                                         reason="Lockall command executed by: {}".format(ctx.author))
-                              a += 1  
-                          except Exception as e:
-                              print(e)
+                      result = await self.overwrites.apply(
+                          interaction.guild, ctx.guild.default_role, "lock",
+                          {"send_messages": False},
+                          reason="Lockall command executed by: {}".format(ctx.author),
+                          progress=self.overwrite_progress(interaction, f"Locking all channels in {ctx.guild.name}..."))
                       await interaction.channel.send(
-                              content=f"<:tick:1327829594954530896>| Successfully locked {a} Channels")
+                              content=f"<:tick:1327829594954530896> | {result.summary('Locked')}")
                       return
                   else:
                     await interaction.response.edit_message(
@@ -367,7 +425,6 @@ class Moderation(commands.Cog):
                      style=discord.ButtonStyle.red,
                      emoji="<:CrossIcon:1327829124894429235>")
           async def button_callback(interaction: discord.Interaction):
-              a = 0
               if interaction.user == ctx.author:
                   if interaction.guild.me.guild_permissions.manage_roles:
                       embed1 = discord.Embed(
@@ -375,15 +432,13 @@ class Moderation(commands.Cog):
                     description=f"Hiding all channels in {ctx.guild.name} ...")
                       await interaction.response.edit_message(
                        embed=embed1, view=None)
-                      for channel in interaction.guild.channels:
-                          try:
-                              await channel.set_permissions(ctx.guild.default_role, view_channel=False,
-                                         reason="Hideall Executed by: {}".format(ctx.author))
-                              a += 1  
-                          except Exception as e:
-                              print(e)
+                      result = await self.overwrites.apply(
+                          interaction.guild, ctx.guild.default_role, "hide",
+                          {"view_channel": False},
+                          reason="Hideall Executed by: {}".format(ctx.author),
+                          progress=self.overwrite_progress(interaction, f"Hiding all channels in {ctx.guild.name} ..."))
                       await interaction.channel.send(
-                              content=f"<:tick:1327829594954530896> | Successfully Hidden {a} Channel(s) .")
+                              content=f"<:tick:1327829594954530896> | {result.summary('Hidden')}")
                       return
                   else:
                     await interaction.response.edit_message(
@@ -445,7 +500,6 @@ class Moderation(commands.Cog):
                      style=discord.ButtonStyle.red,
                      emoji="<:CrossIcon:1327829124894429235>")
           async def button_callback(interaction: discord.Interaction):
-              a = 0
               if interaction.user == ctx.author:
                   if interaction.guild.me.guild_permissions.manage_roles:
                       embed1 = discord.Embed(
@@ -453,15 +507,13 @@ class Moderation(commands.Cog):
                     description=f"Unhiding all channels in {ctx.guild.name} .")
                       await interaction.response.edit_message(
                        embed=embed1, view=None)
-                      for channel in interaction.guild.channels:
-                          try:
-                              await channel.set_permissions(ctx.guild.default_role, view_channel=True,
-                                         reason="Unhideall Command Executed By: {}".format(ctx.author))
-                              a += 1  
-                          except Exception as e:
-                              print(e)
+                      result = await self.overwrites.restore(
+                          interaction.guild, ctx.guild.default_role, "hide",
+                          {"view_channel": True},
+                          reason="Unhideall Command Executed By: {}".format(ctx.author),
+                          progress=self.overwrite_progress(interaction, f"Unhiding all channels in {ctx.guild.name} ."))
                       await interaction.channel.send(
-                              content=f"<:tick:1327829594954530896> | Successfully Unhidden {a} Channel(s) .")
+                              content=f"<:tick:1327829594954530896> | {result.summary('Unhidden')}")
                       return
                   else:
                     await interaction.response.edit_message(
@@ -982,18 +1034,21 @@ class Moderation(commands.Cog):
                      emoji="<:CrossIcon:1327829124894429235>")
 
     async def button_callback(interaction: discord.Interaction):
-      a = 0
       if interaction.user == ctx.author:
         if interaction.guild.me.guild_permissions.ban_members:
+          if interaction.guild.id in self.unban_jobs:
+            job, _ = self.unban_jobs[interaction.guild.id]
+            return await interaction.response.edit_message(
+              content=f"An unban job is already running here.\n{job.status()}", embed=None, view=None)
           await interaction.response.edit_message(
             content="Unbanning All Banned Members...", embed=None, view=None)
-          async for idk in interaction.guild.bans(limit=None):
-            await interaction.guild.unban(
-              user=idk.user,
-              reason="Unbanall Command Executed By: {}".format(ctx.author))
-            a += 1
-          await interaction.channel.send(
-            content=f"<:tick:1327829594954530896> Successfully Unbanned {a} Members")
+          job = UnbanJob(interaction.guild, self.unban_checkpoints,
+                         reason="Unbanall Command Executed By: {}".format(ctx.author),
+                         channel_id=interaction.channel.id, author_id=ctx.author.id)
+          checkpoint = await self.unban_checkpoints.get(interaction.guild.id)
+          if checkpoint:
+            job.restore(*checkpoint[2:])
+          self.start_unban(job, interaction.message)
         else:
           await interaction.response.edit_message(
             content=
@@ -265,6 +265,7 @@ class Role(commands.Cog):
   @commands.max_concurrency(1, per=commands.BucketType.default, wait=False)
   @commands.guild_only()
   @commands.has_permissions(administrator=True)
+  @needs_members()
   async def role_humans(self, ctx, *, role: discord.Role):
     if ctx.author == ctx.guild.owner or ctx.author.top_role.position > ctx.guild.me.top_role.position:
         button = Button(label="Confirm",
@@ -348,6 +349,7 @@ class Role(commands.Cog):
   @commands.max_concurrency(1, per=commands.BucketType.default, wait=False)
   @commands.guild_only()
   @commands.has_permissions(administrator=True)
+  @needs_members()
   async def role_bots(self, ctx, *, role: discord.Role):
     if ctx.author == ctx.guild.owner or ctx.author.top_role.position > ctx.guild.me.top_role.position:
         button = Button(label="Confirm",
@@ -431,6 +433,7 @@ class Role(commands.Cog):
   @commands.max_concurrency(1, per=commands.BucketType.default, wait=False)
   @commands.guild_only()
   @commands.has_permissions(administrator=True)
+  @needs_members()
   async def role_unverified(self, ctx, *, role: discord.Role):
     if ctx.author == ctx.guild.owner or ctx.author.top_role.position > ctx.guild.me.top_role.position:
         button = Button(label="Confirm",
@@ -509,6 +512,7 @@ class Role(commands.Cog):
   @commands.max_concurrency(1, per=commands.BucketType.default, wait=False)
   @commands.guild_only()
   @commands.has_permissions(administrator=True)
+  @needs_members()
   async def role_all(self, ctx, *, role: discord.Role):
     if ctx.author == ctx.guild.owner or ctx.author.top_role.position > ctx.guild.me.top_role.position:
         button = Button(label="Confirm",
@@ -604,6 +608,7 @@ class Role(commands.Cog):
   @ignore_check()
   @commands.cooldown(1, 10, commands.BucketType.user)
   @commands.has_permissions(administrator=True)
+  @needs_members()
   async def rrole_humans(self, ctx, *, role: discord.Role):
     if ctx.author == ctx.guild.owner or ctx.author.top_role.position > ctx.guild.me.top_role.position:
         button = Button(label="Confirm",
@@ -686,6 +691,7 @@ class Role(commands.Cog):
   @ignore_check()
   @commands.cooldown(1, 10, commands.BucketType.user)
   @commands.has_permissions(administrator=True)
+  @needs_members()
   async def rrole_bots(self, ctx, *, role: discord.Role):
     if ctx.author == ctx.guild.owner or ctx.author.top_role.position > ctx.guild.me.top_role.position:
         button = Button(label="Confirm",
@@ -768,6 +774,7 @@ class Role(commands.Cog):
   @ignore_check()
   @commands.cooldown(1, 10, commands.BucketType.user)
   @commands.has_permissions(administrator=True)
+  @needs_members()
   async def rrole_all(self, ctx, *, role: discord.Role):
     if ctx.author == ctx.guild.owner or ctx.author.top_role.position > ctx.guild.me.top_role.position:
         button = Button(label="Confirm",
@@ -848,6 +855,7 @@ class Role(commands.Cog):
   @ignore_check()
   @commands.cooldown(1, 10, commands.BucketType.user)
   @commands.has_permissions(administrator=True)
+  @needs_members()
   async def rrole_unverified(self, ctx, *, role: discord.Role):
     if ctx.author == ctx.guild.owner or ctx.author.top_role.position > ctx.guild.me.top_role.position:
         button = Button(label="Yes",
@@ -1,7 +1,8 @@
 import discord
-from discord.ext import commands
-from datetime import datetime
+from discord.ext import commands, tasks
 from utils.Tools import *
+from utils.config import SNIPE_BUDGET, SNIPE_TTL
+from utils.snipe_store import SnipeStore
 
 class SnipeView(discord.ui.View):
     def __init__(self, bot, snipes, user_id):
@@ -20,22 +21,23 @@ class SnipeView(discord.ui.View):
 
     async def send_snipe_embed(self, interaction: discord.Interaction):
         snipe = self.snipes[self.index]
+        message = snipe.message
         embed = discord.Embed(color=0x000000)
-        embed.set_author(name=f"Deleted Message {self.index + 1}/{len(self.snipes)}", icon_url=snipe['author_avatar'])
-        uid = snipe['author_id']
-        display_name = snipe['author_name']
+        embed.set_author(name=f"Deleted Message {self.index + 1}/{len(self.snipes)}", icon_url=message.avatar_url)
+        uid = message.author_id
+        display_name = message.author_name
         embed.description = (
             f"**Author:** **[{display_name}](https://discord.com/users/{uid})**\n"
-            f" **Author ID:** `{snipe['author_id']}`\n"
-            f" **Author Mention:** <@{snipe['author_id']}>\n"
-            f"**Deleted:** <t:{snipe['deleted_at']}:R>\n"
+            f" **Author ID:** `{uid}`\n"
+            f" **Author Mention:** <@{uid}>\n"
+            f"**Deleted:** <t:{snipe.deleted_at}:R>\n"
         )
 
-        if snipe['content']:
-            embed.add_field(name="<:delete:1327842168693461022> **Content:**", value=snipe['content'])
-        if snipe['attachments']:
-            attachment_links = "\n".join([f"[{attachment['name']}]({attachment['url']})" for attachment in snipe['attachments']])
-            embed.add_field(name="**Attachments:**", value=attachment_links)
+        if message.content:
+            embed.add_field(name="<:delete:1327842168693461022> **Content:**", value=message.content[:1024])
+        if message.attachments:
+            attachment_links = "\n".join([f"[{name}]({url})" for name, url in message.attachments])
+            embed.add_field(name="**Attachments:**", value=attachment_links[:1024])
 
         embed.set_footer(text=f"Total Deleted Messages: {len(self.snipes)} | Requested by {interaction.user}", icon_url=interaction.user.avatar.url)
         await interaction.response.edit_message(embed=embed, view=self)
@@ -82,29 +84,36 @@ class SnipeView(discord.ui.View):
 class Snipe(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
-        self.snipes = {}
+        self.snipes = SnipeStore(budget=SNIPE_BUDGET, ttl=SNIPE_TTL)
+        self.sweep_snipes.start()
 
-    @commands.Cog.listener()
-    async def on_message_delete(self, message):
-        if not message.guild or message.author.bot:
-            return
-        if message.channel.id not in self.snipes:
-            self.snipes[message.channel.id] = []
-        if len(self.snipes[message.channel.id]) >= 10:
-            self.snipes[message.channel.id].pop(0)
+    def cog_unload(self):
+        self.sweep_snipes.cancel()
 
-        attachments = []
-        if message.attachments:
-            attachments = [{'name': attachment.filename, 'url': attachment.url} for attachment in message.attachments]
+    @tasks.loop(minutes=5)
+    async def sweep_snipes(self):
+        self.snipes.sweep()
+
+    @commands.Cog.listener()
+    async def on_stored_message_delete(self, record):
+        self.snipes.add(record)
 
-        self.snipes[message.channel.id].insert(0, {
-            'author_name': message.author.name,
-            'author_avatar': message.author.avatar.url,
-            'author_id': message.author.id,
-            'content': message.content or None,
-            'deleted_at': int(datetime.utcnow().timestamp()),
-            'attachments': attachments
-        })
+    @commands.Cog.listener()
+    async def on_guild_channel_delete(self, channel):
+        self.snipes.forget_channel(channel.id)
+
+    @commands.command(name='snipestats', help="Shows the memory used by the snipe store.")
+    @commands.is_owner()
+    async def snipestats(self, ctx):
+        stats = self.snipes.stats()
+        embed = discord.Embed(title="Snipe Store", color=0x000000)
+        embed.description = (
+            f"**Channels:** {stats['channels']}\n"
+            f"**Snipes:** {stats['snipes']}\n"
+            f"**Memory:** {stats['bytes'] / 1024:,.1f} KB / {stats['budget'] / 1024:,.0f} KB\n"
+            f"**Evicted Channels:** {stats['evicted_channels']}"
+        )
+        await ctx.send(embed=embed)
 
     @commands.hybrid_command(name='snipe', help="Shows the recently deleted messages in the channel.")
     @blacklist_check()
@@ -112,28 +121,29 @@ class Snipe(commands.Cog):
     @commands.cooldown(1, 3, commands.BucketType.user)
     @commands.has_permissions(manage_messages=True)
     async def snipe(self, ctx):
-        channel_snipes = self.snipes.get(ctx.channel.id, [])
+        channel_snipes = self.snipes.get(ctx.channel.id)
         if not channel_snipes:
             await ctx.send("No recently deleted messages found in this channel.")
             return
 
         first_snipe = channel_snipes[0]
+        message = first_snipe.message
         embed = discord.Embed(color=0x000000)
-        embed.set_author(name="Last Deleted Message", icon_url=first_snipe['author_avatar'])
-        uid = first_snipe['author_id']
-        display_name = first_snipe['author_name']
+        embed.set_author(name="Last Deleted Message", icon_url=message.avatar_url)
+        uid = message.author_id
+        display_name = message.author_name
         embed.description = (
             f" **Author:** **[{display_name}](https://discord.com/users/{uid})**\n"
-            f"**Author ID:** `{first_snipe['author_id']}`\n"
-            f"**Author Mention:** <@{first_snipe['author_id']}>\n"
-            f" **Deleted:** <t:{first_snipe['deleted_at']}:R>\n"
+            f"**Author ID:** `{uid}`\n"
+            f"**Author Mention:** <@{uid}>\n"
+            f" **Deleted:** <t:{first_snipe.deleted_at}:R>\n"
         )
 
-        if first_snipe['content']:
-            embed.add_field(name="<:delete:1327842168693461022> **Content:**", value=first_snipe['content'])
-        if first_snipe['attachments']:
-            attachment_links = "\n".join([f"[{attachment['name']}]({attachment['url']})" for attachment in first_snipe['attachments']])
-            embed.add_field(name="**Attachments:**", value=attachment_links)
+        if message.content:
+            embed.add_field(name="<:delete:1327842168693461022> **Content:**", value=message.content[:1024])
+        if message.attachments:
+            attachment_links = "\n".join([f"[{name}]({url})" for name, url in message.attachments])
+            embed.add_field(name="**Attachments:**", value=attachment_links[:1024])
 
         embed.set_footer(text=f"Total Deleted Messages: {len(channel_snipes)} | Requested by {ctx.author}", icon_url=ctx.author.avatar.url)
 
@@ -1,6 +1,6 @@
 import discord
 from discord.ext import commands
-import aiosqlite
+from core import storage
 import asyncio
 
 class TopCheck(commands.Cog):
@@ -10,7 +10,7 @@ class TopCheck(commands.Cog):
         self.bot.loop.create_task(self.setup())
 
     async def setup(self):
-        async with aiosqlite.connect(self.db_path) as db:
+        async with storage.connect(self.db_path) as db:
             await db.execute("""
                 CREATE TABLE IF NOT EXISTS topcheck (
                     guild_id INTEGER PRIMARY KEY,
@@ -20,7 +20,7 @@ class TopCheck(commands.Cog):
             await db.commit()
 
     async def is_topcheck_enabled(self, guild_id: int):
-        async with aiosqlite.connect(self.db_path) as db:
+        async with storage.connect(self.db_path) as db:
             async with db.execute("SELECT enabled FROM topcheck WHERE guild_id = ?", (guild_id,)) as cursor:
                 row = await cursor.fetchone()
                 if row:
@@ -28,12 +28,12 @@ class TopCheck(commands.Cog):
                 return False
 
     async def enable_topcheck(self, guild_id: int):
-        async with aiosqlite.connect(self.db_path) as db:
+        async with storage.connect(self.db_path) as db:
             await db.execute("INSERT OR REPLACE INTO topcheck (guild_id, enabled) VALUES (?, 1)", (guild_id,))
             await db.commit()
 
     async def disable_topcheck(self, guild_id: int):
-        async with aiosqlite.connect(self.db_path) as db:
+        async with storage.connect(self.db_path) as db:
             await db.execute("UPDATE topcheck SET enabled = 0 WHERE guild_id = ?", (guild_id,))
             await db.commit()
 
@@ -7,7 +7,7 @@ import jishaku
 import asyncio
 import typing
 from typing import List
-import aiosqlite
+from . import storage
 from utils.config import OWNER_IDS
 from utils import getConfig, updateConfig
 from .Context import Context
@@ -15,6 +15,12 @@ from discord.ext import commands, tasks
 from colorama import Fore, Style, init
 import importlib
 import inspect
+import time
+from typing import Tuple
+from .migrations import run_startup_migrations
+from .cluster import ClusterClient, ClusterInfo
+from .cache_policy import CachePolicy, build_intents, build_member_cache_flags
+from utils.config import CHUNK_GUILDS_AT_STARTUP
 
 init(autoreset=True)
 
@@ -25,12 +31,13 @@ extensions: List[str] = [
 class axon(commands.AutoShardedBot):
 
     def __init__(self, *arg, **kwargs):
-        intents = discord.Intents.all()
-        intents.presences = True
-        intents.members = True
+        intents = build_intents()
+        cluster = ClusterInfo()
         super().__init__(command_prefix=self.get_prefix,
                          case_insensitive=True,
                          intents=intents,
+                         member_cache_flags=build_member_cache_flags(intents),
+                         chunk_guilds_at_startup=CHUNK_GUILDS_AT_STARTUP,
                          status=discord.Status.online,
                          strip_after_prefix=True,
                          owner_ids=OWNER_IDS,
@@ -38,10 +45,86 @@ class axon(commands.AutoShardedBot):
                              everyone=False, replied_user=False, roles=False),
                          sync_commands_debug=True,
                          sync_commands=True,
-                         shard_count=2)
+                         shard_count=cluster.shard_count,
+                         shard_ids=cluster.shard_ids)
+        self.cluster = ClusterClient(self)
+        self.cache_policy = CachePolicy(self)
+        self.cache_policy.install()
+        self.cog_version = 0
+        self.deferred_cogs: List[Tuple[str, str]] = []
+        self._deferred_lock = asyncio.Lock()
+
+    async def add_cog(self, cog, /, **kwargs):
+        await super().add_cog(cog, **kwargs)
+        self.cog_version += 1
+
+    async def remove_cog(self, name, /, **kwargs):
+        cog = await super().remove_cog(name, **kwargs)
+        self.cog_version += 1
+        return cog
 
     async def setup_hook(self):
-        await self.load_extensions() 
+        # under the cluster launcher, migrations already ran once before any cluster started
+        if not self.cluster.info.managed:
+            start = time.perf_counter()
+            await run_startup_migrations()
+            print(Fore.BLUE + Style.BRIGHT + f"Database migrations done in {(time.perf_counter() - start) * 1000:.0f}ms")
+        await self.cluster.start()
+        await self.cache_policy.load()
+        await self.load_extensions()
+
+    async def close(self):
+        await super().close()
+        await self.cluster.close()
+        await storage.close()
+
+    async def load_cog_specs(self, specs: List[Tuple[str, str]]) -> List[Tuple[str, float]]:
+        """Import and add each ``(module, class)`` cog, returning how long each one took."""
+        timings = []
+        for module, name in specs:
+            start = time.perf_counter()
+            try:
+                cog = getattr(importlib.import_module(module), name)
+                await self.add_cog(cog(self))
+            except Exception as e:
+                print(f"{Fore.RED}{Style.BRIGHT}Failed to load cog {name} from {module}. {e}")
+                continue
+            timings.append((name, time.perf_counter() - start))
+        return timings
+
+    def report_cog_timings(self, timings: List[Tuple[str, float]], label: str):
+        for name, elapsed in timings:
+            print(Fore.BLUE + Style.BRIGHT + f"Loaded cog: {name} ({elapsed * 1000:.0f}ms)")
+        total = sum(elapsed for _, elapsed in timings)
+        slowest = ", ".join(
+            f"{name} {elapsed * 1000:.0f}ms"
+            for name, elapsed in sorted(timings, key=lambda t: t[1], reverse=True)[:5]
+        )
+        print(Fore.GREEN + Style.BRIGHT + f"{label}: {len(timings)} loaded in {total:.2f}s (slowest: {slowest or '-'})")
+
+    def defer_cogs(self, specs: List[Tuple[str, str]]):
+        self.deferred_cogs.extend(specs)
+
+    async def load_deferred_cogs(self) -> bool:
+        """Load the cogs registered with :meth:`defer_cogs`; returns whether anything was loaded."""
+        if not self.deferred_cogs:
+            return False
+        async with self._deferred_lock:
+            # the list is cleared only once loading is done, so a concurrent caller
+            # waits here instead of treating the commands as missing
+            if not self.deferred_cogs:
+                return False
+            timings = await self.load_cog_specs(self.deferred_cogs)
+            self.deferred_cogs = []
+        self.report_cog_timings(timings, "Deferred cogs")
+        return True
+
+    async def invoke(self, ctx):
+        # a prefix command nobody answers may belong to a cog that is still deferred
+        if ctx.command is None and ctx.invoked_with and self.deferred_cogs:
+            await self.load_deferred_cogs()
+            ctx.command = self.get_command(ctx.invoked_with)
+        await super().invoke(ctx)
 
     async def load_extensions(self):
         for extension in extensions:
@@ -82,7 +165,7 @@ class axon(commands.AutoShardedBot):
     async def get_prefix(self, message: discord.Message):
         if message.guild:
             guild_id = message.guild.id
-            async with aiosqlite.connect('db/np.db') as db:
+            async with storage.connect('db/np.db') as db:
                 async with db.execute("SELECT id FROM np WHERE id = ?", (message.author.id,)) as cursor:
                     row = await cursor.fetchone()
                     if row:
@@ -96,7 +179,7 @@ class axon(commands.AutoShardedBot):
                         prefix = data["prefix"]
                         return commands.when_mentioned_or(prefix)(self, message)
         else:
-            async with aiosqlite.connect('db/np.db') as db:
+            async with storage.connect('db/np.db') as db:
                 async with db.execute("SELECT id FROM np WHERE id = ?", (message.author.id,)) as cursor:
                     row = await cursor.fetchone()
                     if row:
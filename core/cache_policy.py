@@ -0,0 +1,245 @@
+"""
+Gateway intents and member caching.
+
+Which intents the bot subscribes to and which members it keeps in memory are
+set per deployment in utils/config.py (``INTENTS``, ``PRESENCE_INTENT``,
+``MEMBER_CACHE``). Guilds are not chunked at startup: commands that walk a
+guild's full member list ask for it through :meth:`CachePolicy.ensure_chunked`
+(``needs_members()`` in utils/Tools.py), and the first call pays for the
+chunk. With ``PRESENCE_OPT_IN``, presence updates are only processed for
+guilds that turned presence tracking on (vanity roles); for every other guild
+they are dropped before discord.py copies the member, so no presence state
+builds up there.
+"""
+
+import asyncio
+import sys
+import time
+from typing import Dict, Iterable, List, Optional, Set
+
+import discord
+
+from . import storage
+from utils.config import (CHUNK_TIMEOUT, INTENTS, MEMBER_CACHE,
+                          PRESENCE_INTENT, PRESENCE_OPT_IN)
+
+DB_PATH = "db/presence.db"
+
+# references to objects shared by the whole guild or process, not owned by a member
+_SHARED_ATTRS = {"_state", "guild", "_guild", "__weakref__"}
+
+
+def _names(spec: str) -> List[str]:
+    return [part.strip() for part in spec.split(",") if part.strip()]
+
+
+def build_intents(spec: str = INTENTS, presences: bool = PRESENCE_INTENT) -> discord.Intents:
+    if spec == "all":
+        intents = discord.Intents.all()
+    elif spec == "default":
+        intents = discord.Intents.default()
+    else:
+        intents = discord.Intents.none()
+        for name in _names(spec):
+            if name not in discord.Intents.VALID_FLAGS:
+                raise ValueError(f"Unknown intent {name!r} in INTENTS")
+            setattr(intents, name, True)
+    # nothing works without guild events
+    intents.guilds = True
+    intents.presences = presences
+    return intents
+
+
+def build_member_cache_flags(intents: discord.Intents, spec: str = MEMBER_CACHE) -> discord.MemberCacheFlags:
+    if spec == "all":
+        return discord.MemberCacheFlags.from_intents(intents)
+    flags = discord.MemberCacheFlags.none()
+    if spec == "none":
+        return flags
+    for name in _names(spec):
+        if name not in discord.MemberCacheFlags.VALID_FLAGS:
+            raise ValueError(f"Unknown member cache flag {name!r} in MEMBER_CACHE")
+        setattr(flags, name, True)
+    return flags
+
+
+def deep_size(obj, seen: Optional[Set[int]] = None) -> int:
+    """Approximate bytes held by ``obj`` and everything it owns; objects in ``seen`` count once."""
+    if seen is None:
+        seen = set()
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+    size = sys.getsizeof(obj)
+    if isinstance(obj, (str, bytes, int, float, type(None))):
+        return size
+    if isinstance(obj, dict):
+        return size + sum(deep_size(k, seen) + deep_size(v, seen) for k, v in obj.items())
+    if isinstance(obj, (list, tuple, set, frozenset)):
+        return size + sum(deep_size(item, seen) for item in obj)
+    for cls in type(obj).__mro__:
+        slots = getattr(cls, "__slots__", ())
+        for name in (slots,) if isinstance(slots, str) else slots:
+            if name not in _SHARED_ATTRS:
+                size += deep_size(getattr(obj, name, None), seen)
+    if hasattr(obj, "__dict__"):
+        size += sum(deep_size(v, seen) for k, v in vars(obj).items() if k not in _SHARED_ATTRS)
+    return size
+
+
+def guild_footprint(guild: discord.Guild, sample: int = 16) -> dict:
+    """Member and presence cache of one guild; the byte count is extrapolated from a sample."""
+    members = guild.members
+    picked = members[::max(1, len(members) // sample)][:sample]
+    seen: Set[int] = set()
+    per_member = sum(deep_size(member, seen) for member in picked) / len(picked) if picked else 0
+    return {
+        "id": guild.id,
+        "name": guild.name,
+        "members": len(members),
+        "member_count": guild.member_count or 0,
+        "presences": sum(1 for member in members if member.activities or member.raw_status != "offline"),
+        "chunked": guild.chunked,
+        "bytes": int(per_member * len(members)),
+    }
+
+
+class CachePolicy:
+    """On-demand chunking and per-guild presence tracking; available as ``bot.cache_policy``."""
+
+    def __init__(self, bot, db_path: str = DB_PATH):
+        self.bot = bot
+        self.db_path = db_path
+        self.presence_guilds: Set[int] = set()
+        self.chunk_times: Dict[int, float] = {}
+        # guilds whose cache was filled with presences; updates keep them current from then on.
+        # The object is kept because a reconnect replaces it with an empty one.
+        self._presence_chunked: Dict[int, discord.Guild] = {}
+        self._locks: Dict[int, asyncio.Lock] = {}
+
+    @property
+    def filtering(self) -> bool:
+        return PRESENCE_OPT_IN and self.bot.intents.presences
+
+    def tracks_presence(self, guild: discord.Guild) -> bool:
+        if not self.bot.intents.presences:
+            return False
+        return not self.filtering or guild.id in self.presence_guilds
+
+    def install(self):
+        """Put the per-guild opt-in in front of discord.py's PRESENCE_UPDATE handler."""
+        if not self.filtering:
+            return
+        parsers = self.bot._connection.parsers
+        original = parsers["PRESENCE_UPDATE"]
+        tracked = self.presence_guilds
+
+        def parse_presence_update(data):
+            guild_id = data.get("guild_id")
+            if guild_id is None or int(guild_id) in tracked:
+                original(data)
+
+        parsers["PRESENCE_UPDATE"] = parse_presence_update
+
+    async def load(self):
+        async with storage.connect(self.db_path) as db:
+            async with db.execute("SELECT DISTINCT guild_id FROM presence_guilds") as cursor:
+                self.presence_guilds.update(row[0] for row in await cursor.fetchall())
+        self.bot.add_listener(self._on_ready, "on_ready")
+
+    async def _on_ready(self):
+        # tracked guilds need every member's current presence, not just the ones that change later
+        for guild_id in list(self.presence_guilds):
+            guild = self.bot.get_guild(guild_id)
+            if guild is not None:
+                await self.ensure_chunked(guild, presences=True)
+
+    async def track(self, guild_ids: Iterable[int], feature: str):
+        """
+        Record that ``feature`` needs presences in ``guild_ids`` without chunking them.
+
+        Features call this for their existing configuration when they load, so
+        guilds set up before presence tracking was opt-in keep their events.
+        """
+        guild_ids = list(guild_ids)
+        if not guild_ids:
+            return
+        async with storage.connect(self.db_path) as db:
+            await db.executemany(
+                "INSERT OR IGNORE INTO presence_guilds (guild_id, feature) VALUES (?, ?)",
+                [(guild_id, feature) for guild_id in guild_ids]
+            )
+            await db.commit()
+        self.presence_guilds.update(guild_ids)
+
+    async def enable(self, guild: discord.Guild, feature: str):
+        """Track presences in ``guild`` on behalf of ``feature`` (e.g. ``"vanity"``)."""
+        await self.track([guild.id], feature)
+        await self.ensure_chunked(guild, presences=True)
+
+    async def disable(self, guild: discord.Guild, feature: str):
+        """Stop tracking for ``feature``; the guild stays tracked while another feature still needs it."""
+        async with storage.connect(self.db_path) as db:
+            await db.execute("DELETE FROM presence_guilds WHERE guild_id = ? AND feature = ?", (guild.id, feature))
+            await db.commit()
+            async with db.execute("SELECT 1 FROM presence_guilds WHERE guild_id = ? LIMIT 1", (guild.id,)) as cursor:
+                still_needed = await cursor.fetchone() is not None
+        if not still_needed:
+            self.presence_guilds.discard(guild.id)
+            self._presence_chunked.pop(guild.id, None)
+
+    async def ensure_chunked(self, guild: discord.Guild, presences: bool = False) -> bool:
+        """
+        Make sure every member of ``guild`` is cached; returns whether the list is complete.
+
+        ``presences`` also fetches each member's current presence, which only
+        makes sense for guilds that track presences.
+        """
+        presences = presences and self.tracks_presence(guild) and self._presence_chunked.get(guild.id) is not guild
+        if guild.chunked and not presences:
+            return True
+        lock = self._locks.setdefault(guild.id, asyncio.Lock())
+        async with lock:
+            presences = presences and self._presence_chunked.get(guild.id) is not guild
+            if guild.chunked and not presences:
+                return True
+            start = time.perf_counter()
+            try:
+                if presences:
+                    # Guild.chunk never asks for presences; an empty query without a limit returns everyone
+                    await self.bot._connection.query_members(
+                        guild, query="", limit=0, user_ids=None, cache=True, presences=True
+                    )
+                else:
+                    await asyncio.wait_for(guild.chunk(cache=True), timeout=CHUNK_TIMEOUT)
+            except (asyncio.TimeoutError, discord.ClientException) as e:
+                print(f"Chunking {guild.name} ({guild.id}) failed: {e or 'timed out'}")
+                return False
+            self.chunk_times[guild.id] = time.perf_counter() - start
+            if presences:
+                self._presence_chunked[guild.id] = guild
+        return guild.chunked
+
+    async def fetch_presence(self, guild: discord.Guild, user_id: int) -> Optional[discord.Member]:
+        """``user_id`` with an up-to-date presence, asked for once if the guild doesn't track presences."""
+        if self.tracks_presence(guild) and guild.chunked:
+            return guild.get_member(user_id)
+        if not self.bot.intents.presences:
+            return guild.get_member(user_id)
+        try:
+            members = await guild.query_members(user_ids=[user_id], presences=True, cache=False)
+        except asyncio.TimeoutError:
+            return guild.get_member(user_id)
+        return members[0] if members else None
+
+    async def report(self) -> dict:
+        guilds = []
+        for number, guild in enumerate(self.bot.guilds, start=1):
+            guilds.append(guild_footprint(guild))
+            if number % 50 == 0:
+                await asyncio.sleep(0)
+        return {
+            "intents": self.bot.intents.value,
+            "presence_guilds": len(self.presence_guilds),
+            "guilds": guilds,
+        }
@@ -0,0 +1,423 @@
+"""
+Multi-process clustering.
+
+``python -m core.cluster`` runs migrations once, then starts one bot process
+(cluster) per shard range and supervises them. The clusters talk to the
+launcher over a Unix socket using newline-delimited JSON:
+
+* ``publish(event, data)`` hands ``data`` to every other cluster, where it is
+  dispatched as ``on_cluster_<event>`` (cache invalidation and the like).
+* ``query(event, data)`` runs the handler registered for ``event`` on every
+  cluster, this one included, and returns the replies (stats, guild lists).
+  Work that can outlast the query timeout, such as a global unban, is
+  published instead and reported back with another ``publish``.
+
+Without the launcher the bot runs as a single cluster: ``publish`` does
+nothing and ``query`` only asks the local handler, so callers never need to
+care which mode they are in.
+"""
+
+import argparse
+import asyncio
+import itertools
+import json
+import os
+import signal
+import sys
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from utils.config import CLUSTER_IPC_PATH, CLUSTER_QUERY_TIMEOUT, SHARD_COUNT
+
+Handler = Callable[[Any], Awaitable[Any]]
+
+# one message per line; replies such as a full guild list go well past asyncio's 64 KiB default
+LINE_LIMIT = 16 * 1024 * 1024
+
+
+def parse_shard_ids(value: str) -> List[int]:
+    """``"0-3"`` or ``"0,1,4-5"`` to a list of shard IDs."""
+    ids: List[int] = []
+    for part in value.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        if "-" in part:
+            first, last = part.split("-", 1)
+            ids.extend(range(int(first), int(last) + 1))
+        else:
+            ids.append(int(part))
+    return ids
+
+
+def shard_ranges(shard_count: int, clusters: int) -> List[List[int]]:
+    """Split ``shard_count`` shards into ``clusters`` contiguous, near-equal ranges."""
+    clusters = max(1, min(clusters, shard_count))
+    size, extra = divmod(shard_count, clusters)
+    ranges, start = [], 0
+    for index in range(clusters):
+        end = start + size + (1 if index < extra else 0)
+        ranges.append(list(range(start, end)))
+        start = end
+    return ranges
+
+
+class ClusterInfo:
+    __slots__ = ("id", "count", "shard_count", "shard_ids", "ipc_path")
+
+    def __init__(self):
+        self.id = int(os.getenv("AXON_CLUSTER_ID", "0"))
+        self.count = int(os.getenv("AXON_CLUSTER_COUNT", "1"))
+        self.shard_count = int(os.getenv("AXON_SHARD_COUNT", str(SHARD_COUNT)))
+        shard_ids = os.getenv("AXON_SHARD_IDS")
+        self.shard_ids: Optional[List[int]] = parse_shard_ids(shard_ids) if shard_ids else None
+        self.ipc_path: Optional[str] = os.getenv("AXON_IPC_PATH")
+
+    @property
+    def managed(self) -> bool:
+        """Whether this process was started by the launcher."""
+        return self.ipc_path is not None
+
+
+async def _send(writer: asyncio.StreamWriter, payload: dict):
+    writer.write(json.dumps(payload, separators=(",", ":")).encode() + b"\n")
+    await writer.drain()
+
+
+class ClusterClient:
+    """The bot's end of the IPC channel; available as ``bot.cluster``."""
+
+    def __init__(self, bot):
+        self.bot = bot
+        self.info = ClusterInfo()
+        self.handlers: Dict[str, Handler] = {}
+        self._writer: Optional[asyncio.StreamWriter] = None
+        self._reader_task: Optional[asyncio.Task] = None
+        self._pending: Dict[int, asyncio.Future] = {}
+        self._ids = itertools.count(1)
+
+    @property
+    def id(self) -> int:
+        return self.info.id
+
+    @property
+    def primary(self) -> bool:
+        """Cluster 0 does the once-per-bot work, such as syncing the command tree."""
+        return self.info.id == 0
+
+    @property
+    def connected(self) -> bool:
+        return self._writer is not None and not self._writer.is_closing()
+
+    def handle(self, event: str, handler: Handler):
+        self.handlers[event] = handler
+
+    async def start(self):
+        if not self.info.managed:
+            return
+        for attempt in range(10):
+            try:
+                reader, self._writer = await asyncio.open_unix_connection(self.info.ipc_path, limit=LINE_LIMIT)
+                break
+            except OSError:
+                await asyncio.sleep(min(2 ** attempt, 10))
+        else:
+            print(f"Cluster {self.id}: could not reach the launcher at {self.info.ipc_path}")
+            return
+        await _send(self._writer, {"op": "hello", "cluster": self.id})
+        self._reader_task = asyncio.create_task(self._read(reader))
+        self.bot.add_listener(self._on_ready, "on_ready")
+
+    async def close(self):
+        if self._reader_task:
+            self._reader_task.cancel()
+        if self._writer:
+            self._writer.close()
+        for future in self._pending.values():
+            if not future.done():
+                future.cancel()
+
+    async def _on_ready(self):
+        await self._emit({"op": "ready", "cluster": self.id, "guilds": len(self.bot.guilds)})
+
+    async def _emit(self, payload: dict):
+        if self.connected:
+            try:
+                await _send(self._writer, payload)
+            except (ConnectionError, RuntimeError):
+                pass
+
+    async def _read(self, reader: asyncio.StreamReader):
+        while True:
+            line = await reader.readline()
+            if not line:
+                print(f"Cluster {self.id}: lost connection to the launcher")
+                return
+            message = json.loads(line)
+            op = message.get("op")
+            if op == "event":
+                self.bot.dispatch(f"cluster_{message['event']}", message.get("data"))
+            elif op == "query":
+                asyncio.create_task(self._answer(message))
+            elif op == "result":
+                future = self._pending.pop(message["id"], None)
+                if future and not future.done():
+                    future.set_result(message["data"])
+
+    async def _run_handler(self, event: str, data: Any) -> Any:
+        handler = self.handlers.get(event)
+        if handler is None:
+            return None
+        try:
+            return await handler(data)
+        except Exception as e:
+            print(f"Cluster {self.id}: handler for {event!r} failed. {e}")
+            return None
+
+    async def _answer(self, message: dict):
+        result = await self._run_handler(message["event"], message.get("data"))
+        await self._emit({"op": "reply", "id": message["id"], "data": result})
+
+    async def publish(self, event: str, data: Any = None):
+        """Dispatch ``on_cluster_<event>`` on every other cluster."""
+        await self._emit({"op": "publish", "event": event, "data": data})
+
+    async def query(self, event: str, data: Any = None, timeout: float = CLUSTER_QUERY_TIMEOUT) -> List[Any]:
+        """
+        Run the ``event`` handler on every cluster and return the non-empty replies.
+
+        If the launcher never answers, nothing is known about which clusters ran
+        the handler, so no replies are returned; the handler is never run again
+        here, as that could repeat side effects (unbans) a cluster already made.
+        """
+        if not self.connected:
+            result = await self._run_handler(event, data)
+            return [] if result is None else [result]
+        query_id = next(self._ids)
+        future = asyncio.get_running_loop().create_future()
+        self._pending[query_id] = future
+        await self._emit({"op": "query", "id": query_id, "event": event, "data": data, "timeout": timeout})
+        try:
+            # the launcher answers by ``timeout`` with whatever arrived; the margin covers the hop
+            replies = await asyncio.wait_for(future, timeout + 2)
+        except asyncio.TimeoutError:
+            self._pending.pop(query_id, None)
+            print(f"Cluster {self.id}: no answer from the launcher to {event!r} within {timeout + 2:.0f}s")
+            replies = []
+        return [reply for reply in replies if reply is not None]
+
+    async def restart_all(self) -> bool:
+        """Ask the launcher to restart every cluster; False when not running under it."""
+        if not self.connected:
+            return False
+        await self._emit({"op": "restart"})
+        return True
+
+
+class Launcher:
+    """Spawns the clusters, relays IPC between them and restarts any that die."""
+
+    def __init__(self, clusters: int, shard_count: int, ipc_path: str = CLUSTER_IPC_PATH,
+                 entry: str = "CodeX.py", ready_timeout: float = 300.0):
+        self.ranges = shard_ranges(shard_count, clusters)
+        self.shard_count = shard_count
+        self.ipc_path = ipc_path
+        self.entry = entry
+        self.ready_timeout = ready_timeout
+        self.processes: Dict[int, asyncio.subprocess.Process] = {}
+        self.writers: Dict[int, asyncio.StreamWriter] = {}
+        self.ready: Dict[int, asyncio.Event] = {i: asyncio.Event() for i in range(len(self.ranges))}
+        self.queries: Dict[int, dict] = {}
+        self.restarts: Dict[int, int] = {i: 0 for i in range(len(self.ranges))}
+        self.stopping = False
+        self._ids = itertools.count(1)
+
+    def env(self, cluster: int) -> Dict[str, str]:
+        shard_ids = self.ranges[cluster]
+        env = dict(os.environ)
+        env.update({
+            "AXON_CLUSTER_ID": str(cluster),
+            "AXON_CLUSTER_COUNT": str(len(self.ranges)),
+            "AXON_SHARD_COUNT": str(self.shard_count),
+            "AXON_SHARD_IDS": f"{shard_ids[0]}-{shard_ids[-1]}",
+            "AXON_IPC_PATH": self.ipc_path,
+        })
+        return env
+
+    async def spawn(self, cluster: int):
+        self.ready[cluster].clear()
+        process = await asyncio.create_subprocess_exec(sys.executable, self.entry, env=self.env(cluster))
+        self.processes[cluster] = process
+        shard_ids = self.ranges[cluster]
+        print(f"[launcher] cluster {cluster} (shards {shard_ids[0]}-{shard_ids[-1]}) started as pid {process.pid}")
+        asyncio.create_task(self.supervise(cluster, process))
+
+    async def supervise(self, cluster: int, process: asyncio.subprocess.Process):
+        code = await process.wait()
+        if self.stopping or self.processes.get(cluster) is not process:
+            return
+        self.restarts[cluster] += 1
+        delay = min(60, 2 ** min(self.restarts[cluster], 6))
+        print(f"[launcher] cluster {cluster} exited with {code}; restarting in {delay}s")
+        await asyncio.sleep(delay)
+        if not self.stopping:
+            await self.spawn(cluster)
+
+    async def start_all(self):
+        # one cluster at a time: identify is rate limited per bot, not per process
+        for cluster in range(len(self.ranges)):
+            await self.spawn(cluster)
+            try:
+                await asyncio.wait_for(self.ready[cluster].wait(), self.ready_timeout)
+            except asyncio.TimeoutError:
+                print(f"[launcher] cluster {cluster} not ready after {self.ready_timeout:.0f}s; starting the next one")
+
+    async def restart_all(self):
+        print("[launcher] restarting all clusters")
+        old = list(self.processes.values())
+        self.processes.clear()
+        for process in old:
+            if process.returncode is None:
+                process.terminate()
+        await asyncio.gather(*(process.wait() for process in old))
+        await self.start_all()
+
+    async def stop(self):
+        self.stopping = True
+        for process in self.processes.values():
+            if process.returncode is None:
+                process.terminate()
+        await asyncio.gather(*(process.wait() for process in self.processes.values()))
+
+    async def broadcast(self, payload: dict, exclude: Optional[int] = None):
+        for cluster, writer in list(self.writers.items()):
+            if cluster == exclude:
+                continue
+            try:
+                await _send(writer, payload)
+            except (ConnectionError, RuntimeError):
+                self.writers.pop(cluster, None)
+
+    async def run_query(self, origin: int, message: dict):
+        query_id = next(self._ids)
+        targets = set(self.writers)
+        state = {"replies": {}, "done": asyncio.Event(), "targets": targets}
+        self.queries[query_id] = state
+        await self.broadcast({"op": "query", "id": query_id, "event": message["event"], "data": message.get("data")})
+        try:
+            await asyncio.wait_for(state["done"].wait(), message.get("timeout", CLUSTER_QUERY_TIMEOUT))
+        except asyncio.TimeoutError:
+            pass
+        self.queries.pop(query_id, None)
+        writer = self.writers.get(origin)
+        if writer:
+            replies = [state["replies"][cluster] for cluster in sorted(state["replies"])]
+            await _send(writer, {"op": "result", "id": message["id"], "data": replies})
+
+    def on_reply(self, cluster: int, message: dict):
+        state = self.queries.get(message["id"])
+        if state is None:
+            return
+        state["replies"][cluster] = message.get("data")
+        if state["targets"] <= state["replies"].keys():
+            state["done"].set()
+
+    async def serve_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        cluster = None
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                message = json.loads(line)
+                op = message.get("op")
+                if op == "hello":
+                    cluster = message["cluster"]
+                    self.writers[cluster] = writer
+                elif op == "ready":
+                    print(f"[launcher] cluster {message['cluster']} ready with {message.get('guilds', 0)} guilds")
+                    self.restarts[message["cluster"]] = 0
+                    self.ready[message["cluster"]].set()
+                elif op == "publish":
+                    await self.broadcast(
+                        {"op": "event", "event": message["event"], "data": message.get("data"), "from": cluster},
+                        exclude=cluster
+                    )
+                elif op == "query":
+                    asyncio.create_task(self.run_query(cluster, message))
+                elif op == "reply":
+                    self.on_reply(cluster, message)
+                elif op == "restart":
+                    asyncio.create_task(self.restart_all())
+        finally:
+            if cluster is not None and self.writers.get(cluster) is writer:
+                del self.writers[cluster]
+                # a query waiting on this cluster should not wait out its timeout
+                for state in self.queries.values():
+                    state["targets"].discard(cluster)
+                    if state["targets"] <= state["replies"].keys():
+                        state["done"].set()
+            writer.close()
+
+    async def run(self):
+        if os.path.exists(self.ipc_path):
+            os.remove(self.ipc_path)
+        server = await asyncio.start_unix_server(self.serve_client, path=self.ipc_path, limit=LINE_LIMIT)
+        loop = asyncio.get_running_loop()
+        stopped = asyncio.Event()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(sig, stopped.set)
+
+        start = time.perf_counter()
+        await self.start_all()
+        print(f"[launcher] {len(self.ranges)} cluster(s), {self.shard_count} shard(s) up in {time.perf_counter() - start:.1f}s")
+        await stopped.wait()
+
+        print("[launcher] shutting down")
+        await self.stop()
+        server.close()
+        await server.wait_closed()
+        if os.path.exists(self.ipc_path):
+            os.remove(self.ipc_path)
+
+
+async def recommended_shards(token: str) -> Optional[int]:
+    import aiohttp
+    try:
+        async with aiohttp.ClientSession() as session:
+            async with session.get(
+                "https://discord.com/api/v10/gateway/bot",
+                headers={"Authorization": f"Bot {token}"}
+            ) as response:
+                if response.status != 200:
+                    return None
+                return (await response.json())["shards"]
+    except aiohttp.ClientError:
+        return None
+
+
+async def main(argv: Optional[List[str]] = None):
+    from dotenv import load_dotenv
+
+    from . import storage
+    from .migrations import run_startup_migrations
+
+    load_dotenv()
+    parser = argparse.ArgumentParser(prog="python -m core.cluster", description="Run the bot as several processes.")
+    parser.add_argument("--clusters", type=int, default=os.cpu_count() or 1, help="number of processes (default: CPU count)")
+    parser.add_argument("--shards", type=int, default=None, help="total shard count (default: Discord's recommendation)")
+    parser.add_argument("--ipc", default=CLUSTER_IPC_PATH, help="Unix socket path for the IPC channel")
+    args = parser.parse_args(argv)
+
+    shards = args.shards or await recommended_shards(os.getenv("TOKEN", "")) or SHARD_COUNT
+    if not storage.consolidated():
+        print("[launcher] AXON_STORAGE is not 'single'; the split database files will be shared by "
+              f"{args.clusters} processes through SQLite's file locking")
+
+    # once here rather than in every cluster, so they never race on a schema step
+    await run_startup_migrations()
+    await Launcher(args.clusters, shards, ipc_path=args.ipc).run()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
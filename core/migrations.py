@@ -0,0 +1,181 @@
+import os
+import time
+from typing import Dict, List, Optional
+
+import aiosqlite
+
+from . import storage
+
+DB_DIR = "db"
+
+# Ordered schema steps per database file. A file's version is kept in its own
+# ``PRAGMA user_version`` (in consolidated storage, a ``_schema_versions`` row
+# keyed by file name); step N takes it from N-1 to N and runs in a single
+# transaction together with the version bump, so a failed step leaves the file
+# on the previous version and is retried on the next start. Steps are only
+# ever appended, never edited, once they have shipped.
+MIGRATIONS: Dict[str, List[List[str]]] = {
+    "prefix.db": [
+        [
+            """
+            CREATE TABLE IF NOT EXISTS prefixes (
+                guild_id INTEGER PRIMARY KEY,
+                prefix TEXT NOT NULL
+            )
+            """,
+        ],
+    ],
+    "giveaways.db": [
+        [
+            """
+            CREATE TABLE IF NOT EXISTS Giveaway (
+                guild_id INTEGER,
+                host_id INTEGER,
+                start_time TIMESTAMP,
+                ends_at TIMESTAMP,
+                prize TEXT,
+                winners INTEGER,
+                message_id INTEGER,
+                channel_id INTEGER,
+                PRIMARY KEY (guild_id, message_id)
+            )
+            """,
+        ],
+    ],
+    "badges.db": [
+        [
+            """
+            CREATE TABLE IF NOT EXISTS badges (
+                user_id INTEGER PRIMARY KEY,
+                owner INTEGER DEFAULT 0,
+                staff INTEGER DEFAULT 0,
+                partner INTEGER DEFAULT 0,
+                sponsor INTEGER DEFAULT 0,
+                friend INTEGER DEFAULT 0,
+                early INTEGER DEFAULT 0,
+                vip INTEGER DEFAULT 0,
+                bug INTEGER DEFAULT 0
+            )
+            """,
+        ],
+    ],
+    "messages.db": [
+        [
+            """
+            CREATE TABLE IF NOT EXISTS messages (
+                guild_id INTEGER,
+                user_id INTEGER,
+                date TEXT,
+                count INTEGER
+            )
+            """,
+            # concurrent on_message handlers could insert the same day twice;
+            # fold those rows together so the key below can be unique
+            """
+            UPDATE messages SET count = (
+                SELECT SUM(m.count) FROM messages m
+                WHERE m.guild_id = messages.guild_id AND m.user_id = messages.user_id AND m.date = messages.date
+            )
+            WHERE rowid IN (
+                SELECT MIN(rowid) FROM messages GROUP BY guild_id, user_id, date HAVING COUNT(*) > 1
+            )
+            """,
+            """
+            DELETE FROM messages WHERE rowid NOT IN (
+                SELECT MIN(rowid) FROM messages GROUP BY guild_id, user_id, date
+            )
+            """,
+            "CREATE UNIQUE INDEX IF NOT EXISTS idx_messages_guild_user_date ON messages (guild_id, user_id, date)",
+        ],
+    ],
+    "autoresponder.db": [
+        [
+            """
+            CREATE TABLE IF NOT EXISTS autoresponses (
+                guild_id INTEGER,
+                name TEXT,
+                message TEXT,
+                PRIMARY KEY (guild_id, name)
+            )
+            """,
+            # every lookup is ``guild_id = ? AND LOWER(name) = ?``, which the primary key can't serve
+            "CREATE INDEX IF NOT EXISTS idx_autoresponses_guild_lower_name ON autoresponses (guild_id, LOWER(name))",
+        ],
+    ],
+    "block.db": [
+        [
+            """
+            CREATE TABLE IF NOT EXISTS user_blacklist (
+                user_id INTEGER PRIMARY KEY,
+                timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+            """,
+            """
+            CREATE TABLE IF NOT EXISTS guild_blacklist (
+                guild_id INTEGER PRIMARY KEY,
+                timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+            """,
+            # lookups used to bind str(id); make sure every stored ID is an integer
+            "UPDATE OR IGNORE user_blacklist SET user_id = CAST(user_id AS INTEGER) WHERE typeof(user_id) != 'integer'",
+            "DELETE FROM user_blacklist WHERE typeof(user_id) != 'integer'",
+            "UPDATE OR IGNORE guild_blacklist SET guild_id = CAST(guild_id AS INTEGER) WHERE typeof(guild_id) != 'integer'",
+            "DELETE FROM guild_blacklist WHERE typeof(guild_id) != 'integer'",
+        ],
+    ],
+    "presence.db": [
+        [
+            """
+            CREATE TABLE IF NOT EXISTS presence_guilds (
+                guild_id INTEGER,
+                feature TEXT,
+                PRIMARY KEY (guild_id, feature)
+            )
+            """,
+        ],
+    ],
+}
+
+
+async def migrate(path: str, steps: List[List[str]], key: Optional[str] = None) -> int:
+    """
+    Bring one database up to ``len(steps)``; returns how many steps ran.
+
+    Without ``key`` the version lives in the file's ``user_version``. With it,
+    ``path`` is shared by several logical files and the version is the
+    ``_schema_versions`` row for ``key``.
+    """
+    async with aiosqlite.connect(path) as db:
+        if key is None:
+            query, params = "PRAGMA user_version", ()
+        else:
+            await db.execute("CREATE TABLE IF NOT EXISTS _schema_versions (file TEXT PRIMARY KEY, version INTEGER)")
+            await db.commit()
+            query, params = "SELECT COALESCE(MAX(version), 0) FROM _schema_versions WHERE file = ?", (key,)
+        async with db.execute(query, params) as cursor:
+            (version,) = await cursor.fetchone()
+        for number, statements in enumerate(steps[version:], start=version + 1):
+            script = ";\n".join(statement.strip() for statement in statements)
+            if key is None:
+                bump = f"PRAGMA user_version = {number}"
+            else:
+                bump = f"INSERT OR REPLACE INTO _schema_versions (file, version) VALUES ('{key}', {number})"
+            try:
+                await db.executescript(f"BEGIN;\n{script};\n{bump};\nCOMMIT;")
+            except Exception:
+                if db.in_transaction:
+                    await db.rollback()
+                raise
+        return len(steps) - min(version, len(steps))
+
+
+async def run_startup_migrations(directory: str = DB_DIR):
+    os.makedirs(directory, exist_ok=True)
+    for file, steps in MIGRATIONS.items():
+        start = time.perf_counter()
+        if storage.consolidated():
+            applied = await migrate(storage.SINGLE_PATH, steps, key=file)
+        else:
+            applied = await migrate(os.path.join(directory, file), steps)
+        if applied:
+            print(f"Migrated {file} to version {len(steps)} ({applied} step(s), {(time.perf_counter() - start) * 1000:.0f}ms)")
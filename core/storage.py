@@ -0,0 +1,230 @@
+"""
+Storage backend selection.
+
+By default every feature keeps its own SQLite file, exactly as before. With
+``AXON_STORAGE=single`` every path handed to :func:`connect` or
+:func:`connect_sync` resolves to one WAL database (``AXON_STORAGE_PATH``,
+``db/axon.db`` by default). Table names are already unique across features, so
+queries run unchanged; the feature (source file) each table belongs to is
+recorded in ``_storage_tables``. Build the single file from the existing ones
+with ``python -m core.storage``.
+
+Consolidated mode gives a weaker guarantee for writes. Every cog shares one
+autocommit connection there, so each statement commits on its own and
+``await db.commit()`` does nothing: several writes followed by one commit are
+atomic with split files but not with a single one. Code that needs them to
+land together uses :class:`transaction`.
+"""
+
+import asyncio
+import glob
+import os
+import sqlite3
+import sys
+import time
+from typing import Dict, Iterable, List, Optional
+
+import aiosqlite
+
+MODE = os.getenv("AXON_STORAGE", "split").lower()
+SINGLE_PATH = os.getenv("AXON_STORAGE_PATH", "db/axon.db")
+
+# the split files a consolidated database is built from
+SOURCES = ["db/*.db", "*.db"]
+
+_shared: Optional[aiosqlite.Connection] = None
+_shared_lock = asyncio.Lock()
+
+
+def consolidated() -> bool:
+    return MODE == "single"
+
+
+def _prepare(conn: sqlite3.Connection):
+    conn.execute("PRAGMA journal_mode=WAL")
+    # in WAL mode NORMAL only syncs at checkpoints, not on every commit
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA busy_timeout=5000")
+
+
+async def shared_connection() -> aiosqlite.Connection:
+    """The process-wide connection to the consolidated database, opened on first use."""
+    global _shared
+    if _shared is None:
+        async with _shared_lock:
+            if _shared is None:
+                # autocommit: statements from different cogs interleave on this
+                # connection, so none of them may leave a transaction open for another
+                conn = await aiosqlite.connect(SINGLE_PATH, isolation_level=None)
+                await conn.execute("PRAGMA journal_mode=WAL")
+                await conn.execute("PRAGMA synchronous=NORMAL")
+                await conn.execute("PRAGMA busy_timeout=5000")
+                _shared = conn
+    return _shared
+
+
+class SharedConnection:
+    """
+    Stands in for ``aiosqlite.connect(...)`` in consolidated mode.
+
+    It can be awaited or used with ``async with`` like the real thing, and
+    forwards everything else to the shared connection. Closing it is a no-op,
+    and so is committing, since every statement has already committed.
+    """
+
+    __slots__ = ("_conn",)
+
+    def __init__(self):
+        self._conn: Optional[aiosqlite.Connection] = None
+
+    def __await__(self):
+        return self._open().__await__()
+
+    async def _open(self) -> "SharedConnection":
+        self._conn = await shared_connection()
+        return self
+
+    async def __aenter__(self) -> "SharedConnection":
+        return await self._open()
+
+    async def __aexit__(self, *exc):
+        pass
+
+    async def close(self):
+        pass
+
+    def __getattr__(self, name: str):
+        return getattr(self._conn, name)
+
+
+def connect(path: str, **kwargs):
+    """``aiosqlite.connect`` for ``path``, or the shared connection in consolidated mode."""
+    if consolidated():
+        return SharedConnection()
+    return aiosqlite.connect(path, **kwargs)
+
+
+def connect_sync(path: str, **kwargs) -> sqlite3.Connection:
+    """``sqlite3.connect`` for ``path``, or a connection to the consolidated file."""
+    if consolidated():
+        conn = sqlite3.connect(SINGLE_PATH, **kwargs)
+        conn.execute("PRAGMA busy_timeout=5000")
+        return conn
+    return sqlite3.connect(path, **kwargs)
+
+
+class transaction:
+    """
+    ``async with storage.transaction(path) as db:`` runs several statements atomically
+    and commits them on exit (don't call ``commit`` inside). It uses a connection
+    of its own, so in consolidated mode other cogs' statements can't end up
+    inside it. Without ``path`` it spans features, which needs consolidated mode.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        if path is None and not consolidated():
+            raise RuntimeError("Cross-feature transactions need AXON_STORAGE=single")
+        self.path = SINGLE_PATH if consolidated() else path
+        self.db: Optional[aiosqlite.Connection] = None
+
+    async def __aenter__(self) -> aiosqlite.Connection:
+        self.db = await aiosqlite.connect(self.path, isolation_level=None)
+        await self.db.execute("PRAGMA busy_timeout=5000")
+        await self.db.execute("BEGIN IMMEDIATE")
+        return self.db
+
+    async def __aexit__(self, exc_type, exc, tb):
+        try:
+            await self.db.execute("ROLLBACK" if exc_type else "COMMIT")
+        finally:
+            await self.db.close()
+
+
+async def close():
+    global _shared
+    if _shared is not None:
+        await _shared.close()
+        _shared = None
+
+
+def consolidate(sources: Iterable[str], target: str = SINGLE_PATH) -> Dict[str, int]:
+    """
+    Copy every table, index and schema version from ``sources`` into ``target``.
+
+    ``target`` must not exist yet, and two sources defining the same table is
+    an error, so nothing is ever merged or overwritten. The file is built next
+    to ``target`` and only moved into place once every source has been copied.
+    Returns the number of rows imported per table.
+    """
+    if os.path.exists(target):
+        raise FileExistsError(f"{target} already exists")
+
+    owners: Dict[str, str] = {}
+    for path in sources:
+        with sqlite3.connect(path) as src:
+            for (name,) in src.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'table' AND name NOT LIKE 'sqlite_%'"
+            ):
+                if name in owners:
+                    raise ValueError(f"Table {name!r} exists in both {owners[name]} and {path}")
+                owners[name] = path
+
+    os.makedirs(os.path.dirname(target) or ".", exist_ok=True)
+    building = target + ".building"
+    if os.path.exists(building):
+        os.remove(building)
+
+    counts: Dict[str, int] = {}
+    conn = sqlite3.connect(building, isolation_level=None)
+    try:
+        _prepare(conn)
+        conn.execute("CREATE TABLE _storage_tables (name TEXT PRIMARY KEY, source TEXT, imported_at REAL)")
+        conn.execute("CREATE TABLE _schema_versions (file TEXT PRIMARY KEY, version INTEGER)")
+        for path in sources:
+            conn.execute("ATTACH DATABASE ? AS src", (path,))
+            conn.execute("BEGIN")
+            schema = conn.execute(
+                "SELECT type, name, sql FROM src.sqlite_master WHERE sql IS NOT NULL AND name NOT LIKE 'sqlite_%' "
+                "ORDER BY type = 'table' DESC"
+            ).fetchall()
+            for kind, name, sql in schema:
+                conn.execute(sql)
+                if kind == "table":
+                    conn.execute(f'INSERT INTO main."{name}" SELECT * FROM src."{name}"')
+                    counts[name] = conn.execute(f'SELECT COUNT(*) FROM main."{name}"').fetchone()[0]
+                    conn.execute(
+                        "INSERT INTO _storage_tables (name, source, imported_at) VALUES (?, ?, ?)",
+                        (name, path, time.time())
+                    )
+            (version,) = conn.execute("PRAGMA src.user_version").fetchone()
+            conn.execute(
+                "INSERT INTO _schema_versions (file, version) VALUES (?, ?)",
+                (os.path.basename(path), version)
+            )
+            conn.execute("COMMIT")
+            conn.execute("DETACH DATABASE src")
+    except BaseException:
+        conn.close()
+        os.remove(building)
+        raise
+    conn.close()
+    os.replace(building, target)
+    return counts
+
+
+def _discover(patterns: List[str]) -> List[str]:
+    found = []
+    for pattern in patterns:
+        found.extend(sorted(glob.glob(pattern)))
+    return found
+
+
+if __name__ == "__main__":
+    target = sys.argv[1] if len(sys.argv) > 1 else SINGLE_PATH
+    paths = _discover(SOURCES)
+    start = time.perf_counter()
+    counts = consolidate(paths, target)
+    for name, rows in sorted(counts.items()):
+        print(f"{name}: {rows} row(s)")
+    print(f"Imported {len(counts)} table(s) from {len(paths)} file(s) into {target} in {time.perf_counter() - start:.2f}s")
+    print("Start the bot with AXON_STORAGE=single to use it.")
@@ -1,11 +1,12 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Optional, Union, ClassVar
+from typing import TYPE_CHECKING, Optional, ClassVar
 from io import BytesIO
 import asyncio
 import pathlib
 import random
 import re
+import threading
 
 import discord
 from discord.ext import commands
@@ -27,6 +28,69 @@ SHIPS: dict[str, tuple[int, tuple[int, int, int]]] = {
 }
 
 
+RED: tuple[int, int, int] = (255, 0, 0)
+GRAY: tuple[int, int, int] = (128, 128, 128)
+
+CELL: int = 50
+HALF: int = CELL // 2
+
+_atlas_lock = threading.Lock()
+_base: Optional[Image.Image] = None
+_sprites: dict[tuple, Image.Image] = {}
+
+
+def _base_image() -> Image.Image:
+    global _base
+    if _base is None:
+        with _atlas_lock:
+            if _base is None:
+                with Image.open(pathlib.Path(__file__).parent / "assets/battleship.png") as img:
+                    img.load()
+                    _base = img.copy()
+    return _base
+
+
+def _cell_center(coord: Coords) -> tuple[int, int]:
+    i, j = coord
+    return 75 + (j - 1) * CELL, 75 + (i - 1) * CELL
+
+
+def _sprite(key: tuple) -> Image.Image:
+    """
+    a single cell drawn on a transparent tile, keyed by what the cell shows:
+    ``("dot", fill)`` or ``("ship", color, diffs, hit)``
+    """
+    sprite = _sprites.get(key)
+    if sprite is None:
+        sprite = Image.new("RGBA", (CELL + 1, CELL + 1), (0, 0, 0, 0))
+        cur = ImageDraw.Draw(sprite)
+        if key[0] == "ship":
+            _, color, (d1, d2, d3, d4), hit = key
+            cur.rounded_rectangle(
+                (HALF - d1, HALF - d2, HALF + d3, HALF + d4), radius=5, fill=color
+            )
+            if hit:
+                cur.ellipse((HALF - 10, HALF - 10, HALF + 10, HALF + 10), fill=RED)
+        else:
+            cur.ellipse((HALF - 10, HALF - 10, HALF + 10, HALF + 10), fill=key[1])
+        sprite = _sprites.setdefault(key, sprite)
+    return sprite
+
+
+class Canvas:
+    """
+    a per-board copy of the base image plus what every cell currently shows,
+    so a render only blits the cells whose state changed since the last one
+    """
+
+    __slots__ = ("image", "cells", "png")
+
+    def __init__(self) -> None:
+        self.image: Image.Image = _base_image().copy()
+        self.cells: dict[Coords, tuple] = {}
+        self.png: Optional[bytes] = None
+
+
 class Ship:
     def __init__(
         self,
@@ -71,6 +135,8 @@ class Board:
         self.op_hits: list[Coords] = []
         self.op_misses: list[Coords] = []
 
+        self._canvases: dict[bool, Canvas] = {}
+
         if random:
             self._place_ships()
 
@@ -112,73 +178,70 @@ class Board:
     def won(self) -> bool:
         return all(all(ship.hits) for ship in self.ships)
 
-    def draw_dot(
-        self, cur: ImageDraw.Draw, x: int, y: int, fill: Union[int, tuple[int, ...]]
-    ) -> None:
-        x1, y1 = x - 10, y - 10
-        x2, y2 = x + 10, y + 10
-        cur.ellipse((x1, y1, x2, y2), fill=fill)
-
-    def draw_sq(
-        self, cur: ImageDraw.Draw, x: int, y: int, *, coord: Coords, ship: Ship
-    ) -> None:
+    def ship_diffs(self, coord: Coords, ship: Ship) -> tuple[int, int, int, int]:
         vertical = ship.vertical
         left_end = ship.span.index(coord) == 0
         right_end = ship.span.index(coord) == ship.size - 1
 
         if vertical and left_end:
-            diffs = (18, 18, 25, 18)
+            return (18, 18, 25, 18)
         elif vertical and right_end:
-            diffs = (25, 18, 18, 18)
+            return (25, 18, 18, 18)
         elif not vertical and left_end:
-            diffs = (18, 18, 18, 25)
+            return (18, 18, 18, 25)
         elif not vertical and right_end:
-            diffs = (18, 25, 18, 18)
+            return (18, 25, 18, 18)
         elif vertical:
-            diffs = (25, 18, 25, 18)
+            return (25, 18, 25, 18)
         else:
-            diffs = (18, 25, 18, 25)
-
-        d1, d2, d3, d4 = diffs
-        x1, y1 = x - d1, y - d2
-        x2, y2 = x + d3, y + d4
-        cur.rounded_rectangle((x1, y1, x2, y2), radius=5, fill=ship.color)
+            return (18, 25, 18, 25)
 
     def get_ship(self, coord: Coords) -> Optional[Ship]:
         if s := [ship for ship in self.ships if coord in ship.span]:
             return s[0]
 
+    def cell_states(self, hide: bool = False) -> dict[Coords, tuple]:
+        states: dict[Coords, tuple] = {}
+
+        if not hide:
+            for ship in self.ships:
+                for coord in ship.span:
+                    states[coord] = ("ship", ship.color, self.ship_diffs(coord, ship), False)
+
+        for coord in self.op_hits:
+            if hide or coord not in states:
+                states[coord] = ("dot", RED)
+            else:
+                states[coord] = states[coord][:3] + (True,)
+
+        for coord in self.op_misses:
+            states[coord] = ("dot", GRAY)
+        return states
+
     @executor()
     def to_image(self, hide: bool = False) -> BytesIO:
-        RED = (255, 0, 0)
-        GRAY = (128, 128, 128)
-
-        with Image.open(pathlib.Path(__file__).parent / "assets/battleship.png") as img:
-            cur = ImageDraw.Draw(img)
-
-            for i, y in zip(range(1, 11), range(75, 530, 50)):
-                for j, x in zip(range(1, 11), range(75, 530, 50)):
-                    coord = (i, j)
-                    if coord in self.op_misses:
-                        self.draw_dot(cur, x, y, fill=GRAY)
-
-                    elif coord in self.op_hits:
-                        if hide:
-                            self.draw_dot(cur, x, y, fill=RED)
-                        else:
-                            ship = self.get_ship(coord)
-                            self.draw_sq(cur, x, y, coord=coord, ship=ship)
-                            self.draw_dot(cur, x, y, fill=RED)
-
-                    elif ship := self.get_ship(coord):
-                        if not hide:
-                            self.draw_sq(cur, x, y, coord=coord, ship=ship)
+        canvas = self._canvases.get(hide)
+        states = self.cell_states(hide)
+
+        if canvas is None or any(
+            coord not in states for coord in canvas.cells
+        ):
+            canvas = self._canvases[hide] = Canvas()
+
+        for coord, key in states.items():
+            if canvas.cells.get(coord) != key:
+                x, y = _cell_center(coord)
+                sprite = _sprite(key)
+                canvas.image.paste(sprite, (x - HALF, y - HALF), sprite)
+                canvas.cells[coord] = key
+                canvas.png = None
+
+        if canvas.png is None:
             buffer = BytesIO()
-            img.save(buffer, "PNG")
+            canvas.image.save(buffer, "PNG", compress_level=1)
+            canvas.png = buffer.getvalue()
 
-        buffer.seek(0)
-        del img
-        return buffer
+        return BytesIO(canvas.png)
 
 
 class BattleShip:
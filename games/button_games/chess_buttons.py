@@ -60,7 +60,9 @@ class ChessInput(discord.ui.Modal, title="Make your move"):
             else:
                 embed = await game.make_embed()
 
-            return await interaction.response.edit_message(embed=embed, view=self.view)
+            return await interaction.response.edit_message(
+                embed=embed, view=self.view, attachments=[await game.make_file()]
+            )
 
 
 class ChessButton(WordInputButton):
@@ -134,7 +136,7 @@ class BetaChess(Chess):
         embed = await self.make_embed()
         self.view = ChessView(self, timeout=timeout)
 
-        self.message = await ctx.send(embed=embed, view=self.view)
+        self.message = await ctx.send(embed=embed, view=self.view, file=await self.make_file())
 
         await self.view.wait()
         return self.message
@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 from typing import Optional, Literal
-import random
 
 import discord
 from discord.ext import commands
@@ -35,6 +34,12 @@ class Twenty48_Button(discord.ui.Button["BaseView"]):
             self.view.stop()
             return await interaction.message.delete()
 
+        elif emoji == "💡":
+            move = self.game.best_move()
+            return await interaction.response.send_message(
+                f"Try {move}" if move else "There are no moves left!", ephemeral=True
+            )
+
         elif emoji == "➡️":
             self.game.move_right()
 
@@ -85,6 +90,7 @@ class BetaTwenty48(Twenty48):
         win_at: Literal[2048, 4096, 8192] = 8192,
         timeout: Optional[float] = None,
         delete_button: bool = False,
+        hint_button: bool = False,
         embed_color: DiscordColor = DEFAULT_COLOR,
         **kwargs,
     ) -> discord.Message:
@@ -101,6 +107,8 @@ class BetaTwenty48(Twenty48):
             the timeout for the view, by default None
         delete_button : bool, optional
             specifies whether or not to add a stop button, by default False
+        hint_button : bool, optional
+            specifies whether or not to add a button that suggests the next move, by default False
         embed_color : DiscordColor, optional
             the color of the game embed, by default DEFAULT_COLOR
 
@@ -115,8 +123,11 @@ class BetaTwenty48(Twenty48):
         self.player = ctx.author
         self.view = BaseView(timeout=timeout)
 
-        self.board[random.randrange(4)][random.randrange(4)] = 2
-        self.board[random.randrange(4)][random.randrange(4)] = 2
+        await self.load_tables()
+        self.place_initial()
+
+        if hint_button:
+            self._controls.append("💡")
 
         if delete_button:
             self._controls.append("⏹️")
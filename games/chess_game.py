@@ -8,10 +8,11 @@ from discord.ext import commands
 import chess
 
 from .utils import DiscordColor, DEFAULT_COLOR
+from .chess_render import render_board
 
 
 class Chess:
-    BASE_URL: ClassVar[str] = "http://www.fen-to-image.com/image/64/double/coords/"
+    IMAGE_NAME: ClassVar[str] = "chess.png"
 
     def __init__(self, *, white: discord.User, black: discord.User) -> None:
         self.white = white
@@ -31,7 +32,7 @@ class Chess:
     async def make_embed(self) -> discord.Embed:
         embed = discord.Embed(title="Chess Game", color=discord.Color.random())
         embed.description = f"**Turn:** `{self.turn}`\n**Color:** `{self.get_color()}`\n**Check:** `{self.board.is_check()}`"
-        embed.set_image(url=f"{self.BASE_URL}{self.board.board_fen()}")
+        embed.set_image(url=f"attachment://{self.IMAGE_NAME}")
 
         embed.add_field(
             name="Last Move",
@@ -65,9 +66,13 @@ class Chess:
                 f"Game over\nVariant end condition. | Score: `{results}`"
             )
 
-        embed.set_image(url=f"{self.BASE_URL}{self.board.board_fen()}")
+        embed.set_image(url=f"attachment://{self.IMAGE_NAME}")
         return embed
 
+    async def make_file(self) -> discord.File:
+        buffer = await render_board(self.board.board_fen())
+        return discord.File(buffer, self.IMAGE_NAME)
+
     async def start(
         self,
         ctx: commands.Context[commands.Bot],
@@ -99,7 +104,7 @@ class Chess:
         self.embed_color = discord.Color.random()
 
         embed = await self.make_embed()
-        self.message = await ctx.send(embed=embed, **kwargs)
+        self.message = await ctx.send(embed=embed, file=await self.make_file(), **kwargs)
 
         while not ctx.bot.is_closed():
 
@@ -128,10 +133,10 @@ class Chess:
             if self.board.is_game_over():
                 break
 
-            await self.message.edit(embed=embed)
+            await self.message.edit(embed=embed, attachments=[await self.make_file()])
 
         embed = await self.fetch_results()
-        await self.message.edit(embed=embed)
+        await self.message.edit(embed=embed, attachments=[await self.make_file()])
         await ctx.send("~ Game Over ~")
 
         return self.message
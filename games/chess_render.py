@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import pathlib
+import threading
+from functools import lru_cache
+from io import BytesIO
+from typing import Final, Optional
+
+import chess
+from PIL import Image, ImageDraw, ImageFont
+
+from .utils import executor
+
+__all__: tuple[str, ...] = (
+    "render_board",
+    "render_board_bytes",
+)
+
+SQ: Final[int] = 64
+MARGIN: Final[int] = 24
+SIZE: Final[int] = SQ * 8 + MARGIN * 2
+
+LIGHT: Final[tuple[int, int, int]] = (240, 217, 181)
+DARK: Final[tuple[int, int, int]] = (181, 136, 99)
+FRAME: Final[tuple[int, int, int]] = (49, 46, 43)
+COORD: Final[tuple[int, int, int]] = (220, 220, 220)
+
+PIECE_FILL: Final[dict[bool, tuple[int, int, int, int]]] = {
+    chess.WHITE: (250, 250, 250, 255),
+    chess.BLACK: (30, 30, 30, 255),
+}
+PIECE_TEXT: Final[dict[bool, tuple[int, int, int, int]]] = {
+    chess.WHITE: (30, 30, 30, 255),
+    chess.BLACK: (250, 250, 250, 255),
+}
+
+FONT_PATH: Final[str] = str(pathlib.Path(__file__).parent / "assets/ClearSans-Bold.ttf")
+
+_lock = threading.Lock()
+_board: Optional[Image.Image] = None
+_sprites: dict[str, Image.Image] = {}
+
+
+def _make_board() -> Image.Image:
+    img = Image.new("RGB", (SIZE, SIZE), FRAME)
+    cursor = ImageDraw.Draw(img)
+    font = ImageFont.truetype(FONT_PATH, 14)
+
+    for rank in range(8):
+        for file in range(8):
+            x = MARGIN + file * SQ
+            y = MARGIN + rank * SQ
+            color = LIGHT if (rank + file) % 2 == 0 else DARK
+            cursor.rectangle((x, y, x + SQ - 1, y + SQ - 1), fill=color)
+
+    for i in range(8):
+        center = MARGIN + i * SQ + SQ // 2
+        letter = chess.FILE_NAMES[i]
+        number = str(8 - i)
+        for pos in (MARGIN // 2, SIZE - MARGIN // 2):
+            cursor.text((center, pos), letter, fill=COORD, font=font, anchor="mm")
+            cursor.text((pos, center), number, fill=COORD, font=font, anchor="mm")
+    return img
+
+
+def _make_sprite(piece: chess.Piece) -> Image.Image:
+    sprite = Image.new("RGBA", (SQ, SQ), (0, 0, 0, 0))
+    cursor = ImageDraw.Draw(sprite)
+    font = ImageFont.truetype(FONT_PATH, 30)
+    pad = 8 if piece.piece_type != chess.PAWN else 14
+
+    cursor.ellipse(
+        (pad, pad, SQ - pad, SQ - pad),
+        fill=PIECE_FILL[piece.color],
+        outline=PIECE_TEXT[piece.color],
+        width=3,
+    )
+    label = piece.symbol().upper()
+    if piece.piece_type != chess.PAWN:
+        cursor.text((SQ // 2, SQ // 2), label, fill=PIECE_TEXT[piece.color], font=font, anchor="mm")
+    return sprite
+
+
+def _assets() -> tuple[Image.Image, dict[str, Image.Image]]:
+    global _board
+    if _board is None:
+        with _lock:
+            if _board is None:
+                for color in chess.COLORS:
+                    for piece_type in chess.PIECE_TYPES:
+                        piece = chess.Piece(piece_type, color)
+                        _sprites[piece.symbol()] = _make_sprite(piece)
+                _board = _make_board()
+    return _board, _sprites
+
+
+@lru_cache(maxsize=512)
+def render_board_bytes(board_fen: str) -> bytes:
+    """Render a piece-placement FEN to PNG bytes, cached per position."""
+    base, sprites = _assets()
+    board = chess.BaseBoard(board_fen)
+
+    img = base.copy()
+    for square, piece in board.piece_map().items():
+        x = MARGIN + chess.square_file(square) * SQ
+        y = MARGIN + (7 - chess.square_rank(square)) * SQ
+        sprite = sprites[piece.symbol()]
+        img.paste(sprite, (x, y), sprite)
+
+    buffer = BytesIO()
+    img.save(buffer, "PNG", optimize=False)
+    return buffer.getvalue()
+
+
+@executor()
+def render_board(board_fen: str) -> BytesIO:
+    return BytesIO(render_board_bytes(board_fen))
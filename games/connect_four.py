@@ -49,10 +49,9 @@ class ConnectFour:
         }
 
     def board_string(self) -> str:
-        board = "1️⃣2️⃣3️⃣4️⃣5️⃣6️⃣7️⃣\n"
-        for row in self.board:
-            board += "".join(row) + "\n"
-        return board
+        return "1️⃣2️⃣3️⃣4️⃣5️⃣6️⃣7️⃣\n" + "".join(
+            "".join(row) + "\n" for row in self.board
+        )
 
     def make_embed(self, *, status: bool) -> discord.Embed:
         embed = discord.Embed(color=discord.Color.random())
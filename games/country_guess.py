@@ -1,7 +1,6 @@
 import asyncio
 import difflib
 import os
-import pathlib
 import random
 from typing import Union, Optional
 from io import BytesIO
@@ -11,6 +10,7 @@ from discord.ext import commands
 from PIL import Image, ImageFilter, ImageOps
 
 from .utils import *
+from .registry import CountryAsset, get_countries, load_image
 
 
 class CountryGuesser:
@@ -40,50 +40,61 @@ class CountryGuesser:
         else:
             self.light_mode = light_mode
 
-        folder = "assets/country-flags" if self.is_flags else "assets/country-data"
-        self._countries_path = pathlib.Path(__file__).parent / folder
-        self.all_countries = os.listdir(self._countries_path)
+        self.all_countries: tuple[CountryAsset, ...] = get_countries(is_flags=self.is_flags)
         self.responses_count = 0
 
+    @staticmethod
+    def _open(image: Union[Image.Image, BytesIO, os.PathLike, str]) -> Image.Image:
+        if isinstance(image, Image.Image):
+            return image
+        if isinstance(image, BytesIO):
+            with Image.open(image) as img:
+                return img.convert("RGBA")
+        return load_image(os.fspath(image))
+
+    @staticmethod
+    def _invert(img: Image.Image) -> Image.Image:
+        r, g, b, a = img.split()
+        rgb = Image.merge("RGB", (r, g, b))
+        rgb = ImageOps.invert(rgb)
+        return Image.merge("RGBA", rgb.split() + (a,))
+
+    @staticmethod
+    def _blur(img: Image.Image) -> Image.Image:
+        return img.filter(ImageFilter.GaussianBlur(10))
+
+    @staticmethod
+    def _save(img: Image.Image) -> BytesIO:
+        buf = BytesIO()
+        img.save(buf, "PNG")
+        buf.seek(0)
+        return buf
+
     @executor()
     def invert_image(self, image_path: Union[BytesIO, os.PathLike, str]) -> BytesIO:
-        with Image.open(image_path) as img:
-            img = img.convert("RGBA")
-            r, g, b, a = img.split()
-            rgb = Image.merge("RGB", (r, g, b))
-            rgb = ImageOps.invert(rgb)
-            rgb = rgb.split()
-            img = Image.merge("RGBA", rgb + (a,))
-
-            buf = BytesIO()
-            img.save(buf, "PNG")
-            buf.seek(0)
-            return buf
+        return self._save(self._invert(self._open(image_path)))
 
     @executor()
     def blur_image(self, image_path: Union[BytesIO, os.PathLike, str]) -> BytesIO:
-        with Image.open(image_path) as img:
-            img = img.convert("RGBA")
-            img = img.filter(ImageFilter.GaussianBlur(10))
+        return self._save(self._blur(self._open(image_path)))
 
-            buf = BytesIO()
-            img.save(buf, "PNG")
-            buf.seek(0)
-            return buf
+    @executor()
+    def transform_image(self, image_path: Union[os.PathLike, str]) -> BytesIO:
+        img = self._open(image_path)
+        if self.hard_mode:
+            img = self._blur(img)
+        if self.light_mode:
+            img = self._invert(img)
+        return self._save(img)
 
     async def get_country(self) -> discord.File:
-        country_file = random.choice(self.all_countries)
-        self.country = country_file.strip()[:-4].lower()
+        country = random.choice(self.all_countries)
+        self.country = country.name
 
-        file = os.path.join(self._countries_path, country_file)
-
-        if self.hard_mode:
-            file = await self.blur_image(file)
-
-        if self.light_mode:
-            file = await self.invert_image(file)
+        if self.hard_mode or self.light_mode:
+            return discord.File(await self.transform_image(country.path), "country.png")
 
-        return discord.File(file, "country.png")
+        return discord.File(country.path, "country.png")
 
     def get_blanks(self) -> str:
         return " ".join("_" if char != " " else " " for char in self.country)
@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import os
+import pathlib
+import random
+import threading
+from functools import lru_cache
+from typing import Final, Iterator, NamedTuple
+
+from PIL import Image, ImageFont
+
+__all__: tuple[str, ...] = (
+    "ASSETS",
+    "WordList",
+    "CountryAsset",
+    "get_words",
+    "get_countries",
+    "load_image",
+    "load_font",
+)
+
+ASSETS: Final[pathlib.Path] = pathlib.Path(__file__).parent / "assets"
+
+_lock = threading.Lock()
+
+
+class WordList:
+    """
+    A word list loaded once and shared by every game instance
+
+    Membership checks go through a frozenset, random picks through a tuple.
+    """
+
+    __slots__ = ("words", "choices")
+
+    def __init__(self, words: tuple[str, ...]) -> None:
+        self.choices = words
+        self.words = frozenset(words)
+
+    def __contains__(self, word: object) -> bool:
+        return word in self.words
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.choices)
+
+    def __len__(self) -> int:
+        return len(self.choices)
+
+    def random(self) -> str:
+        return random.choice(self.choices)
+
+
+class CountryAsset(NamedTuple):
+    name: str
+    path: str
+
+
+_words: dict[str, WordList] = {}
+_countries: dict[str, tuple[CountryAsset, ...]] = {}
+
+
+def get_words(name: str = "words.txt") -> WordList:
+    words = _words.get(name)
+    if words is None:
+        with _lock:
+            words = _words.get(name)
+            if words is None:
+                with open(ASSETS / name, "r") as fp:
+                    lines = tuple(
+                        line.strip().lower() for line in fp if line.strip()
+                    )
+                words = _words[name] = WordList(lines)
+    return words
+
+
+def get_countries(*, is_flags: bool = False) -> tuple[CountryAsset, ...]:
+    folder = "country-flags" if is_flags else "country-data"
+    countries = _countries.get(folder)
+    if countries is None:
+        with _lock:
+            countries = _countries.get(folder)
+            if countries is None:
+                with os.scandir(ASSETS / folder) as it:
+                    countries = tuple(
+                        sorted(
+                            CountryAsset(entry.name.strip()[:-4].lower(), entry.path)
+                            for entry in it
+                            if entry.is_file() and entry.name.endswith(".png")
+                        )
+                    )
+                _countries[folder] = countries
+    return countries
+
+
+@lru_cache(maxsize=64)
+def load_image(path: str) -> Image.Image:
+    """Decode an image to RGBA once; callers must not mutate the result."""
+    with Image.open(path) as img:
+        img = img.convert("RGBA")
+    img.load()
+    return img
+
+
+@lru_cache(maxsize=None)
+def load_font(path: str, size: int) -> ImageFont.FreeTypeFont:
+    return ImageFont.truetype(path, size)
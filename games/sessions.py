@@ -0,0 +1,211 @@
+from __future__ import annotations
+
+import asyncio
+import itertools
+import time
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Iterable, Optional
+
+import discord
+from discord.ext import commands
+
+__all__: tuple[str, ...] = (
+    "GameSession",
+    "GameSessionManager",
+)
+
+
+class GameSession:
+    __slots__ = (
+        "id",
+        "kind",
+        "guild_id",
+        "channel_id",
+        "players",
+        "game",
+        "task",
+        "timeout",
+        "last_active",
+    )
+
+    def __init__(
+        self,
+        id: int,
+        kind: str,
+        guild_id: int,
+        channel_id: int,
+        players: tuple[int, ...],
+        game: Any,
+        task: Optional[asyncio.Task],
+        timeout: Optional[float],
+    ) -> None:
+        self.id = id
+        self.kind = kind
+        self.guild_id = guild_id
+        self.channel_id = channel_id
+        self.players = players
+        self.game = game
+        self.task = task
+        self.timeout = timeout
+        self.last_active = time.monotonic()
+
+    def _attrs(self, kind: type) -> list[Any]:
+        if not hasattr(self.game, "__dict__"):
+            return []
+        return [value for value in vars(self.game).values() if isinstance(value, kind)]
+
+    def views(self) -> list[discord.ui.View]:
+        return self._attrs(discord.ui.View)
+
+    def message_ids(self) -> set[int]:
+        # read on every call: some games replace their message as they go
+        return {message.id for message in self._attrs(discord.Message)}
+
+
+class GameSessionManager:
+    """
+    Tracks running games and enforces per-guild / per-user limits
+
+    Games are started without their own timeout; a single sweeper task
+    expires sessions that have been idle for longer than their ``timeout``,
+    stopping the game's views (or cancelling the game task for games that
+    are not view based). Activity is a player using one of the game's
+    messages: a component or reaction on it, or, for games played by
+    typing, a message in the game's channel.
+    """
+
+    def __init__(
+        self,
+        *,
+        per_guild: int = 50,
+        per_user: int = 3,
+        sweep_interval: float = 5.0,
+    ) -> None:
+        self.per_guild = per_guild
+        self.per_user = per_user
+        self.sweep_interval = sweep_interval
+
+        self.sessions: dict[int, GameSession] = {}
+        self._by_guild: dict[int, set[int]] = {}
+        self._by_user: dict[int, set[int]] = {}
+        self._ids = itertools.count(1)
+        self._sweeper: Optional[asyncio.Task] = None
+
+    def __len__(self) -> int:
+        return len(self.sessions)
+
+    def _check(self, guild_id: int, players: Iterable[int], limits: dict[str, int]) -> None:
+        per_guild = limits.get("per_guild", self.per_guild)
+        per_user = limits.get("per_user", self.per_user)
+        if len(self._by_guild.get(guild_id, ())) >= per_guild:
+            raise commands.MaxConcurrencyReached(per_guild, commands.BucketType.guild)
+        for player in players:
+            if len(self._by_user.get(player, ())) >= per_user:
+                raise commands.MaxConcurrencyReached(per_user, commands.BucketType.user)
+
+    @asynccontextmanager
+    async def open(
+        self,
+        ctx: commands.Context[commands.Bot],
+        kind: str,
+        game: Any,
+        *,
+        players: Iterable[discord.abc.User] = (),
+        timeout: Optional[float] = 300,
+        **limits: int,
+    ) -> AsyncIterator[GameSession]:
+        player_ids = tuple({ctx.author.id, *(p.id for p in players if p is not None)})
+        guild_id = ctx.guild.id if ctx.guild else 0
+        self._check(guild_id, player_ids, limits)
+
+        session = GameSession(
+            next(self._ids),
+            kind,
+            guild_id,
+            ctx.channel.id,
+            player_ids,
+            game,
+            asyncio.current_task(),
+            timeout,
+        )
+        self._add(session)
+        try:
+            yield session
+        finally:
+            self._remove(session)
+
+    def _add(self, session: GameSession) -> None:
+        self.sessions[session.id] = session
+        self._by_guild.setdefault(session.guild_id, set()).add(session.id)
+        for player in session.players:
+            self._by_user.setdefault(player, set()).add(session.id)
+        if self._sweeper is None or self._sweeper.done():
+            self._sweeper = asyncio.get_running_loop().create_task(self._sweep())
+
+    def _remove(self, session: GameSession) -> None:
+        if self.sessions.pop(session.id, None) is None:
+            return
+        ids = self._by_guild.get(session.guild_id)
+        if ids is not None:
+            ids.discard(session.id)
+            if not ids:
+                del self._by_guild[session.guild_id]
+        for player in session.players:
+            ids = self._by_user.get(player)
+            if ids is not None:
+                ids.discard(session.id)
+                if not ids:
+                    del self._by_user[player]
+
+    def _player_sessions(self, user_id: int) -> list[GameSession]:
+        return [self.sessions[session_id] for session_id in self._by_user.get(user_id, ())]
+
+    def touch(self, user_id: int, message_id: int) -> None:
+        """Record activity by ``user_id`` on message ``message_id`` (an interaction or reaction)."""
+        now = time.monotonic()
+        for session in self._player_sessions(user_id):
+            if message_id in session.message_ids():
+                session.last_active = now
+
+    def touch_channel(self, user_id: int, channel_id: int) -> None:
+        """Record a message by ``user_id`` in ``channel_id``; only games without views are played that way."""
+        now = time.monotonic()
+        for session in self._player_sessions(user_id):
+            if session.channel_id == channel_id and not session.views():
+                session.last_active = now
+
+    async def _expire(self, session: GameSession) -> None:
+        views = session.views()
+        for view in views:
+            try:
+                await view.on_timeout()
+            except Exception:
+                pass
+            view.stop()
+        if not views and session.task is not None:
+            session.task.cancel()
+        self._remove(session)
+
+    async def _sweep(self) -> None:
+        while self.sessions:
+            await asyncio.sleep(self.sweep_interval)
+            now = time.monotonic()
+            expired = [
+                session
+                for session in self.sessions.values()
+                if session.timeout is not None
+                and now - session.last_active > session.timeout
+            ]
+            for session in expired:
+                await self._expire(session)
+
+    def stats(self) -> dict[str, Any]:
+        kinds: dict[str, int] = {}
+        for session in self.sessions.values():
+            kinds[session.kind] = kinds.get(session.kind, 0) + 1
+        return {
+            "sessions": len(self.sessions),
+            "guilds": len(self._by_guild),
+            "players": len(self._by_user),
+            "kinds": kinds,
+        }
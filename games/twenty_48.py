@@ -1,18 +1,20 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Literal, Optional
+from typing import TYPE_CHECKING, Final, Literal, Optional
+from array import array
 from io import BytesIO
 import os
 import asyncio
 import random
 import pathlib
-import itertools
+import threading
 
 import discord
 from discord.ext import commands
-from PIL import Image, ImageDraw, ImageFont
+from PIL import Image, ImageDraw
 
 from .utils import *
+from .registry import ASSETS, load_font
 
 if TYPE_CHECKING:
     from typing_extensions import TypeAlias
@@ -56,6 +58,240 @@ async def create_2048_emojis(
     return result
 
 
+ROW_MASK: Final[int] = 0xFFFF
+
+_tables_lock = threading.Lock()
+_ROW_LEFT: Optional[array] = None
+_ROW_RIGHT: Optional[array] = None
+_COL_UP: Optional[array] = None
+_COL_DOWN: Optional[array] = None
+_ROW_HEUR: Optional[array] = None
+
+
+def _unpack_col(row: int) -> int:
+    return (
+        (row & 0xF)
+        | (row & 0xF0) << 12
+        | (row & 0xF00) << 24
+        | (row & 0xF000) << 36
+    )
+
+
+def _reverse_row(row: int) -> int:
+    return (
+        (row >> 12)
+        | (row >> 4) & 0xF0
+        | (row << 4) & 0xF00
+        | (row << 12) & 0xF000
+    )
+
+
+def _build_tables() -> None:
+    """
+    precomputes the result of sliding every possible row to the left
+
+    a board is 16 nibbles, each holding a tile's exponent (0 for empty),
+    row ``i`` lives in bits ``16 * i`` and cell ``j`` of a row in bits ``4 * j``
+    so a whole move is four lookups into these tables.
+    """
+    global _ROW_LEFT, _ROW_RIGHT, _COL_UP, _COL_DOWN, _ROW_HEUR
+
+    row_left = array("H", bytes(2 * 65536))
+    row_right = array("H", bytes(2 * 65536))
+    col_up = array("Q", bytes(8 * 65536))
+    col_down = array("Q", bytes(8 * 65536))
+    row_heur = array("d", bytes(8 * 65536))
+
+    for row in range(65536):
+        cells = [(row >> (4 * j)) & 0xF for j in range(4)]
+
+        empty = cells.count(0)
+        merges = 0
+        prev = counter = 0
+        for cell in cells:
+            if not cell:
+                continue
+            if cell == prev:
+                counter += 1
+            elif counter:
+                merges += 1 + counter
+                counter = 0
+            prev = cell
+        if counter:
+            merges += 1 + counter
+        mono_left = mono_right = 0.0
+        for j in range(3):
+            if cells[j] > cells[j + 1]:
+                mono_left += cells[j] ** 4 - cells[j + 1] ** 4
+            else:
+                mono_right += cells[j + 1] ** 4 - cells[j] ** 4
+        row_heur[row] = (
+            200_000.0
+            + 270.0 * empty
+            + 700.0 * merges
+            - 47.0 * min(mono_left, mono_right)
+            - 11.0 * sum(cell**3.5 for cell in cells)
+        )
+
+        tiles = [cell for cell in cells if cell]
+        result: list[int] = []
+        i = 0
+        while i < len(tiles):
+            if i + 1 < len(tiles) and tiles[i] == tiles[i + 1] and tiles[i] != 0xF:
+                result.append(tiles[i] + 1)
+                i += 2
+            else:
+                result.append(tiles[i])
+                i += 1
+
+        moved = 0
+        for j, cell in enumerate(result):
+            moved |= cell << (4 * j)
+
+        rev_row = _reverse_row(row)
+        rev_moved = _reverse_row(moved)
+
+        row_left[row] = moved
+        row_right[rev_row] = rev_moved
+        col_up[row] = _unpack_col(moved)
+        col_down[rev_row] = _unpack_col(rev_moved)
+
+    _ROW_RIGHT, _COL_UP, _COL_DOWN, _ROW_HEUR = row_right, col_up, col_down, row_heur
+    _ROW_LEFT = row_left
+
+
+def _ensure_tables() -> None:
+    if _ROW_LEFT is None:
+        with _tables_lock:
+            if _ROW_LEFT is None:
+                _build_tables()
+
+
+def _transpose(board: int) -> int:
+    a1 = board & 0xF0F00F0FF0F00F0F
+    a2 = board & 0x0000F0F00000F0F0
+    a3 = board & 0x0F0F00000F0F0000
+    a = a1 | (a2 << 12) | (a3 >> 12)
+    b1 = a & 0xFF00FF0000FF00FF
+    b2 = a & 0x00FF00FF00000000
+    b3 = a & 0x00000000FF00FF00
+    return b1 | (b2 >> 24) | (b3 << 24)
+
+
+def _move_rows(board: int, table: array) -> int:
+    return (
+        table[board & ROW_MASK]
+        | table[(board >> 16) & ROW_MASK] << 16
+        | table[(board >> 32) & ROW_MASK] << 32
+        | table[(board >> 48) & ROW_MASK] << 48
+    )
+
+
+def _move_cols(board: int, table: array) -> int:
+    t = _transpose(board)
+    return (
+        table[t & ROW_MASK]
+        | table[(t >> 16) & ROW_MASK] << 4
+        | table[(t >> 32) & ROW_MASK] << 8
+        | table[(t >> 48) & ROW_MASK] << 12
+    )
+
+
+def _empty_cells(board: int) -> list[int]:
+    return [i for i in range(16) if not (board >> (4 * i)) & 0xF]
+
+
+def _heuristic(board: int) -> float:
+    t = _transpose(board)
+    return (
+        _ROW_HEUR[board & ROW_MASK]
+        + _ROW_HEUR[(board >> 16) & ROW_MASK]
+        + _ROW_HEUR[(board >> 32) & ROW_MASK]
+        + _ROW_HEUR[(board >> 48) & ROW_MASK]
+        + _ROW_HEUR[t & ROW_MASK]
+        + _ROW_HEUR[(t >> 16) & ROW_MASK]
+        + _ROW_HEUR[(t >> 32) & ROW_MASK]
+        + _ROW_HEUR[(t >> 48) & ROW_MASK]
+    )
+
+
+def _moves(board: int) -> dict[str, int]:
+    return {
+        "⬅️": _move_rows(board, _ROW_LEFT),
+        "➡️": _move_rows(board, _ROW_RIGHT),
+        "⬆️": _move_cols(board, _COL_UP),
+        "⬇️": _move_cols(board, _COL_DOWN),
+    }
+
+
+def _expectimax(board: int, depth: int) -> float:
+    empty = _empty_cells(board)
+    if not empty:
+        return _heuristic(board)
+
+    total = 0.0
+    for i in empty:
+        spawned = board | 1 << (4 * i)
+        best = 0.0
+        if depth > 0:
+            for moved in _moves(spawned).values():
+                if moved != spawned:
+                    best = max(best, _expectimax(moved, depth - 1))
+        else:
+            best = _heuristic(spawned)
+        total += best
+    return total / len(empty)
+
+
+TILE_COLORS: Final[dict[int, tuple[tuple[int, int, int], int]]] = {
+    0: ((204, 192, 179), 50),
+    2: ((237, 227, 217), 50),
+    4: ((237, 224, 200), 50),
+    8: ((242, 177, 121), 50),
+    16: ((245, 149, 100), 50),
+    32: ((246, 124, 95), 50),
+    64: ((246, 94, 59), 50),
+    128: ((236, 206, 113), 40),
+    256: ((236, 203, 96), 40),
+    512: ((236, 199, 80), 40),
+    1024: ((236, 196, 62), 30),
+    2048: ((236, 193, 46), 30),
+    4096: ((59, 57, 49), 30),
+    8192: ((59, 57, 49), 30),
+}
+
+LIGHT_CLR: Final[tuple[int, int, int]] = (249, 246, 242)
+DARK_CLR: Final[tuple[int, int, int]] = (119, 110, 101)
+BG_CLR: Final[tuple[int, int, int]] = (187, 173, 160)
+
+BORDER_W: Final[int] = 20
+SQ_S: Final[int] = 100
+SPACE_W: Final[int] = 15
+IMG_LENGTH: Final[int] = BORDER_W * 2 + SQ_S * 4 + SPACE_W * 3
+
+_sprites: dict[int, Image.Image] = {}
+
+
+def _tile_sprite(value: int) -> Image.Image:
+    sprite = _sprites.get(value)
+    if sprite is None:
+        color, fsize = TILE_COLORS.get(value, TILE_COLORS[8192])
+        sprite = Image.new("RGBA", (SQ_S + 1, SQ_S + 1), (0, 0, 0, 0))
+        cursor = ImageDraw.Draw(sprite)
+        cursor.rounded_rectangle((0, 0, SQ_S, SQ_S), radius=5, width=0, fill=color)
+        if value:
+            font = load_font(str(ASSETS / "ClearSans-Bold.ttf"), fsize)
+            cursor.text(
+                (SQ_S / 2, SQ_S / 2),
+                str(value),
+                font=font,
+                anchor="mm",
+                fill=DARK_CLR if value in (2, 4) else LIGHT_CLR,
+            )
+        sprite = _sprites.setdefault(value, sprite)
+    return sprite
+
+
 class Twenty48:
     """
     Twenty48 Game
@@ -73,7 +309,7 @@ class Twenty48:
         self.embed_color: Optional[DiscordColor] = None
         self.embed: Optional[discord.Embed] = None
 
-        self.board: Board = [[0 for _ in range(4)] for _ in range(4)]
+        self.state: int = 0
         self.message: Optional[discord.Message] = None
 
         self._controls = ["⬅️", "➡️", "⬆️", "⬇️"]
@@ -85,94 +321,45 @@ class Twenty48:
                 "discord.py versions under v2.0.0 do not support rendering images since editing files is new in 2.0"
             )
 
-        if self._render_image:
-            self._color_mapping: dict[str, tuple[tuple[int, int, int], int]] = {
-                "0": ((204, 192, 179), 50),
-                "2": ((237, 227, 217), 50),
-                "4": ((237, 224, 200), 50),
-                "8": ((242, 177, 121), 50),
-                "16": ((245, 149, 100), 50),
-                "32": ((246, 124, 95), 50),
-                "64": ((246, 94, 59), 50),
-                "128": ((236, 206, 113), 40),
-                "256": ((236, 203, 96), 40),
-                "512": ((236, 199, 80), 40),
-                "1024": ((236, 196, 62), 30),
-                "2048": ((236, 193, 46), 30),
-                "4096": ((59, 57, 49), 30),
-                "8192": ((59, 57, 49), 30),
-            }
-
-            self.LIGHT_CLR = (249, 246, 242)
-            self.DARK_CLR = (119, 110, 101)
-            self.BG_CLR = (187, 173, 160)
-
-            self.BORDER_W = 20
-            self.SQ_S = 100
-            self.SPACE_W = 15
-
-            self.IMG_LENGTH = self.BORDER_W * 2 + self.SQ_S * 4 + self.SPACE_W * 3
-
-            self._font = ImageFont.truetype(
-                str(pathlib.Path(__file__).parent / "assets/ClearSans-Bold.ttf"), 50
-            )
+    @property
+    def board(self) -> Board:
+        state = self.state
+        return [
+            [
+                1 << exp if (exp := (state >> (16 * i + 4 * j)) & 0xF) else 0
+                for j in range(4)
+            ]
+            for i in range(4)
+        ]
 
-    def _reverse(self, board: Board) -> Board:
-        return [row[::-1] for row in board]
-
-    def _transp(self, board: Board) -> Board:
-        return [[board[i][j] for i in range(4)] for j in range(4)]
-
-    def _merge(self, board: Board) -> Board:
-        for i in range(4):
-            for j in range(3):
-                tile = board[i][j]
-                if tile == board[i][j + 1] and tile != 0:
-                    board[i][j] *= 2
-                    board[i][j + 1] = 0
-        return board
-
-    def _compress(self, board: Board) -> Board:
-        new_board = [[0 for _ in range(4)] for _ in range(4)]
-        for i in range(4):
-            pos = 0
-            for j in range(4):
-                if board[i][j] != 0:
-                    new_board[i][pos] = board[i][j]
-                    pos += 1
-        return new_board
+    @board.setter
+    def board(self, board: Board) -> None:
+        state = 0
+        for i, row in enumerate(board):
+            for j, tile in enumerate(row):
+                if tile:
+                    state |= (tile.bit_length() - 1) << (16 * i + 4 * j)
+        self.state = state
 
     def move_left(self) -> None:
-        stage = self._compress(self.board)
-        stage = self._merge(stage)
-        stage = self._compress(stage)
-        self.board = stage
+        self.state = _move_rows(self.state, _ROW_LEFT)
 
     def move_right(self) -> None:
-        stage = self._reverse(self.board)
-        stage = self._compress(stage)
-        stage = self._merge(stage)
-        stage = self._compress(stage)
-        stage = self._reverse(stage)
-        self.board = stage
+        self.state = _move_rows(self.state, _ROW_RIGHT)
 
     def move_up(self) -> None:
-        stage = self._transp(self.board)
-        stage = self._compress(stage)
-        stage = self._merge(stage)
-        stage = self._compress(stage)
-        stage = self._transp(stage)
-        self.board = stage
+        self.state = _move_cols(self.state, _COL_UP)
 
     def move_down(self) -> None:
-        stage = self._transp(self.board)
-        stage = self._reverse(stage)
-        stage = self._compress(stage)
-        stage = self._merge(stage)
-        stage = self._compress(stage)
-        stage = self._reverse(stage)
-        stage = self._transp(stage)
-        self.board = stage
+        self.state = _move_cols(self.state, _COL_DOWN)
+
+    async def load_tables(self) -> None:
+        if _ROW_LEFT is None:
+            await asyncio.get_running_loop().run_in_executor(None, _ensure_tables)
+
+    def place_initial(self) -> None:
+        for _ in range(2):
+            self.state |= 1 << (4 * random.randrange(16))
 
     def spawn_new(self) -> bool:
         """
@@ -183,36 +370,51 @@ class Twenty48:
         bool
             returns whether or not the game is lost
         """
-        board = self.board
-        zeroes = [
-            (j, i) for j, sub in enumerate(board) for i, el in enumerate(sub) if el == 0
-        ]
+        zeroes = _empty_cells(self.state)
 
         if not zeroes:
             return True
         else:
-            i, j = random.choice(zeroes)
-            board[i][j] = 2
+            self.state |= 1 << (4 * random.choice(zeroes))
             return False
 
-    def number_to_emoji(self) -> str:
-        board = self.board
-        game_string = ""
+    def best_move(self, depth: int = 1) -> Optional[str]:
+        """
+        suggests the next move with a shallow expectimax search
 
-        emoji_array = [
-            [self._conversion.get(str(l), f"`{l}` ") for l in row] for row in board
-        ]
+        Parameters
+        ----------
+        depth : int, optional
+            how many moves ahead to look past the next one, by default 1
+
+        Returns
+        -------
+        Optional[str]
+            the control emoji of the suggested move, None if no move changes the board
+        """
+        best: Optional[str] = None
+        best_score = -1.0
+        for emoji, moved in _moves(self.state).items():
+            if moved == self.state:
+                continue
+            score = _expectimax(moved, depth)
+            if score > best_score:
+                best, best_score = emoji, score
+        return best
 
-        for row in emoji_array:
-            game_string += "".join(row) + "\n"
-        return game_string
+    def number_to_emoji(self) -> str:
+        return "".join(
+            "".join(self._conversion.get(str(l), f"`{l}` ") for l in row) + "\n"
+            for row in self.board
+        )
 
     def check_win(self) -> bool:
-        flattened = itertools.chain(*self.board)
+        state = self.state
+        exponents = {(state >> (4 * i)) & 0xF for i in range(16)}
 
         for num in (2048, 4096, 8192):
-            if num in flattened:
-                if num == 2048:
+            if num.bit_length() - 1 in exponents:
+                if num == 2048 or self.embed is None:
                     self.embed = discord.Embed(description="", color=discord.Color.random())
                 self.embed.description += f"⭐: Congrats! You hit **{num}**!\n"
 
@@ -223,35 +425,14 @@ class Twenty48:
 
     @executor()
     def render_image(self) -> discord.File:
-        SQ = self.SQ_S
-        with Image.new("RGB", (self.IMG_LENGTH, self.IMG_LENGTH), self.BG_CLR) as img:
-            cursor = ImageDraw.Draw(img)
-
-            x = y = self.BORDER_W
-            for row in self.board:
-                for tile in row:
-                    tile = str(tile)
-                    color, fsize = self._color_mapping.get(tile)
-                    font = self._font.font_variant(size=fsize)
-                    cursor.rounded_rectangle(
-                        (x, y, x + SQ, y + SQ), radius=5, width=0, fill=color
-                    )
-
-                    if tile != "0":
-                        text_fill = (
-                            self.DARK_CLR if tile in ("2", "4") else self.LIGHT_CLR
-                        )
-                        cursor.text(
-                            (x + SQ / 2, y + SQ / 2),
-                            tile,
-                            font=font,
-                            anchor="mm",
-                            fill=text_fill,
-                        )
-
-                    x += SQ + self.SPACE_W
-                x = self.BORDER_W
-                y += SQ + self.SPACE_W
+        state = self.state
+        with Image.new("RGB", (IMG_LENGTH, IMG_LENGTH), BG_CLR) as img:
+            for i in range(16):
+                exp = (state >> (4 * i)) & 0xF
+                sprite = _tile_sprite(1 << exp if exp else 0)
+                x = BORDER_W + (i % 4) * (SQ_S + SPACE_W)
+                y = BORDER_W + (i // 4) * (SQ_S + SPACE_W)
+                img.paste(sprite, (x, y), sprite)
 
             buf = BytesIO()
             img.save(buf, "PNG")
@@ -296,8 +477,8 @@ class Twenty48:
         self.embed_color = embed_color
         self.player = ctx.author
 
-        self.board[random.randrange(4)][random.randrange(4)] = 2
-        self.board[random.randrange(4)][random.randrange(4)] = 2
+        await self.load_tables()
+        self.place_initial()
 
         if self._render_image:
             image = await self.render_image()
@@ -6,17 +6,16 @@ from io import BytesIO
 
 import textwrap
 import time
-import random
 import asyncio
 import aiohttp
 import difflib
-import pathlib
 
-from PIL import Image, ImageDraw, ImageFont
+from PIL import Image, ImageDraw
 import discord
 from discord.ext import commands
 
 from .utils import *
+from .registry import ASSETS, get_words, load_font
 
 
 class UserData(TypedDict):
@@ -43,7 +42,7 @@ class TypeRacer:
 
         text = "\n".join(textwrap.wrap(text, width=25))
 
-        font = ImageFont.truetype(font, 30)
+        font = load_font(font, 30)
         x, y = font.getsize_multiline(text)
 
         with Image.new("RGB", (x + 20, y + 30), (0, 0, 30)) as image:
@@ -180,7 +179,6 @@ class TypeRacer:
             requesting the quote failed
         """
         self.embed_color = embed_color
-        parent = pathlib.Path(__file__).parent
 
         if not words_mode:
             async with aiohttp.ClientSession() as session:
@@ -194,18 +192,15 @@ class TypeRacer:
                         )
 
         else:
-            with open(parent / "assets/words.txt", "r") as wordsfp:
-                words = wordsfp.read().splitlines()
-                text = " ".join(random.choice(words).lower() for _ in range(8))
+            words = get_words()
+            text = " ".join(words.random() for _ in range(8))
 
         if max_quote_length is not None:
             if len(text) > max_quote_length:
                 text = textwrap.shorten(text, width=max_quote_length, placeholder="")
 
         if not path_to_text_font:
-            path_to_text_font = str(
-                parent / "assets/segoe-ui-semilight-411.ttf"
-            )
+            path_to_text_font = str(ASSETS / "segoe-ui-semilight-411.ttf")
 
         buffer = await self._tr_img(text, path_to_text_font)
 
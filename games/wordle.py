@@ -1,16 +1,15 @@
 from __future__ import annotations
 
-import pathlib
-import random
 import asyncio
 from typing import Optional, Final
 from io import BytesIO
 
 import discord
 from discord.ext import commands
-from PIL import Image, ImageDraw, ImageFont
+from PIL import Image, ImageDraw
 
 from .utils import *
+from .registry import ASSETS, get_words, load_font
 
 BORDER: Final[int] = 40
 SQ: Final[int] = 100
@@ -33,14 +32,9 @@ class Wordle:
     def __init__(self, word: Optional[str] = None, *, text_size: int = 55) -> None:
         self.embed_color: Optional[DiscordColor] = None
 
-        parent = pathlib.Path(__file__).parent
-        self._valid_words = tuple(
-            open(parent / "assets/words.txt", "r").read().splitlines()
-        )
+        self._valid_words = get_words()
         self._text_size = text_size
-        self._font = ImageFont.truetype(
-            str(parent / "assets/HelveticaNeuBold.ttf"), self._text_size
-        )
+        self._font = load_font(str(ASSETS / "HelveticaNeuBold.ttf"), self._text_size)
 
         self.guesses: list[list[dict[str, str]]] = []
 
@@ -53,7 +47,7 @@ class Wordle:
 
             self.word = word
         else:
-            self.word: str = random.choice(self._valid_words)
+            self.word: str = self._valid_words.random()
 
     def parse_guess(self, guess: str) -> bool:
         self.guesses.append([])
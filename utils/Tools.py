@@ -2,24 +2,10 @@ import json, sys, os
 import discord
 from discord.ext import commands
 from core import Context
-import aiosqlite
-import asyncio
-
-async def setup_db():
-  async with aiosqlite.connect('db/prefix.db') as db:
-    await db.execute('''
-      CREATE TABLE IF NOT EXISTS prefixes (
-        guild_id INTEGER PRIMARY KEY,
-        prefix TEXT NOT NULL
-      )
-    ''')
-    await db.commit()
-
-
-asyncio.run(setup_db())
+from core import storage
 
 async def is_topcheck_enabled(guild_id: int):
-    async with aiosqlite.connect('db/topcheck.db') as db:
+    async with storage.connect('db/topcheck.db') as db:
         async with db.execute("SELECT enabled FROM topcheck WHERE guild_id = ?", (guild_id,)) as cursor:
             row = await cursor.fetchone()
             return row is not None and row[0] == 1
@@ -75,7 +61,7 @@ def updateignore(guild_id, data):
 
 
 async def getConfig(guildID):
-  async with aiosqlite.connect('db/prefix.db') as db:
+  async with storage.connect('db/prefix.db') as db:
     async with db.execute("SELECT prefix FROM prefixes WHERE guild_id = ?", (guildID,)) as cursor:
       row = await cursor.fetchone()
       if row:
@@ -86,7 +72,7 @@ async def getConfig(guildID):
         return defaultConfig
 
 async def updateConfig(guildID, data):
-  async with aiosqlite.connect('db/prefix.db') as db:
+  async with storage.connect('db/prefix.db') as db:
     await db.execute(
       "INSERT OR REPLACE INTO prefixes (guild_id, prefix) VALUES (?, ?)",
       (guildID, data["prefix"])
@@ -103,13 +89,13 @@ def restart_program():
 def blacklist_check():
 
   async def predicate(ctx):
-    async with aiosqlite.connect('db/block.db') as db:
-      cursor = await db.execute("SELECT 1 FROM user_blacklist WHERE user_id = ?", (str(ctx.author.id),))
+    async with storage.connect('db/block.db') as db:
+      cursor = await db.execute("SELECT 1 FROM user_blacklist WHERE user_id = ?", (ctx.author.id,))
       user_blacklisted = await cursor.fetchone()
       if user_blacklisted:
         return False
 
-      cursor = await db.execute("SELECT 1 FROM guild_blacklist WHERE guild_id = ?", (str(ctx.guild.id),))
+      cursor = await db.execute("SELECT 1 FROM guild_blacklist WHERE guild_id = ?", (ctx.guild.id,))
       guild_blacklisted = await cursor.fetchone()
       if guild_blacklisted:
         return False
@@ -120,7 +106,7 @@ def blacklist_check():
     
 
 async def get_ignore_data(guild_id: int) -> dict:
-    async with aiosqlite.connect("db/ignore.db") as db:
+    async with storage.connect("db/ignore.db") as db:
         data = {
             "channel": set(),
             "user": set(),
@@ -196,4 +182,12 @@ def top_check():
 
         return True
 
-    return commands.check(predicate)
\ No newline at end of file
+    return commands.check(predicate)
+async def chunk_members(ctx):
+    if ctx.guild is not None:
+        await ctx.bot.cache_policy.ensure_chunked(ctx.guild)
+
+def needs_members():
+    # guilds aren't chunked at startup; commands that walk the whole member list
+    # fetch it once, after their checks and cooldowns have passed
+    return commands.before_invoke(chunk_members)
@@ -0,0 +1,66 @@
+from collections import defaultdict
+from difflib import SequenceMatcher
+from typing import Dict, List, Set
+
+
+def _trigrams(text: str) -> Set[str]:
+    padded = f"  {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class CommandIndex:
+    """Trigram index over command qualified names and aliases.
+
+    A lookup only scores names that share trigrams with the query, so a
+    miss costs a handful of set lookups instead of a ``difflib`` pass over
+    every command. The index is rebuilt lazily whenever the bot's
+    ``cog_version`` changes.
+    """
+
+    def __init__(self, bot, candidates: int = 25):
+        self.bot = bot
+        self.candidates = candidates
+        self.version = None
+        self.names: List[str] = []
+        self._postings: Dict[str, List[int]] = {}
+
+    def refresh(self):
+        version = getattr(self.bot, "cog_version", 0)
+        if self.version == version:
+            return
+        names = set()
+        for command in self.bot.walk_commands():
+            names.add(command.qualified_name.lower())
+            parent = command.full_parent_name
+            for alias in command.aliases:
+                names.add(f"{parent} {alias}".strip().lower())
+        self.names = sorted(names)
+        postings = defaultdict(list)
+        for i, name in enumerate(self.names):
+            for gram in _trigrams(name):
+                postings[gram].append(i)
+        self._postings = dict(postings)
+        self.version = version
+
+    def suggest(self, query: str, n: int = 3, cutoff: float = 0.6) -> List[str]:
+        self.refresh()
+        query = query.strip().lower()
+        if not query:
+            return []
+        hits: Dict[int, int] = defaultdict(int)
+        for gram in _trigrams(query):
+            for i in self._postings.get(gram, ()):
+                hits[i] += 1
+        shortlist = sorted(hits, key=hits.__getitem__, reverse=True)[:self.candidates]
+
+        matcher = SequenceMatcher()
+        matcher.set_seq2(query)
+        scored = []
+        for i in shortlist:
+            matcher.set_seq1(self.names[i])
+            if matcher.real_quick_ratio() >= cutoff and matcher.quick_ratio() >= cutoff:
+                ratio = matcher.ratio()
+                if ratio >= cutoff:
+                    scored.append((ratio, self.names[i]))
+        scored.sort(key=lambda pair: (-pair[0], pair[1]))
+        return [name for _, name in scored[:n]]
@@ -6,4 +6,35 @@ server = "https://discord.com/invite/codexdev"
 ch = "https://discord.com/channels/699587669059174461/1271825678710476911"
 OWNER_IDS = [767979794411028491, 912362112620331029, 1297508239029698695, 1010057368287068222]
 BotName = "Axon X"
-serverLink = "https://discord.com/invite/codexdev"
\ No newline at end of file
+serverLink = "https://discord.com/invite/codexdev"
+# Recent-message store used by message logs and snipe (see utils/message_store.py)
+MESSAGE_STORE_ENABLED = True
+MESSAGE_STORE_RETENTION = 6 * 60 * 60
+MESSAGE_STORE_BUDGET = 32 * 1024 * 1024
+MESSAGE_STORE_PER_CHANNEL = 200
+
+# Snipe store limits (see utils/snipe_store.py)
+SNIPE_BUDGET = 8 * 1024 * 1024
+SNIPE_TTL = 60 * 60
+
+# Event-loop watchdog (see utils/loop_watchdog.py)
+WATCHDOG_THRESHOLD = 0.5
+WATCHDOG_REPORT_MINUTES = 30
+
+# Sharding and clustering (see core/cluster.py). SHARD_COUNT is used when the
+# bot runs as a single process; the launcher overrides it per cluster.
+SHARD_COUNT = 2
+CLUSTER_IPC_PATH = "/tmp/axon-cluster.sock"
+CLUSTER_QUERY_TIMEOUT = 5.0
+
+# Gateway intents and member caching (see core/cache_policy.py). INTENTS is
+# "all", "default" or a comma-separated list of intent names; MEMBER_CACHE is
+# "all", "none" or a list of MemberCacheFlags names ("joined", "voice").
+INTENTS = os.environ.get("AXON_INTENTS", "all")
+PRESENCE_INTENT = os.environ.get("AXON_PRESENCES", "1") != "0"
+MEMBER_CACHE = os.environ.get("AXON_MEMBER_CACHE", "all")
+# guilds are chunked when a command first needs their full member list
+CHUNK_GUILDS_AT_STARTUP = False
+CHUNK_TIMEOUT = 60.0
+# only process presence updates for guilds that turned presence tracking on
+PRESENCE_OPT_IN = True
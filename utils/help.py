@@ -46,11 +46,77 @@ class Button(discord.ui.Button):
                 "You must run this command to interact with it.", ephemeral=True)
 
 
+class HelpCatalog:
+    """Category pages for the help menu, built once and shared by every view.
+
+    The catalog is rebuilt only when the bot's ``cog_version`` changes, i.e.
+    after a cog is added or removed. Pages with a guild's ignored commands
+    stripped out are cached per distinct ignore set, so most guilds share
+    the unfiltered pages.
+    """
+
+    def __init__(self, bot):
+        self.bot = bot
+        self.version = None
+        self.categories = []
+        self.total_commands = 0
+        self._filtered = {}
+
+    def refresh(self):
+        version = getattr(self.bot, "cog_version", 0)
+        if self.version == version:
+            return
+        categories = []
+        for cog in self.bot.cogs.values():
+            if "help_custom" in dir(cog):
+                emoji, label, description = cog.help_custom()
+                fields = []
+                for command in cog.get_commands():
+                    params = "".join(f" <{param}>" for param in command.clean_params)
+                    names = {command.name.lower(), *(alias.lower() for alias in command.aliases)}
+                    fields.append((f"{command.name}{params}", f"{command.help}\n\u200b", names))
+                categories.append((emoji, label, description, fields))
+        self.categories = categories
+        self.total_commands = len(set(self.bot.walk_commands()))
+        self._filtered.clear()
+        self.version = version
+
+    @property
+    def options(self):
+        options = [discord.SelectOption(label="Home", emoji='<:home:1332569722801225749>', description="")]
+        for emoji, label, description, _ in self.categories:
+            options.append(discord.SelectOption(label=label, emoji=emoji, description=description))
+        return options
+
+    def embeds(self, ignored=frozenset()):
+        self.refresh()
+        ignored = frozenset(ignored)
+        cached = self._filtered.get(ignored)
+        if cached is not None:
+            return cached
+        if len(self._filtered) > 1000:
+            self._filtered.clear()
+        embeds = []
+        for emoji, label, _, fields in self.categories:
+            embed = discord.Embed(title=f"{emoji} {label}", color=0x000000)
+            for name, value, names in fields:
+                if names.isdisjoint(ignored):
+                    embed.add_field(name=name, value=value, inline=False)
+            embeds.append(embed)
+        self._filtered[ignored] = embeds
+        return embeds
+
+    def find_index(self, value):
+        for i, (_, label, _, _) in enumerate(self.categories):
+            if label == value:
+                return i + 1
+
+
 class View(discord.ui.View):
 
-    def __init__(self, mapping: dict, ctx: discord.ext.commands.context.Context, homeembed: discord.embeds.Embed, ui: int):
+    def __init__(self, catalog: HelpCatalog, ctx: discord.ext.commands.context.Context, homeembed: discord.embeds.Embed, ui: int, ignored=frozenset()):
         super().__init__(timeout=None)
-        self.mapping, self.ctx, self.home = mapping, ctx, homeembed
+        self.catalog, self.ctx, self.home, self.ignored = catalog, ctx, homeembed, ignored
         self.index, self.buttons = 0, None
 
         self.options, self.embeds, self.total_pages = self.gen_embeds()
@@ -76,44 +142,12 @@ class View(discord.ui.View):
         return buttons
 
     def find_index_from_select(self, value):
-        i = 0
-        for cog in self.get_cogs():
-            if "help_custom" in dir(cog):
-                _, label, _ = cog.help_custom()
-                if label == value:
-                    return i + 1
-                i += 1
-
-    def get_cogs(self):
-        return list(self.mapping.keys())
+        return self.catalog.find_index(value)
 
     def gen_embeds(self):
-        options, embeds = [], []
-        total_pages = 0
-
-        options.append(
-            discord.SelectOption(label="Home",
-                                 emoji='<:home:1332569722801225749>', description=""))
-        embeds.append(self.home)
-        total_pages += 1
-
-        for cog in self.get_cogs():
-            if "help_custom" in dir(cog):
-                emoji, label, description = cog.help_custom()
-                options.append(discord.SelectOption(label=label, emoji=emoji, description=description))
-                embed = discord.Embed(title=f"{emoji} {label}",
-                                      color=0x000000)
-
-                for command in cog.get_commands():
-                    params = ""
-                    for param in command.clean_params:
-                        params += f" <{param}>"
-                    embed.add_field(name=f"{command.name}{params}",
-                                    value=f"{command.help}\n\u200b",
-                                    inline=False)
-
-                embeds.append(embed)
-                total_pages += 1
+        embeds = [self.home] + self.catalog.embeds(self.ignored)
+        options = self.catalog.options
+        total_pages = len(embeds)
 
         self.home.set_footer(text=f"• Help page 1/{total_pages} | Requested by: {self.ctx.author.display_name}",
                              icon_url=f"{self.ctx.bot.user.avatar.url}")
@@ -127,7 +161,7 @@ class View(discord.ui.View):
     async def to_page(self, page: int, interaction: discord.Interaction):
         if not self.index + page < 0 or not self.index + page > len(self.options):
             await self.set_index(page)
-            embed = self.embeds[self.index]
+            embed = self.embeds[self.index].copy()
             embed.set_footer(text=f"• Help page {self.index + 1}/{self.total_pages} | Requested by: {self.ctx.author.display_name}",
                              icon_url=f"{self.ctx.bot.user.avatar.url}")
             await interaction.response.edit_message(embed=embed, view=self)
@@ -0,0 +1,199 @@
+import asyncio
+from collections import defaultdict
+from typing import Dict, List, Optional, Tuple
+
+from core import storage
+import discord
+
+
+class TrackedInvite:
+    __slots__ = ("uses", "max_uses", "inviter_id")
+
+    def __init__(self, uses: int, max_uses: int, inviter_id: Optional[int]):
+        self.uses = uses
+        self.max_uses = max_uses
+        self.inviter_id = inviter_id
+
+    @classmethod
+    def from_invite(cls, invite: discord.Invite) -> "TrackedInvite":
+        return cls(invite.uses or 0, invite.max_uses or 0,
+                   invite.inviter.id if invite.inviter else None)
+
+
+class GuildInvites:
+    __slots__ = ("invites", "expired", "vanity_uses", "pending", "lock", "task", "ready")
+
+    def __init__(self):
+        self.ready = False
+        self.invites: Dict[str, TrackedInvite] = {}
+        self.expired: Dict[str, TrackedInvite] = {}
+        self.vanity_uses: Optional[int] = None
+        self.pending: List[Tuple[discord.Member, asyncio.Future]] = []
+        self.lock = asyncio.Lock()
+        self.task: Optional[asyncio.Task] = None
+
+
+class InviteEngine:
+    """Attributes member joins to invites without racing concurrent joins.
+
+    Joins for a guild are collected for ``window`` seconds and resolved
+    together from a single ``guild.invites()`` fetch, under a per-guild
+    lock so concurrent handlers never overwrite each other's snapshot.
+    Uses are diffed through a code-to-uses dict; a window in which more
+    than one invite was used leaves its joins unattributed. Invites that
+    Discord deletes on reaching ``max_uses`` are still counted, and joins
+    no invite explains fall back to the vanity URL when the guild has one.
+    """
+
+    def __init__(self, bot, db_file: str, window: float = 1.5):
+        self.bot = bot
+        self.db_file = db_file
+        self.window = window
+        self.guilds: Dict[int, GuildInvites] = {}
+        self._stats: Dict[Tuple[str, str], List[int]] = defaultdict(lambda: [0, 0, 0, 0])
+        self._uses: Dict[Tuple[str, str, str], int] = defaultdict(int)
+        self._write_lock = asyncio.Lock()
+
+    def state(self, guild_id: int) -> GuildInvites:
+        state = self.guilds.get(guild_id)
+        if state is None:
+            state = self.guilds[guild_id] = GuildInvites()
+        return state
+
+    async def snapshot(self, guild: discord.Guild):
+        state = self.state(guild.id)
+        async with state.lock:
+            await self._refresh(guild, state)
+
+    async def _refresh(self, guild: discord.Guild, state: GuildInvites) -> Optional[Dict[str, TrackedInvite]]:
+        try:
+            invites = await guild.invites()
+        except discord.HTTPException:
+            return None
+        fresh = {invite.code: TrackedInvite.from_invite(invite) for invite in invites}
+        if "VANITY_URL" in guild.features:
+            try:
+                vanity = await guild.vanity_invite()
+                state.vanity_uses = vanity.uses if vanity else None
+            except discord.HTTPException:
+                pass
+        previous = state.invites
+        state.invites = fresh
+        state.ready = True
+        return previous
+
+    def invite_created(self, invite: discord.Invite):
+        if invite.guild is None:
+            return
+        self.state(invite.guild.id).invites[invite.code] = TrackedInvite.from_invite(invite)
+
+    def invite_deleted(self, invite: discord.Invite):
+        if invite.guild is None:
+            return
+        state = self.state(invite.guild.id)
+        tracked = state.invites.pop(invite.code, None)
+        if tracked is not None:
+            state.expired[invite.code] = tracked
+
+    def forget_guild(self, guild_id: int):
+        state = self.guilds.pop(guild_id, None)
+        if state and state.task:
+            state.task.cancel()
+
+    async def attribute(self, member: discord.Member) -> Tuple[Optional[str], Optional[int]]:
+        """Resolve which invite ``member`` joined with, as ``(code, inviter_id)``.
+
+        ``code`` is ``"vanity"`` for vanity joins and ``None`` when the join
+        cannot be explained.
+        """
+        state = self.state(member.guild.id)
+        future = self.bot.loop.create_future()
+        state.pending.append((member, future))
+        if state.task is None or state.task.done():
+            state.task = self.bot.loop.create_task(self._resolve(member.guild, state))
+        return await future
+
+    async def _resolve(self, guild: discord.Guild, state: GuildInvites):
+        await asyncio.sleep(self.window)
+        async with state.lock:
+            joins, state.pending = state.pending, []
+            old_vanity = state.vanity_uses
+            was_ready = state.ready
+            before = await self._refresh(guild, state)
+            if before is None or not was_ready:
+                for _, future in joins:
+                    if not future.done():
+                        future.set_result((None, None))
+                return
+
+            used: List[Tuple[str, Optional[int]]] = []
+            for code, after in state.invites.items():
+                old = before.get(code)
+                delta = after.uses - (old.uses if old else 0)
+                used.extend([(code, after.inviter_id)] * max(delta, 0))
+            for code, old in state.expired.items():
+                # only an invite one use short of its limit was deleted by a join;
+                # any other deletion (manual, expiry) accounts for nobody
+                if code not in state.invites and old.max_uses and old.uses == old.max_uses - 1:
+                    used.append((code, old.inviter_id))
+            state.expired.clear()
+
+            vanity_joins = 0
+            if old_vanity is not None and state.vanity_uses is not None:
+                vanity_joins = max(state.vanity_uses - old_vanity, 0)
+
+            # uses are counted per invite, not per member: once a window spans
+            # several invites (or an invite and the vanity) nothing says who took which
+            ambiguous = len({code for code, _ in used}) + (vanity_joins > 0) > 1
+
+            for i, (_, future) in enumerate(joins):
+                if future.done():
+                    continue
+                if ambiguous:
+                    future.set_result((None, None))
+                elif i < len(used):
+                    future.set_result(used[i])
+                elif vanity_joins > 0 or (old_vanity is None and "VANITY_URL" in guild.features):
+                    vanity_joins -= 1
+                    future.set_result(("vanity", None))
+                else:
+                    future.set_result((None, None))
+
+    def record_join(self, guild_id: int, code: str, inviter_id: int, fake: bool, rejoin: bool):
+        key = (str(guild_id), str(inviter_id))
+        stats = self._stats[key]
+        if fake:
+            stats[1] += 1
+        else:
+            stats[0] += 1
+        if rejoin:
+            stats[3] += 1
+        self._uses[(str(guild_id), str(inviter_id), code)] += 1
+
+    def record_leave(self, guild_id: int, user_id: int):
+        self._stats[(str(guild_id), str(user_id))][2] += 1
+
+    async def flush(self):
+        async with self._write_lock:
+            if not self._stats and not self._uses:
+                return
+            stats, self._stats = self._stats, defaultdict(lambda: [0, 0, 0, 0])
+            uses, self._uses = self._uses, defaultdict(int)
+            async with storage.connect(self.db_file) as db:
+                await db.executemany("""
+                    INSERT OR IGNORE INTO invites (guild_id, inviter_id, invite_code, uses)
+                    VALUES (?, ?, ?, 0)
+                """, list(uses))
+                await db.executemany("""
+                    UPDATE invites SET uses = uses + ? WHERE guild_id = ? AND invite_code = ?
+                """, [(count, guild_id, code) for (guild_id, _, code), count in uses.items()])
+                # a leave only counts against an inviter that already has a row
+                await db.executemany("""
+                    INSERT OR IGNORE INTO invite_stats (guild_id, user_id) VALUES (?, ?)
+                """, [key for key, (invites, fake, _, rejoins) in stats.items() if invites or fake or rejoins])
+                await db.executemany("""
+                    UPDATE invite_stats SET invites = invites + ?, fake = fake + ?,
+                        leaves = leaves + ?, rejoins = rejoins + ?
+                    WHERE guild_id = ? AND user_id = ?
+                """, [(*counts, guild_id, user_id) for (guild_id, user_id), counts in stats.items()])
+                await db.commit()
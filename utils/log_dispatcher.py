@@ -0,0 +1,116 @@
+import asyncio
+from collections import deque
+from typing import Deque, Dict, List, Optional
+
+import discord
+
+MAX_EMBEDS = 10
+MAX_CHARS = 6000
+WEBHOOK_NAME = "Axon Logs"
+
+
+class LogDispatcher:
+    """Per-channel queues that pack log embeds into as few messages as possible.
+
+    Embeds for a channel are held until either ten are waiting or
+    ``interval`` seconds have passed since the first one arrived, then sent
+    together. Delivery goes through a channel webhook when the bot can
+    manage one, so log traffic uses the webhook's rate limit instead of the
+    bot's own channel bucket; otherwise it falls back to ``channel.send``.
+    """
+
+    def __init__(self, bot, interval: float = 2.0):
+        self.bot = bot
+        self.interval = interval
+        self._queues: Dict[int, Deque[discord.Embed]] = {}
+        self._timers: Dict[int, asyncio.Task] = {}
+        self._locks: Dict[int, asyncio.Lock] = {}
+        self._webhooks: Dict[int, Optional[discord.Webhook]] = {}
+
+    def enqueue(self, channel: discord.TextChannel, embed: discord.Embed):
+        queue = self._queues.setdefault(channel.id, deque())
+        queue.append(embed)
+        if len(queue) >= MAX_EMBEDS:
+            timer = self._timers.pop(channel.id, None)
+            if timer:
+                timer.cancel()
+            self.bot.loop.create_task(self.flush(channel))
+        elif channel.id not in self._timers:
+            self._timers[channel.id] = self.bot.loop.create_task(self._flush_later(channel))
+
+    async def _flush_later(self, channel):
+        try:
+            await asyncio.sleep(self.interval)
+        except asyncio.CancelledError:
+            return
+        self._timers.pop(channel.id, None)
+        await self.flush(channel)
+
+    def _take_batch(self, queue: Deque[discord.Embed]) -> List[discord.Embed]:
+        batch = []
+        size = 0
+        while queue and len(batch) < MAX_EMBEDS:
+            length = len(queue[0])
+            if batch and size + length > MAX_CHARS:
+                break
+            batch.append(queue.popleft())
+            size += length
+        return batch
+
+    async def flush(self, channel: discord.TextChannel):
+        lock = self._locks.setdefault(channel.id, asyncio.Lock())
+        async with lock:
+            queue = self._queues.get(channel.id)
+            while queue:
+                batch = self._take_batch(queue)
+                try:
+                    await self._deliver(channel, batch)
+                except discord.HTTPException as e:
+                    print(f"Failed to deliver logs to {channel.id}: {e}")
+
+    async def _get_webhook(self, channel) -> Optional[discord.Webhook]:
+        if channel.id in self._webhooks:
+            return self._webhooks[channel.id]
+        webhook = None
+        if channel.permissions_for(channel.guild.me).manage_webhooks:
+            try:
+                for hook in await channel.webhooks():
+                    if hook.user == self.bot.user and hook.name == WEBHOOK_NAME:
+                        webhook = hook
+                        break
+                if webhook is None:
+                    webhook = await channel.create_webhook(name=WEBHOOK_NAME)
+            except discord.HTTPException:
+                webhook = None
+        self._webhooks[channel.id] = webhook
+        return webhook
+
+    async def _deliver(self, channel, embeds: List[discord.Embed]):
+        webhook = await self._get_webhook(channel)
+        if webhook is not None:
+            try:
+                await webhook.send(embeds=embeds,
+                                   username=self.bot.user.name,
+                                   avatar_url=self.bot.user.display_avatar.url)
+                return
+            except (discord.NotFound, discord.Forbidden):
+                self._webhooks.pop(channel.id, None)
+        await channel.send(embeds=embeds)
+
+    def forget_channel(self, channel_id: int):
+        self._webhooks.pop(channel_id, None)
+        self._queues.pop(channel_id, None)
+        self._locks.pop(channel_id, None)
+        timer = self._timers.pop(channel_id, None)
+        if timer:
+            timer.cancel()
+
+    async def close(self):
+        for timer in self._timers.values():
+            timer.cancel()
+        self._timers.clear()
+        for channel_id in list(self._queues):
+            channel = self.bot.get_channel(channel_id)
+            if channel is not None:
+                await self.flush(channel)
+        self._queues.clear()
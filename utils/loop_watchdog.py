@@ -0,0 +1,143 @@
+import asyncio
+import os
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from typing import Deque, Dict, Optional, Tuple
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+COGS_DIR = os.path.join(ROOT, "cogs") + os.sep
+
+
+class Finding:
+    __slots__ = ("cog", "function", "location", "count", "total", "worst", "stack", "last_seen")
+
+    def __init__(self, cog: str, function: str, location: str):
+        self.cog = cog
+        self.function = function
+        self.location = location
+        self.count = 0
+        self.total = 0.0
+        self.worst = 0.0
+        self.stack = ""
+        self.last_seen = 0.0
+
+
+def _attribute(frame) -> Tuple[str, str, str]:
+    """Pick the cog, function and line responsible for a stalled stack.
+
+    The innermost frame inside ``cogs/`` wins; failing that, the innermost
+    frame anywhere in the bot's own tree, then the innermost frame overall.
+    """
+    own = None
+    innermost = None
+    while frame is not None:
+        code = frame.f_code
+        filename = os.path.abspath(code.co_filename)
+        location = f"{os.path.relpath(filename, ROOT)}:{frame.f_lineno}"
+        qualname = getattr(code, "co_qualname", code.co_name)
+        if innermost is None:
+            innermost = ("-", qualname, location)
+        if filename.startswith(COGS_DIR):
+            cog, _, function = qualname.rpartition(".")
+            return cog or os.path.basename(filename)[:-3], function, location
+        if own is None and filename.startswith(ROOT) and "site-packages" not in filename:
+            own = ("-", qualname, location)
+        frame = frame.f_back
+    return own or innermost or ("-", "-", "-")
+
+
+class LoopWatchdog:
+    """Measures event-loop lag and captures the stack of callbacks that block it.
+
+    A coroutine wakes every ``interval`` seconds and records how late it was.
+    A daemon thread watches that heartbeat; when the loop has not ticked for
+    ``threshold`` seconds it samples the loop thread's stack, attributes it
+    to the running cog and listener and files it under :attr:`findings`.
+    """
+
+    def __init__(self, interval: float = 0.25, threshold: float = 0.5, history: int = 50):
+        self.interval = interval
+        self.threshold = threshold
+        self.lag = 0.0
+        self.max_lag = 0.0
+        self.avg_lag = 0.0
+        self.stalls = 0
+        self.findings: Dict[Tuple[str, str, str], Finding] = {}
+        self.recent: Deque[Tuple[float, float, Finding]] = deque(maxlen=history)
+        self._lock = threading.Lock()
+        self._last_tick = time.monotonic()
+        self._captured: Optional[Finding] = None
+        self._loop_thread: Optional[int] = None
+        self._task: Optional[asyncio.Task] = None
+        self._thread: Optional[threading.Thread] = None
+        self._running = False
+
+    def start(self, loop: asyncio.AbstractEventLoop):
+        if self._running:
+            return
+        self._running = True
+        self._task = loop.create_task(self._heartbeat())
+        self._thread = threading.Thread(target=self._watch, name="loop-watchdog", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._running = False
+        if self._task:
+            self._task.cancel()
+
+    async def _heartbeat(self):
+        self._loop_thread = threading.get_ident()
+        while self._running:
+            start = time.monotonic()
+            self._last_tick = start
+            await asyncio.sleep(self.interval)
+            now = time.monotonic()
+            self._last_tick = now
+            lag = max(0.0, now - start - self.interval)
+            self.lag = lag
+            self.max_lag = max(self.max_lag, lag)
+            self.avg_lag = self.avg_lag * 0.95 + lag * 0.05
+            with self._lock:
+                finding = self._captured
+                self._captured = None
+                if finding is not None:
+                    finding.total += lag
+                    finding.worst = max(finding.worst, lag)
+                    self.recent.append((time.time(), lag, finding))
+
+    def _watch(self):
+        while self._running:
+            time.sleep(self.threshold / 2)
+            tick = self._last_tick
+            if self._loop_thread is None or time.monotonic() - tick < self.threshold:
+                continue
+            with self._lock:
+                if self._captured is not None:
+                    continue
+                frame = sys._current_frames().get(self._loop_thread)
+                if frame is None:
+                    continue
+                key = _attribute(frame)
+                finding = self.findings.get(key)
+                if finding is None:
+                    finding = self.findings[key] = Finding(*key)
+                finding.count += 1
+                finding.last_seen = time.time()
+                finding.stack = "".join(traceback.format_stack(frame)[-8:])
+                self._captured = finding
+                self.stalls += 1
+            del frame
+
+    def top(self, limit: int = 10):
+        with self._lock:
+            return sorted(self.findings.values(), key=lambda f: f.total, reverse=True)[:limit]
+
+    def reset(self):
+        with self._lock:
+            self.findings.clear()
+            self.recent.clear()
+            self.max_lag = 0.0
+            self.stalls = 0
@@ -0,0 +1,155 @@
+import time
+from collections import OrderedDict, deque
+from typing import Deque, Dict, Iterable, List, Optional, Tuple
+
+import discord
+
+# Rough per-record cost of the object itself, its slots and the index entries
+# pointing at it; strings are added on top by length.
+RECORD_OVERHEAD = 240
+
+
+class StoredMessage:
+    __slots__ = ("id", "channel_id", "guild_id", "author_id", "author_name",
+                 "author_avatar", "content", "attachments", "created_at", "size")
+
+    def __init__(self, id: int, channel_id: int, guild_id: int, author_id: int,
+                 author_name: str, author_avatar: Optional[str], content: str,
+                 attachments: Tuple[Tuple[str, str], ...], created_at: float):
+        self.id = id
+        self.channel_id = channel_id
+        self.guild_id = guild_id
+        self.author_id = author_id
+        self.author_name = author_name
+        self.author_avatar = author_avatar
+        self.content = content
+        self.attachments = attachments
+        self.created_at = created_at
+        self.size = self._measure()
+
+    @classmethod
+    def from_message(cls, message: discord.Message) -> "StoredMessage":
+        avatar = message.author.avatar
+        return cls(
+            message.id,
+            message.channel.id,
+            message.guild.id,
+            message.author.id,
+            message.author.name,
+            avatar.key if avatar else None,
+            message.content,
+            tuple((a.filename, a.url) for a in message.attachments),
+            time.time(),
+        )
+
+    def _measure(self) -> int:
+        size = RECORD_OVERHEAD + len(self.content) + len(self.author_name)
+        for name, url in self.attachments:
+            size += len(name) + len(url)
+        return size
+
+    @property
+    def avatar_url(self) -> str:
+        if self.author_avatar is None:
+            return f"https://cdn.discordapp.com/embed/avatars/{(self.author_id >> 22) % 6}.png"
+        ext = "gif" if self.author_avatar.startswith("a_") else "png"
+        return f"https://cdn.discordapp.com/avatars/{self.author_id}/{self.author_avatar}.{ext}?size=1024"
+
+    def edited(self, content: str) -> "StoredMessage":
+        return StoredMessage(self.id, self.channel_id, self.guild_id, self.author_id,
+                             self.author_name, self.author_avatar, content,
+                             self.attachments, self.created_at)
+
+
+class MessageStore:
+    """Recent guild messages, kept independently of the gateway message cache.
+
+    Records are held in arrival order so the oldest can be dropped in O(1)
+    when they pass ``retention`` seconds or the store exceeds ``budget``
+    bytes. Each channel additionally keeps at most ``per_channel`` records.
+    """
+
+    def __init__(self, retention: int = 21600, budget: int = 32 * 1024 * 1024,
+                 per_channel: int = 200):
+        self.retention = retention
+        self.budget = budget
+        self.per_channel = per_channel
+        self.size = 0
+        self._messages: "OrderedDict[int, StoredMessage]" = OrderedDict()
+        self._channels: Dict[int, Deque[int]] = {}
+
+    def __len__(self) -> int:
+        return len(self._messages)
+
+    def get(self, message_id: int) -> Optional[StoredMessage]:
+        return self._messages.get(message_id)
+
+    def add(self, message: discord.Message):
+        record = StoredMessage.from_message(message)
+        self._messages[record.id] = record
+        self.size += record.size
+
+        ids = self._channels.setdefault(record.channel_id, deque())
+        ids.append(record.id)
+        while len(ids) > self.per_channel:
+            self._drop(ids.popleft())
+
+        self._expire()
+
+    def pop(self, message_id: int) -> Optional[StoredMessage]:
+        record = self._messages.pop(message_id, None)
+        if record is not None:
+            self.size -= record.size
+            # a dead id left in the channel index would count towards per_channel
+            ids = self._channels.get(record.channel_id)
+            if ids:
+                try:
+                    ids.remove(message_id)
+                except ValueError:
+                    pass
+                if not ids:
+                    del self._channels[record.channel_id]
+        return record
+
+    def pop_many(self, message_ids: Iterable[int]) -> List[StoredMessage]:
+        records = []
+        for message_id in message_ids:
+            record = self.pop(message_id)
+            if record is not None:
+                records.append(record)
+        records.sort(key=lambda r: r.id)
+        return records
+
+    def edit(self, message_id: int, content: str) -> Optional[Tuple[StoredMessage, StoredMessage]]:
+        before = self._messages.get(message_id)
+        if before is None:
+            return None
+        after = before.edited(content)
+        self._messages[message_id] = after
+        self.size += after.size - before.size
+        return before, after
+
+    def forget_channel(self, channel_id: int):
+        for message_id in self._channels.pop(channel_id, ()):
+            self.pop(message_id)
+
+    def _drop(self, message_id: int):
+        record = self._messages.pop(message_id, None)
+        if record is not None:
+            self.size -= record.size
+
+    def _expire(self):
+        cutoff = time.time() - self.retention
+        messages = self._messages
+        while messages:
+            message_id, record = next(iter(messages.items()))
+            if record.created_at >= cutoff and self.size <= self.budget:
+                break
+            messages.popitem(last=False)
+            self.size -= record.size
+            ids = self._channels.get(record.channel_id)
+            if ids:
+                while ids and ids[0] not in messages:
+                    ids.popleft()
+                if not ids:
+                    del self._channels[record.channel_id]
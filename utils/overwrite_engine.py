@@ -0,0 +1,184 @@
+import asyncio
+import time
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+
+from core import storage
+import discord
+
+Progress = Callable[[int, int], Awaitable[None]]
+
+
+def _encode(value: Optional[bool]) -> Optional[int]:
+    return None if value is None else int(value)
+
+
+def _decode(value: Optional[int]) -> Optional[bool]:
+    return None if value is None else bool(value)
+
+
+class OverwriteResult:
+    __slots__ = ("changed", "skipped", "failed", "started")
+
+    def __init__(self):
+        self.changed = 0
+        self.skipped = 0
+        self.failed: List[Tuple[discord.abc.GuildChannel, str]] = []
+        self.started = time.perf_counter()
+
+    @property
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.started
+
+    def summary(self, verb: str) -> str:
+        lines = [
+            f"{verb} **{self.changed}** channel(s), skipped **{self.skipped}** already done "
+            f"in {self.elapsed:.1f}s."
+        ]
+        if self.failed:
+            lines.append(f"Failed on **{len(self.failed)}** channel(s):")
+            lines.extend(f"- {channel.mention}: {error}" for channel, error in self.failed[:10])
+            if len(self.failed) > 10:
+                lines.append(f"...and {len(self.failed) - 10} more")
+        return "\n".join(lines)
+
+
+class OverwriteEngine:
+    """Applies one role's permission overwrite across every channel of a guild.
+
+    Each channel's target overwrite is computed from its current one, and
+    channels already in that state are skipped without a request. Edits run
+    with bounded concurrency; they hit per-channel buckets, so the limit
+    guards the global rate limit rather than any one route. Before a key is
+    changed, its previous value is stored under ``kind`` (e.g. ``"lock"``),
+    and :meth:`restore` puts exactly those values back.
+    """
+
+    def __init__(self, db_path: str = "db/overwrites.db", concurrency: int = 8):
+        self.db_path = db_path
+        self.concurrency = concurrency
+
+    async def setup(self):
+        async with storage.connect(self.db_path) as db:
+            await db.execute("""
+                CREATE TABLE IF NOT EXISTS overwrite_snapshots (
+                    guild_id INTEGER,
+                    kind TEXT,
+                    channel_id INTEGER,
+                    target_id INTEGER,
+                    permission TEXT,
+                    value INTEGER,
+                    PRIMARY KEY (guild_id, kind, channel_id, target_id, permission)
+                )
+            """)
+            await db.commit()
+
+    async def _snapshot(self, guild_id: int, kind: str) -> Dict[Tuple[int, int], Dict[str, Optional[bool]]]:
+        snapshot: Dict[Tuple[int, int], Dict[str, Optional[bool]]] = {}
+        async with storage.connect(self.db_path) as db:
+            async with db.execute(
+                "SELECT channel_id, target_id, permission, value FROM overwrite_snapshots WHERE guild_id = ? AND kind = ?",
+                (guild_id, kind)
+            ) as cursor:
+                async for channel_id, target_id, permission, value in cursor:
+                    snapshot.setdefault((channel_id, target_id), {})[permission] = _decode(value)
+        return snapshot
+
+    async def _run(self, target: discord.Role,
+                   plan: Dict[discord.abc.GuildChannel, Dict[str, Optional[bool]]],
+                   reason: str, progress: Optional[Progress], result: OverwriteResult):
+        semaphore = asyncio.Semaphore(self.concurrency)
+        total = len(plan) + result.skipped
+        done = result.skipped
+        last_report = 0.0
+
+        async def edit(channel: discord.abc.GuildChannel, values: Dict[str, Optional[bool]]):
+            nonlocal done, last_report
+            async with semaphore:
+                overwrite = discord.PermissionOverwrite(**dict(channel.overwrites_for(target)))
+                overwrite.update(**values)
+                try:
+                    await channel.set_permissions(
+                        target,
+                        overwrite=None if overwrite.is_empty() else overwrite,
+                        reason=reason
+                    )
+                except discord.HTTPException as e:
+                    result.failed.append((channel, e.text or type(e).__name__))
+                else:
+                    result.changed += 1
+            done += 1
+            if progress and time.perf_counter() - last_report > 2:
+                last_report = time.perf_counter()
+                await progress(done, total)
+
+        if progress:
+            await progress(done, total)
+        await asyncio.gather(*(edit(channel, values) for channel, values in plan.items()))
+
+    async def apply(self, guild: discord.Guild, target: discord.Role, kind: str,
+                    values: Dict[str, Optional[bool]], *, reason: str,
+                    progress: Optional[Progress] = None) -> OverwriteResult:
+        result = OverwriteResult()
+        plan = {}
+        rows = []
+        for channel in guild.channels:
+            current = channel.overwrites_for(target)
+            if all(getattr(current, key) == value for key, value in values.items()):
+                result.skipped += 1
+            else:
+                plan[channel] = values
+                rows.extend(
+                    (guild.id, kind, channel.id, target.id, key, _encode(getattr(current, key)))
+                    for key in values
+                )
+
+        # the snapshot is written before any edit so a crash mid-run can still be undone,
+        # and existing rows win so repeated runs keep the state from before the first one
+        if rows:
+            async with storage.connect(self.db_path) as db:
+                await db.executemany(
+                    "INSERT OR IGNORE INTO overwrite_snapshots (guild_id, kind, channel_id, target_id, permission, value) VALUES (?, ?, ?, ?, ?, ?)",
+                    rows
+                )
+                await db.commit()
+
+        await self._run(target, plan, reason, progress, result)
+        return result
+
+    async def restore(self, guild: discord.Guild, target: discord.Role, kind: str,
+                      fallback: Optional[Dict[str, Optional[bool]]] = None, *, reason: str,
+                      progress: Optional[Progress] = None) -> OverwriteResult:
+        """Undo :meth:`apply` for ``kind``.
+
+        Channels in the snapshot get their previous values back and every
+        other channel is left alone. Without any snapshot (nothing was applied
+        through the engine) ``fallback`` is applied to every channel instead.
+        """
+        snapshot = await self._snapshot(guild.id, kind)
+        if snapshot:
+            fallback = None
+        result = OverwriteResult()
+        plan = {}
+        for channel in guild.channels:
+            values = snapshot.get((channel.id, target.id), fallback)
+            if values is None:
+                result.skipped += 1
+                continue
+            current = channel.overwrites_for(target)
+            if all(getattr(current, key) == value for key, value in values.items()):
+                result.skipped += 1
+            else:
+                plan[channel] = values
+
+        await self._run(target, plan, reason, progress, result)
+
+        failed = {channel.id for channel, _ in result.failed}
+        async with storage.connect(self.db_path) as db:
+            await db.execute(
+                "DELETE FROM overwrite_snapshots WHERE guild_id = ? AND kind = ? AND channel_id NOT IN ({})".format(
+                    ",".join("?" * len(failed))
+                ),
+                (guild.id, kind, *failed)
+            )
+            await db.commit()
+        return result
@@ -1,12 +1,8 @@
 from __future__ import annotations
-import os 
 import discord
 from utils.config import BotName
-try:
-    from discord.ext import menus
-    from discord.ext import commands
-except ModuleNotFoundError:
-    os.system("pip install git+https://github.com/Rapptz/discord-ext-menus")
+from discord.ext import menus
+from discord.ext import commands
 
 from .paginator import Paginator as EmbedPaginator
 from discord.ext.commands import Context, Paginator as CmdPaginator
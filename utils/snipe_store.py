@@ -0,0 +1,87 @@
+import time
+from collections import OrderedDict, deque
+from typing import Deque, List
+
+from utils.message_store import StoredMessage
+
+
+class SnipedMessage:
+    __slots__ = ("message", "deleted_at")
+
+    def __init__(self, message: StoredMessage, deleted_at: int):
+        self.message = message
+        self.deleted_at = deleted_at
+
+    @property
+    def size(self) -> int:
+        return self.message.size
+
+
+class SnipeStore:
+    """Deleted messages per channel under one global memory budget.
+
+    Each channel keeps its ``per_channel`` newest snipes, newest first.
+    Channels are kept in least-recently-used order and whole channels are
+    evicted from the cold end once ``budget`` bytes are exceeded. Snipes
+    older than ``ttl`` seconds are dropped on read and by :meth:`sweep`.
+    """
+
+    def __init__(self, budget: int = 8 * 1024 * 1024, per_channel: int = 10,
+                 ttl: int = 3600):
+        self.budget = budget
+        self.per_channel = per_channel
+        self.ttl = ttl
+        self.size = 0
+        self.evicted = 0
+        self._channels: "OrderedDict[int, Deque[SnipedMessage]]" = OrderedDict()
+
+    def add(self, message: StoredMessage):
+        snipes = self._channels.get(message.channel_id)
+        if snipes is None:
+            snipes = self._channels[message.channel_id] = deque(maxlen=self.per_channel)
+        else:
+            self._channels.move_to_end(message.channel_id)
+        if len(snipes) == snipes.maxlen:
+            self.size -= snipes[-1].size
+        snipes.appendleft(SnipedMessage(message, int(time.time())))
+        self.size += message.size
+
+        while self.size > self.budget and len(self._channels) > 1:
+            _, cold = self._channels.popitem(last=False)
+            self.size -= sum(s.size for s in cold)
+            self.evicted += 1
+
+    def get(self, channel_id: int) -> List[SnipedMessage]:
+        snipes = self._channels.get(channel_id)
+        if snipes is None:
+            return []
+        self._expire(channel_id, snipes, time.time() - self.ttl)
+        if snipes:
+            # reads count as use, so the budget evicts the channels nobody snipes in
+            self._channels.move_to_end(channel_id)
+        return list(snipes)
+
+    def _expire(self, channel_id: int, snipes: Deque[SnipedMessage], cutoff: float):
+        while snipes and snipes[-1].deleted_at < cutoff:
+            self.size -= snipes.pop().size
+        if not snipes:
+            del self._channels[channel_id]
+
+    def sweep(self):
+        cutoff = time.time() - self.ttl
+        for channel_id, snipes in list(self._channels.items()):
+            self._expire(channel_id, snipes, cutoff)
+
+    def forget_channel(self, channel_id: int):
+        snipes = self._channels.pop(channel_id, None)
+        if snipes:
+            self.size -= sum(s.size for s in snipes)
+
+    def stats(self) -> dict:
+        return {
+            "channels": len(self._channels),
+            "snipes": sum(len(s) for s in self._channels.values()),
+            "bytes": self.size,
+            "budget": self.budget,
+            "evicted_channels": self.evicted,
+        }
@@ -0,0 +1,133 @@
+import os
+import importlib.metadata
+from typing import Dict, Tuple
+
+import discord
+
+
+def _channel_kind(channel) -> str:
+    if isinstance(channel, discord.TextChannel):
+        return "text"
+    if isinstance(channel, discord.VoiceChannel):
+        return "voice"
+    if isinstance(channel, discord.CategoryChannel):
+        return "category"
+    return "other"
+
+
+def count_code_stats(file_path: str) -> Tuple[int, int]:
+    total_lines = 0
+    total_words = 0
+    try:
+        with open(file_path, 'r', encoding='utf-8') as file:
+            for line in file:
+                stripped_line = line.strip()
+                if stripped_line and not stripped_line.startswith(('〇')):
+                    total_lines += 1
+                    total_words += len(stripped_line.split())
+    except (UnicodeDecodeError, IOError):
+        pass
+    return total_lines, total_words
+
+
+def gather_file_stats(directory: str) -> Tuple[int, int, int]:
+    total_files = 0
+    total_lines = 0
+    total_words = 0
+    for root, _, files in os.walk(directory):
+        for file in files:
+            file_path = os.path.join(root, file)
+            if file.endswith('.py') and '.local' not in root:
+                total_files += 1
+                file_lines, file_words = count_code_stats(file_path)
+                total_lines += file_lines
+                total_words += file_words
+    return total_files, total_lines, total_words
+
+
+def count_libraries() -> int:
+    return sum(1 for _ in importlib.metadata.distributions())
+
+
+class StatsCache:
+    """Running totals for the ``stats`` command.
+
+    Guild, member and channel figures are tallied once per guild and then
+    kept current from gateway events, so reading them never walks the
+    guild list. Members come from ``member_count``; there is no bot count,
+    since guilds aren't chunked and their cached members are a partial list. Code and library figures are static for the lifetime of
+    the process and are filled in once by :meth:`load_static`.
+    """
+
+    def __init__(self):
+        self._guilds: Dict[int, int] = {}
+        self._channels: Dict[int, Dict[str, int]] = {}
+        self.members = 0
+        self.channels = {"text": 0, "voice": 0, "category": 0, "other": 0}
+        self.code = (0, 0, 0)
+        self.libraries = 0
+
+    @property
+    def guilds(self) -> int:
+        return len(self._guilds)
+
+    @property
+    def total_channels(self) -> int:
+        return sum(self.channels.values())
+
+    def load_static(self, directory: str = '.'):
+        self.code = gather_file_stats(directory)
+        self.libraries = count_libraries()
+
+    def rebuild(self, guilds):
+        self._guilds.clear()
+        self._channels.clear()
+        self.members = 0
+        for kind in self.channels:
+            self.channels[kind] = 0
+        for guild in guilds:
+            self.add_guild(guild)
+
+    def add_guild(self, guild: discord.Guild):
+        if guild.id in self._guilds:
+            self.remove_guild(guild)
+        members = guild.member_count or 0
+        self._guilds[guild.id] = members
+        self.members += members
+
+        kinds = {"text": 0, "voice": 0, "category": 0, "other": 0}
+        for channel in guild.channels:
+            kinds[_channel_kind(channel)] += 1
+        self._channels[guild.id] = kinds
+        for kind, count in kinds.items():
+            self.channels[kind] += count
+
+    def remove_guild(self, guild: discord.abc.Snowflake):
+        members = self._guilds.pop(guild.id, None)
+        if members is not None:
+            self.members -= members
+        kinds = self._channels.pop(guild.id, None)
+        if kinds is not None:
+            for kind, count in kinds.items():
+                self.channels[kind] -= count
+
+    def member_delta(self, guild_id: int, delta: int):
+        if guild_id not in self._guilds:
+            return
+        self._guilds[guild_id] += delta
+        self.members += delta
+
+    def channel_delta(self, channel, delta: int):
+        kinds = self._channels.get(channel.guild.id)
+        if kinds is None:
+            return
+        kind = _channel_kind(channel)
+        kinds[kind] += delta
+        self.channels[kind] += delta
+
+    def snapshot(self) -> dict:
+        return {
+            "guilds": self.guilds,
+            "members": self.members,
+            "channels": dict(self.channels),
+        }
@@ -0,0 +1,97 @@
+import asyncio
+import html
+import os
+from datetime import timezone
+from typing import List, Optional
+
+import discord
+
+HEADER = """<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>{title}</title>
+<style>
+body{{background:#313338;color:#dbdee1;font-family:sans-serif;font-size:14px;margin:0;padding:16px}}
+.m{{display:flex;gap:10px;padding:4px 0}}
+.m img{{width:32px;height:32px;border-radius:50%}}
+.a{{font-weight:600;color:#f2f3f5}}
+.t{{color:#949ba4;font-size:12px;margin-left:6px}}
+.c{{white-space:pre-wrap;word-wrap:break-word}}
+.e{{border-left:3px solid #5865f2;padding:4px 8px;margin-top:4px;background:#2b2d31}}
+a{{color:#00a8fc}}
+</style></head><body>
+<h2>{title}</h2>
+"""
+
+FOOTER = "<p class=\"t\">{count} messages{note}</p>\n</body></html>\n"
+
+
+class TranscriptWriter:
+    """Streams a channel's history into an HTML transcript on disk.
+
+    History is read oldest first through ``channel.history``, which pages
+    100 messages per request, and each page is rendered and appended to the
+    file from an executor before the next one is fetched. At most one page
+    is held in memory no matter how long the ticket ran. The file stops
+    growing at ``max_bytes`` so it always fits in an upload.
+    """
+
+    def __init__(self, directory: str = "data/transcripts", max_bytes: int = 8 * 1024 * 1024, page: int = 100):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.page = page
+        os.makedirs(directory, exist_ok=True)
+
+    @staticmethod
+    def render(message: discord.Message) -> str:
+        author = message.author
+        created = message.created_at.astimezone(timezone.utc).strftime("%Y-%m-%d %H:%M:%S UTC")
+        parts = [
+            f'<div class="m"><img src="{html.escape(author.display_avatar.url)}" alt="">',
+            f'<div><span class="a">{html.escape(str(author))}</span>',
+            f'<span class="t">{created}</span>',
+        ]
+        if message.content:
+            parts.append(f'<div class="c">{html.escape(message.content)}</div>')
+        for embed in message.embeds:
+            text = " ".join(filter(None, (embed.title, embed.description)))
+            if text:
+                parts.append(f'<div class="e c">{html.escape(text)}</div>')
+        for attachment in message.attachments:
+            url = html.escape(attachment.url)
+            parts.append(f'<div><a href="{url}">{html.escape(attachment.filename)}</a></div>')
+        parts.append("</div></div>\n")
+        return "".join(parts)
+
+    async def write(self, channel: discord.TextChannel, limit: Optional[int] = None, max_bytes: Optional[int] = None) -> str:
+        path = os.path.join(self.directory, f"{channel.guild.id}-{channel.id}.html")
+        max_bytes = min(max_bytes or self.max_bytes, self.max_bytes) - 4096
+        loop = asyncio.get_running_loop()
+        fp = await loop.run_in_executor(None, open, path, "w", 1 << 16, "utf-8")
+
+        try:
+            written = 0
+            count = 0
+            truncated = False
+            chunk: List[str] = [HEADER.format(title=html.escape(f"#{channel.name}"))]
+
+            async for message in channel.history(limit=limit, oldest_first=True):
+                line = self.render(message)
+                size = len(line.encode("utf-8"))
+                if written + size > max_bytes:
+                    truncated = True
+                    break
+                chunk.append(line)
+                written += size
+                count += 1
+                if len(chunk) >= self.page:
+                    await loop.run_in_executor(None, fp.writelines, chunk)
+                    chunk = []
+
+            note = " (truncated)" if truncated else ""
+            chunk.append(FOOTER.format(count=count, note=note))
+            await loop.run_in_executor(None, fp.writelines, chunk)
+        except BaseException:
+            await loop.run_in_executor(None, fp.close)
+            os.remove(path)
+            raise
+        await loop.run_in_executor(None, fp.close)
+        return path
@@ -0,0 +1,232 @@
+import asyncio
+import time
+from typing import Awaitable, Callable, Dict, List, Optional, Set
+
+from core import storage
+import discord
+
+
+class UnbanCheckpoints:
+    """Per-guild progress of mass unban jobs, kept on disk so they survive a restart."""
+
+    def __init__(self, db_path: str = "db/unban_jobs.db"):
+        self.db_path = db_path
+
+    async def setup(self):
+        async with storage.connect(self.db_path) as db:
+            await db.execute("""
+                CREATE TABLE IF NOT EXISTS unban_jobs (
+                    guild_id INTEGER PRIMARY KEY,
+                    channel_id INTEGER,
+                    author_id INTEGER,
+                    last_id INTEGER DEFAULT 0,
+                    unbanned INTEGER DEFAULT 0,
+                    failed INTEGER DEFAULT 0,
+                    total INTEGER DEFAULT 0
+                )
+            """)
+            await db.commit()
+
+    async def pending(self) -> List[tuple]:
+        async with storage.connect(self.db_path) as db:
+            async with db.execute(
+                "SELECT guild_id, channel_id, author_id, last_id, unbanned, failed, total FROM unban_jobs"
+            ) as cursor:
+                return await cursor.fetchall()
+
+    async def get(self, guild_id: int) -> Optional[tuple]:
+        async with storage.connect(self.db_path) as db:
+            async with db.execute(
+                "SELECT channel_id, author_id, last_id, unbanned, failed, total FROM unban_jobs WHERE guild_id = ?",
+                (guild_id,)
+            ) as cursor:
+                return await cursor.fetchone()
+
+    async def save(self, job: "UnbanJob"):
+        async with storage.connect(self.db_path) as db:
+            await db.execute("""
+                INSERT OR REPLACE INTO unban_jobs (guild_id, channel_id, author_id, last_id, unbanned, failed, total)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+            """, (job.guild.id, job.channel_id, job.author_id, job.last_id, job.unbanned, job.failed, job.total))
+            await db.commit()
+
+    async def clear(self, guild_id: int):
+        async with storage.connect(self.db_path) as db:
+            await db.execute("DELETE FROM unban_jobs WHERE guild_id = ?", (guild_id,))
+            await db.commit()
+
+
+class UnbanJob:
+    """Unbans every banned user of a guild, resumable from a checkpoint.
+
+    The ban list is read in pages of ``page`` entries ordered by user ID,
+    starting after the checkpoint, so memory use stays at one page. Within a
+    page, unbans run concurrently under an additive-increase /
+    multiplicative-decrease window. discord.py reads the rate-limit headers
+    and waits inside the HTTP client, so a request that takes far longer
+    than usual means the bucket ran dry and the window is halved. Fast
+    responses widen it again. The highest user ID below which every unban
+    has finished is checkpointed, throttled to ``checkpoint_every`` seconds.
+    The total is counted as pages are read, so it is a lower bound (shown
+    with a ``+``) until a short page reveals the end of the list; only
+    then is an ETA given.
+    """
+
+    def __init__(self, guild: discord.Guild, store: UnbanCheckpoints, *, reason: str,
+                 channel_id: int = 0, author_id: int = 0, page: int = 1000,
+                 min_window: int = 1, max_window: int = 10, checkpoint_every: float = 5.0,
+                 report: Optional[Callable[["UnbanJob"], Awaitable[None]]] = None):
+        self.guild = guild
+        self.store = store
+        self.reason = reason
+        self.channel_id = channel_id
+        self.author_id = author_id
+        self.page = page
+        self.min_window = min_window
+        self.max_window = max_window
+        self.checkpoint_every = checkpoint_every
+        self.report = report
+
+        self.window = 2.0
+        self.last_id = 0
+        self.unbanned = 0
+        self.failed = 0
+        self.total = 0
+        self.counted = False
+        self.started = time.perf_counter()
+        self.error: Optional[str] = None
+        self.cancelled = False
+        self._baseline: Optional[float] = None
+        self._last_save = 0.0
+        self._session = 0
+
+    def restore(self, last_id: int, unbanned: int, failed: int, total: int):
+        self.last_id = last_id
+        self.unbanned = unbanned
+        self.failed = failed
+        self.total = total
+
+    @property
+    def processed(self) -> int:
+        return self.unbanned + self.failed
+
+    @property
+    def rate(self) -> float:
+        elapsed = time.perf_counter() - self.started
+        return self._session / elapsed if elapsed > 0 else 0.0
+
+    @property
+    def eta(self) -> Optional[float]:
+        rate = self.rate
+        if not rate or not self.counted or self.total <= self.processed:
+            return None
+        return (self.total - self.processed) / rate
+
+    def status(self) -> str:
+        eta = self.eta
+        eta_text = f"{int(eta // 60)}m {int(eta % 60)}s" if eta is not None else "-"
+        return (
+            f"Unbanned **{self.unbanned}**/{self.total}{'' if self.counted else '+'}, failed **{self.failed}** | "
+            f"{self.rate:.1f}/s | window {int(self.window)} | ETA {eta_text}"
+        )
+
+    def _observe(self, latency: float, limited: bool):
+        # the baseline tracks the fastest recent response and only drifts up slowly,
+        # so time spent waiting on an exhausted bucket never becomes the norm
+        if self._baseline is None:
+            self._baseline = latency
+        else:
+            self._baseline = min(latency, self._baseline * 1.05)
+        if limited or latency > max(self._baseline * 4, 1.0):
+            self.window = max(self.min_window, self.window / 2)
+        else:
+            self.window = min(self.max_window, self.window + 1 / self.window)
+
+    async def _unban(self, user: discord.abc.Snowflake):
+        start = time.perf_counter()
+        limited = False
+        try:
+            await self.guild.unban(user, reason=self.reason)
+        except discord.NotFound:
+            self.unbanned += 1
+        except discord.Forbidden as e:
+            self.error = e.text or "Missing permissions"
+            raise
+        except discord.HTTPException as e:
+            limited = e.status == 429
+            self.failed += 1
+        else:
+            self.unbanned += 1
+        self._session += 1
+        self._observe(time.perf_counter() - start, limited)
+
+    async def _checkpoint(self, force: bool = False):
+        now = time.perf_counter()
+        if not force and now - self._last_save < self.checkpoint_every:
+            return
+        self._last_save = now
+        await self.store.save(self)
+        if self.report:
+            try:
+                await self.report(self)
+            except discord.HTTPException:
+                pass
+
+    async def _run_page(self, ids: List[int]):
+        pending: Set[asyncio.Task] = set()
+        owners: Dict[asyncio.Task, int] = {}
+        done_ids: Set[int] = set()
+        cursor = 0
+
+        async def settle(finished: Set[asyncio.Task]):
+            nonlocal cursor
+            for task in finished:
+                task.result()
+                done_ids.add(owners.pop(task))
+            while cursor < len(ids) and ids[cursor] in done_ids:
+                done_ids.discard(ids[cursor])
+                self.last_id = ids[cursor]
+                cursor += 1
+            await self._checkpoint()
+
+        try:
+            for user_id in ids:
+                while len(pending) >= int(self.window):
+                    finished, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                    await settle(finished)
+                task = asyncio.create_task(self._unban(discord.Object(id=user_id)))
+                owners[task] = user_id
+                pending.add(task)
+            while pending:
+                finished, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                await settle(finished)
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def run(self):
+        self._session = 0
+        self.started = time.perf_counter()
+        # a checkpointed total may be stale; recount what is left as it is read
+        self.total = self.processed
+        self.counted = False
+
+        try:
+            while not self.cancelled:
+                ids = [entry.user.id async for entry in self.guild.bans(limit=self.page, after=discord.Object(id=self.last_id))]
+                self.total += len(ids)
+                self.counted = len(ids) < self.page
+                await self._checkpoint(force=True)
+                if not ids:
+                    break
+                await self._run_page(ids)
+        except discord.Forbidden as e:
+            # raised by the ban list itself as well as by an unban
+            if self.error is None:
+                self.error = e.text or "Missing permissions"
+            await self.store.save(self)
+            raise
+        if self.cancelled:
+            await self.store.save(self)
+        else:
+            await self.store.clear(self.guild.id)
@@ -0,0 +1,275 @@
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Awaitable, Callable, Dict, List, Optional, Set, Tuple
+
+import discord
+
+from core import storage
+
+Applied = Callable[[discord.Member, discord.Role, bool], Awaitable[None]]
+
+
+def custom_status(member: discord.Member) -> str:
+    for activity in member.activities:
+        if isinstance(activity, discord.CustomActivity):
+            return (activity.name or "").lower()
+    return ""
+
+
+class InviteCheck:
+    """Whether vanity invites resolve.
+
+    Answers are cached for ``ttl`` seconds and lookups go out at most once
+    per ``interval`` seconds across all guilds. A guild's own vanity code
+    needs no request at all. On a transient error the last known answer is
+    kept, so roles don't flap because the API hiccuped.
+    """
+
+    def __init__(self, bot, ttl: float = 600.0, interval: float = 1.0):
+        self.bot = bot
+        self.ttl = ttl
+        self.interval = interval
+        self._cache: Dict[str, Tuple[bool, float]] = {}
+        self._lock = asyncio.Lock()
+        self._last = 0.0
+
+    def invalidate(self, code: Optional[str]):
+        if code:
+            self._cache.pop(code.lower(), None)
+
+    def _cached(self, code: str) -> Optional[bool]:
+        entry = self._cache.get(code)
+        if entry and time.monotonic() - entry[1] < self.ttl:
+            return entry[0]
+        return None
+
+    async def valid(self, code: str, guild: Optional[discord.Guild] = None) -> bool:
+        if guild is not None and (guild.vanity_url_code or "").lower() == code:
+            return True
+        cached = self._cached(code)
+        if cached is not None:
+            return cached
+        async with self._lock:
+            cached = self._cached(code)
+            if cached is not None:
+                return cached
+            wait = self._last + self.interval - time.monotonic()
+            if wait > 0:
+                await asyncio.sleep(wait)
+            try:
+                await self.bot.fetch_invite(code, with_counts=False, with_expiration=False)
+                valid = True
+            except discord.NotFound:
+                valid = False
+            except discord.HTTPException:
+                self._last = time.monotonic()
+                entry = self._cache.get(code)
+                return entry[0] if entry else False
+            self._last = time.monotonic()
+            self._cache[code] = (valid, self._last)
+            return valid
+
+
+class RoleQueue:
+    """Role edits applied one at a time per guild, ``interval`` seconds apart.
+
+    Edits are keyed by (member, role). Queuing one replaces any edit still
+    pending for the same pair, so a status that flickers collapses to its
+    final state, and an edit the member's roles already satisfy is dropped
+    when its turn comes instead of being sent.
+    """
+
+    def __init__(self, interval: float = 0.5, applied: Optional[Applied] = None):
+        self.interval = interval
+        self.applied = applied
+        self._pending: Dict[int, "OrderedDict[Tuple[int, int], Tuple[bool, str]]"] = {}
+        self._workers: Dict[int, asyncio.Task] = {}
+
+    def put(self, guild: discord.Guild, member_id: int, role_id: int, add: bool, reason: str):
+        pending = self._pending.setdefault(guild.id, OrderedDict())
+        pending.pop((member_id, role_id), None)
+        pending[(member_id, role_id)] = (add, reason)
+        if guild.id not in self._workers:
+            self._workers[guild.id] = asyncio.create_task(self._run(guild))
+
+    def pending(self, guild_id: int) -> int:
+        return len(self._pending.get(guild_id, ()))
+
+    async def _run(self, guild: discord.Guild):
+        pending = self._pending[guild.id]
+        try:
+            while pending:
+                (member_id, role_id), (add, reason) = pending.popitem(last=False)
+                member = guild.get_member(member_id)
+                role = guild.get_role(role_id)
+                if member is None or role is None or (role in member.roles) == add:
+                    continue
+                try:
+                    if add:
+                        await member.add_roles(role, reason=reason)
+                    else:
+                        await member.remove_roles(role, reason=reason)
+                except discord.HTTPException:
+                    pass
+                else:
+                    if self.applied:
+                        await self.applied(member, role, add)
+                await asyncio.sleep(self.interval)
+        finally:
+            self._workers.pop(guild.id, None)
+            if not pending:
+                self._pending.pop(guild.id, None)
+
+    def close(self):
+        for task in self._workers.values():
+            task.cancel()
+
+
+class VanityConfig:
+    __slots__ = ("vanity", "role_id", "log_channel_id", "active")
+
+    def __init__(self, vanity: str, role_id: int, log_channel_id: int, active: bool):
+        self.vanity = vanity
+        self.role_id = role_id
+        self.log_channel_id = log_channel_id
+        self.active = active
+
+
+class VanityEngine:
+    """Keeps vanity roles in line with members' custom statuses.
+
+    A member qualifies while their custom status contains the vanity and
+    the vanity invite resolves. The qualifying members of each vanity are
+    kept as a set, built once from the presence-chunked member cache by
+    :meth:`refresh` and then only touched by presence updates that change a
+    custom status to or from the vanity. Role edits go through a
+    :class:`RoleQueue`.
+    """
+
+    def __init__(self, bot, db_path: str = "db/vanity.db"):
+        self.bot = bot
+        self.db_path = db_path
+        self.configs: Dict[int, List[VanityConfig]] = {}
+        self.qualifying: Dict[Tuple[int, str], Set[int]] = {}
+        self.invites = InviteCheck(bot)
+        self.queue = RoleQueue(applied=self._log_applied)
+
+    async def load(self, guild_id: Optional[int] = None):
+        query = "SELECT guild_id, vanity, role_id, log_channel_id, current_status FROM vanity_roles"
+        params: tuple = ()
+        if guild_id is not None:
+            query += " WHERE guild_id = ?"
+            params = (guild_id,)
+            self.forget(guild_id)
+        else:
+            self.configs.clear()
+            self.qualifying.clear()
+        async with storage.connect(self.db_path) as db:
+            async with db.execute(query, params) as cursor:
+                async for gid, vanity, role_id, log_channel_id, current_status in cursor:
+                    self.configs.setdefault(gid, []).append(
+                        VanityConfig(vanity, role_id, log_channel_id, current_status == "active")
+                    )
+
+    def forget(self, guild_id: int):
+        self.configs.pop(guild_id, None)
+        for key in [key for key in self.qualifying if key[0] == guild_id]:
+            del self.qualifying[key]
+
+    async def _set_active(self, guild: discord.Guild, config: VanityConfig, active: bool):
+        if config.active == active:
+            return
+        config.active = active
+        async with storage.connect(self.db_path) as db:
+            await db.execute(
+                "UPDATE vanity_roles SET current_status = ? WHERE guild_id = ? AND vanity = ?",
+                ("active" if active else None, guild.id, config.vanity)
+            )
+            await db.commit()
+        channel = guild.get_channel(config.log_channel_id)
+        if channel:
+            state = "✅ Vanity `{}` is now **active**." if active else "❌ Vanity `{}` is now **inactive**."
+            try:
+                await channel.send(state.format(config.vanity))
+            except discord.HTTPException:
+                pass
+
+    async def refresh(self, guild: discord.Guild):
+        """Rebuild the qualifying sets of ``guild`` and queue every role edit needed to match them."""
+        configs = self.configs.get(guild.id)
+        if not configs:
+            return
+        # a partial member list would look like everyone dropped the vanity
+        if not await self.bot.cache_policy.ensure_chunked(guild, presences=True):
+            return
+        statuses = {member.id: custom_status(member) for member in guild.members if not member.bot}
+        for config in configs:
+            members = {member_id for member_id, status in statuses.items() if config.vanity in status}
+            self.qualifying[(guild.id, config.vanity)] = members
+            active = await self.invites.valid(config.vanity, guild)
+            await self._set_active(guild, config, active)
+            role = guild.get_role(config.role_id)
+            if role is None:
+                continue
+            wanted = members if active else set()
+            holders = {member.id for member in role.members}
+            for member_id in wanted - holders:
+                self.queue.put(guild, member_id, role.id, True, f"Vanity {config.vanity} in status")
+            for member_id in holders - wanted:
+                self.queue.put(guild, member_id, role.id, False, f"Vanity {config.vanity} not in status")
+
+    async def on_presence_update(self, before: discord.Member, after: discord.Member):
+        configs = self.configs.get(after.guild.id)
+        if not configs or after.bot:
+            return
+        old, new = custom_status(before), custom_status(after)
+        if old == new:
+            return
+        for config in configs:
+            had, has = config.vanity in old, config.vanity in new
+            if had == has:
+                continue
+            members = self.qualifying.setdefault((after.guild.id, config.vanity), set())
+            if has:
+                members.add(after.id)
+            else:
+                members.discard(after.id)
+            active = await self.invites.valid(config.vanity, after.guild)
+            if active != config.active:
+                # the invite itself changed state: every holder is affected, not just this member
+                await self.refresh(after.guild)
+                return
+            if active or not has:
+                reason = f"Vanity {config.vanity} {'in' if has else 'not in'} status"
+                self.queue.put(after.guild, after.id, config.role_id, has, reason)
+
+    async def on_guild_update(self, before: discord.Guild, after: discord.Guild):
+        if before.vanity_url_code == after.vanity_url_code or after.id not in self.configs:
+            return
+        self.invites.invalidate(before.vanity_url_code)
+        self.invites.invalidate(after.vanity_url_code)
+        for config in self.configs[after.id]:
+            self.invites.invalidate(config.vanity)
+        await self.refresh(after)
+
+    def on_member_remove(self, member: discord.Member):
+        for config in self.configs.get(member.guild.id, ()):
+            self.qualifying.get((member.guild.id, config.vanity), set()).discard(member.id)
+
+    async def _log_applied(self, member: discord.Member, role: discord.Role, add: bool):
+        config = next((c for c in self.configs.get(member.guild.id, ()) if c.role_id == role.id), None)
+        channel = member.guild.get_channel(config.log_channel_id) if config else None
+        if channel is None:
+            return
+        if add:
+            text = f"✅ {member.mention} has `{config.vanity}` in their status, gave them {role.mention}."
+        else:
+            text = f"❌ {member.mention} no longer has `{config.vanity}` in their status, removed {role.mention}."
+        try:
+            await channel.send(text, allowed_mentions=discord.AllowedMentions.none())
+        except discord.HTTPException:
+            pass
+
+    def close(self):
+        self.queue.close()
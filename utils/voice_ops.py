@@ -0,0 +1,99 @@
+import asyncio
+import time
+from typing import Iterable, List, Tuple
+
+import discord
+
+_MISSING = object()
+
+
+class VoiceBulkResult:
+    __slots__ = ("changed", "skipped", "failed", "started")
+
+    def __init__(self):
+        self.changed = 0
+        self.skipped = 0
+        self.failed: List[Tuple[discord.Member, str]] = []
+        self.started = time.perf_counter()
+
+    @property
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.started
+
+    def details(self) -> str:
+        parts = []
+        if self.skipped:
+            parts.append(f"skipped {self.skipped} already done")
+        if self.failed:
+            parts.append(f"failed on {len(self.failed)}")
+        parts.append(f"took {self.elapsed:.1f}s")
+        return ", ".join(parts).capitalize() + "."
+
+
+def voice_members(guild: discord.Guild) -> List[discord.Member]:
+    """Every cached member connected to a voice or stage channel of ``guild``."""
+    members = []
+    for channel in guild.voice_channels + guild.stage_channels:
+        members.extend(channel.members)
+    return members
+
+
+class VoiceBulkOps:
+    """Applies one voice edit (mute, deafen or move) to many members.
+
+    Members whose voice state already matches are skipped without a request,
+    as are members who left voice in the meantime. Edits run concurrently but
+    bounded: they all share the guild's member-edit bucket, so more than its
+    budget in flight would only queue inside the HTTP client.
+    """
+
+    def __init__(self, concurrency: int = 10):
+        self.concurrency = concurrency
+
+    @staticmethod
+    def _done(member: discord.Member, mute, deafen, channel) -> bool:
+        voice = member.voice
+        if voice is None or voice.channel is None:
+            # nobody to mute or move; disconnecting them is already done too
+            return True
+        if mute is not _MISSING and voice.mute != mute:
+            return False
+        if deafen is not _MISSING and voice.deaf != deafen:
+            return False
+        # for a disconnect (channel None) anyone still connected differs
+        if channel is not _MISSING and voice.channel != channel:
+            return False
+        return True
+
+    async def edit(self, members: Iterable[discord.Member], *, reason: str,
+                   mute=_MISSING, deafen=_MISSING, voice_channel=_MISSING) -> VoiceBulkResult:
+        result = VoiceBulkResult()
+        changes = {
+            key: value for key, value in
+            (("mute", mute), ("deafen", deafen), ("voice_channel", voice_channel))
+            if value is not _MISSING
+        }
+        plan = []
+        seen = set()
+        for member in members:
+            if member.id in seen:
+                continue
+            seen.add(member.id)
+            if self._done(member, mute, deafen, voice_channel):
+                result.skipped += 1
+            else:
+                plan.append(member)
+
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def apply(member: discord.Member):
+            async with semaphore:
+                try:
+                    await member.edit(reason=reason, **changes)
+                except discord.HTTPException as e:
+                    result.failed.append((member, e.text or type(e).__name__))
+                else:
+                    result.changed += 1
+
+        await asyncio.gather(*(apply(member) for member in plan))
+        return result